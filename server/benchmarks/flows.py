@@ -0,0 +1,117 @@
+"""Generated flows for the benchmarks."""
+import random
+from typing import Any, Optional
+
+from src.app.models.flow_model import Flow
+from src.app.models.node_model import AnyNode
+
+
+def node(node_id: str, node_type: str, parent: Optional[str], is_false_case: Optional[bool],
+         metadata: dict[str, Any]) -> dict[str, Any]:
+    return {
+        'nodeId': node_id,
+        'nodeName': node_id,
+        'nodePositionX': 0.0,
+        'nodePositionY': 0.0,
+        'parentNodeId': parent,
+        'isFalseCase': is_false_case,
+        'nodeType': node_type,
+        'metadata': metadata,
+    }
+
+
+def validate(nodes: list[dict[str, Any]]) -> list[AnyNode]:
+    return Flow.model_validate({
+        'flowName': 'benchmark',
+        'flowDescription': '.',
+        'ownerId': '69013d2567e845d84dd9a2d1',
+        'nodes': nodes,
+    }).nodes
+
+
+def balanced(node_count: int) -> list[AnyNode]:
+    """
+    A balanced tree of `x > k` splits with about `node_count` nodes, every
+    branch of it reachable.
+    """
+    inputs = [{'displayName': 'x', 'type': 'number', 'required': True}]
+    nodes = [node('start', 'START', None, None, {'inputs': inputs})]
+
+    def split(low: int, high: int, parent: str, is_false_case: Optional[bool]) -> None:
+        if low > high:
+            nodes.append(node(f'e{len(nodes)}', 'END', parent, is_false_case, {'response': 'r'}))
+            return
+
+        middle = (low + high) // 2
+        node_id = f'c{middle}'
+        nodes.append(node(node_id, 'CONDITIONAL', parent, is_false_case, {'expression': f'x > {middle}'}))
+        split(middle + 1, high, node_id, False)
+        split(low, middle - 1, node_id, True)
+
+    split(1, (node_count - 2) // 2, 'start', None)
+    return validate(nodes)
+
+
+def wide_and(width: int, levels: int, seed: int) -> list[AnyNode]:
+    """
+    A chain of `levels` conditions, each an AND of `width` random bounds
+    over six number inputs, many of them implied by the levels above.
+    """
+    rng = random.Random(seed)
+    names = [f'x{i}' for i in range(6)]
+    inputs = [{'displayName': name, 'type': 'number', 'required': True} for name in names]
+    nodes = [node('start', 'START', None, None, {'inputs': inputs})]
+    parent, is_false_case = 'start', None
+
+    for level in range(levels):
+        conjuncts = []
+        for _ in range(width):
+            name, r = rng.choice(names), rng.random()
+            if r < 0.5:
+                conjuncts.append(f'{name} > {rng.randint(-20, level)}')
+            elif r < 0.8:
+                conjuncts.append(f'{name} + {rng.choice(names)} < {rng.randint(100, 200)}')
+            else:
+                conjuncts.append(f'{name} != {rng.randint(300, 400)}')
+
+        node_id = f'c{level}'
+        nodes.append(node(node_id, 'CONDITIONAL', parent, is_false_case,
+                          {'expression': ' and '.join(conjuncts)}))
+        nodes.append(node(f'e{level}', 'END', node_id, True, {'response': f'r{level}'}))
+        parent, is_false_case = node_id, False
+
+    nodes.append(node('last', 'END', parent, is_false_case, {'response': 'last'}))
+    return validate(nodes)
+
+
+def decision_chain(depth: int, kinds: tuple[str, ...] = ()) -> list[AnyNode]:
+    """
+    A chain of `depth` conditions over 40 bool inputs, each false branch
+    ending the flow. `kinds` adds nonlinear conditions over number inputs
+    ('number') and string built-ins over a text input ('text').
+    """
+    rng = random.Random(depth)
+    inputs = [{'displayName': f'b{i}', 'type': 'bool', 'required': True} for i in range(40)]
+    if 'number' in kinds:
+        inputs += [{'displayName': f'x{i}', 'type': 'number', 'required': True} for i in range(3)]
+    if 'text' in kinds:
+        inputs.append({'displayName': 's', 'type': 'text', 'required': True})
+
+    nodes = [node('start', 'START', None, None, {'inputs': inputs})]
+    parent, is_false_case = 'start', None
+
+    for i in range(depth):
+        a, b, c = rng.sample(range(40), 3)
+        expressions = [f'b{a} and not b{b} or b{c}', f'(b{a} or b{b}) and not (b{c} and b{a})']
+        if 'number' in kinds:
+            expressions.append(f'x{a % 3} * x{b % 3} > {i % 11} - x{c % 3}')
+        if 'text' in kinds:
+            expressions.append(f'contains(s, "{chr(97 + i % 5)}") or length(s) > {i % 9}')
+
+        nodes.append(node(f'c{i}', 'CONDITIONAL', parent, is_false_case,
+                          {'expression': expressions[i % len(expressions)]}))
+        nodes.append(node(f'e{i}', 'END', f'c{i}', True, {'response': f'r{i}'}))
+        parent, is_false_case = f'c{i}', False
+
+    nodes.append(node('last', 'END', parent, is_false_case, {'response': 'last'}))
+    return validate(nodes)
@@ -0,0 +1,86 @@
+"""
+Parse throughput and parser construction/import time of the expression
+parser: the LALR tables shipped in `lalr_tables.py` against the Earley
+parser built from `grammar.lark` at import before them.
+
+Run from the server directory:
+
+    python -m benchmarks.parse_benchmark
+"""
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+from lark import Lark
+
+from src.app.evaluators.parser import get_parser
+from src.app.evaluators.parser.ebnf_parser import load_parser, read_grammar
+
+
+DOCS = Path(__file__).resolve().parents[2] / 'docs' / 'verifcation_tests'
+
+SYNTHETIC = [
+    'if x > 10 then y * 2 + z / 3 >= 5 else not (b or y = null)',
+    'contains(name, "abc") and length(name) > 2 or x in [1, 2, 3]',
+    ' + '.join(f'x{i} * {i}' for i in range(20)) + ' < 1000',
+]
+
+
+def expressions() -> list[str]:
+    found = set()
+    for path in sorted(DOCS.glob('*/flow.json')):
+        for node in json.loads(path.read_text(encoding='utf-8'))['nodes']:
+            expression = (node.get('metadata') or {}).get('expression')
+            if expression:
+                found.add(expression)
+
+    return sorted(found) + SYNTHETIC
+
+
+def best_of(fn: Callable[[], object], repeat: int = 5) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def parse_rate(parser: Lark, exprs: list[str], rounds: int) -> float:
+    def parse_all() -> None:
+        for _ in range(rounds):
+            for expression in exprs:
+                parser.parse(expression)
+
+    return rounds * len(exprs) / best_of(parse_all, 3)
+
+
+def import_seconds(runs: int = 7) -> float:
+    # a fresh interpreter each time, with lark already imported
+    code = ('import time, lark; t = time.perf_counter(); '
+            'import src.app.evaluators.parser; print(time.perf_counter() - t)')
+    times = [float(subprocess.run([sys.executable, '-c', code], check=True, text=True,
+                                  capture_output=True).stdout) for _ in range(runs)]
+    return statistics.median(times)
+
+
+def main() -> None:
+    grammar = read_grammar()
+    exprs = expressions()
+    earley = Lark(grammar)
+    lalr = get_parser()
+
+    print(f'{len(exprs)} expressions')
+    print(f'parse   earley {parse_rate(earley, exprs, 3):10.0f}/s   '
+          f'lalr tables {parse_rate(lalr, exprs, 300):10.0f}/s')
+    print(f'build   earley {best_of(lambda: Lark(grammar)) * 1e3:9.1f}ms   '
+          f'lalr tables {best_of(load_parser) * 1e3:9.1f}ms')
+    print(f'import  parser package {import_seconds() * 1e3:.1f}ms (after lark)')
+
+
+if __name__ == '__main__':
+    main()
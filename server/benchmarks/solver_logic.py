@@ -0,0 +1,70 @@
+"""
+Symbolic execution with the Z3 logic picked for each flow against Z3's
+default solver, on the flows of docs/verifcation_tests and on generated
+bool, nonlinear, text and numeric flows.
+
+Run from the server directory:
+
+    python -m benchmarks.solver_logic
+"""
+import json
+import time
+from pathlib import Path
+
+from src.app.core.config import get_settings
+from src.app.models.flow_model import Flow
+from src.app.models.node_model import AnyNode
+from src.app.evaluators.executors import SymbolicExecutor
+
+from benchmarks.flows import balanced, decision_chain
+
+
+DOCS = Path(__file__).resolve().parents[2] / 'docs' / 'verifcation_tests'
+
+# the verification flows are small, each is run this many times
+DOC_ROUNDS = 20
+
+
+def flows() -> list[tuple[str, list[AnyNode], int]]:
+    found = [
+        ('bool chain, 400 conditions', decision_chain(400), 1),
+        ('nonlinear chain, 150', decision_chain(150, ('number',)), 1),
+        ('text chain, 20', decision_chain(20, ('text',)), 1),
+        ('numeric tree, 2000 nodes', balanced(2000), 1),
+    ]
+    for path in sorted(DOCS.glob('*/flow.json')):
+        flow = Flow.model_validate(json.loads(path.read_text(encoding='utf-8')))
+        found.append((f'docs/{path.parent.name} x{DOC_ROUNDS}', flow.nodes, DOC_ROUNDS))
+
+    return found
+
+
+def run(nodes: list[AnyNode], rounds: int, select_logic: bool) -> tuple[float, str]:
+    get_settings().SYMBOLIC_SELECT_LOGIC = select_logic
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        SymbolicExecutor(nodes).execute()
+    seconds = time.perf_counter() - start
+
+    return seconds, SymbolicExecutor(nodes).logic or 'default'
+
+
+def main() -> None:
+    selected = get_settings().SYMBOLIC_SELECT_LOGIC
+    print(f'{"flow":28} {"logic":8} {"default":>8} {"selected":>9}')
+
+    try:
+        for name, nodes, rounds in flows():
+            # picking the logic parses every condition into the shared
+            # expression cache, so neither run pays for parsing
+            run(nodes, 0, select_logic=True)
+            default, _ = run(nodes, rounds, select_logic=False)
+            chosen, logic = run(nodes, rounds, select_logic=True)
+            print(f'{name:28} {logic:8} {default:7.2f}s {chosen:8.2f}s', flush=True)
+    finally:
+        get_settings().SYMBOLIC_SELECT_LOGIC = selected
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""
+Symbolic execution of generated flows of growing size, with the time
+spent looking up children apart from the rest.
+
+Run from the server directory:
+
+    python -m benchmarks.symbolic_scaling [node counts...]
+"""
+import sys
+import time
+
+from src.app.evaluators.executors import SymbolicExecutor
+
+from benchmarks.flows import balanced
+
+
+def main() -> None:
+    for node_count in map(int, sys.argv[1:] or ['1000', '10000']):
+        nodes = balanced(node_count)
+        executor = SymbolicExecutor(nodes)
+
+        lookups = {'count': 0, 'seconds': 0.0}
+        get_children = executor._get_children
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            children = get_children(*args, **kwargs)
+            lookups['count'] += 1
+            lookups['seconds'] += time.perf_counter() - start
+            return children
+
+        executor._get_children = timed  # type: ignore[method-assign]
+
+        start = time.perf_counter()
+        report = executor.execute()
+        seconds = time.perf_counter() - start
+
+        print(f'{len(nodes):6} nodes   execute {seconds:7.2f}s   '
+              f'{lookups["count"]} child lookups {lookups["seconds"]:6.2f}s   '
+              f'{len(report.cases)} cases', flush=True)
+
+
+if __name__ == '__main__':
+    main()
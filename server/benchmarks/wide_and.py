@@ -0,0 +1,45 @@
+"""
+Time spent in `_simplify_with_context` on chains of wide ANDs, with no
+path constraints and on a path, and the conjuncts it removes.
+
+Run from the server directory:
+
+    python -m benchmarks.wide_and [widths...]
+"""
+import sys
+import time
+
+from src.app.evaluators.executors import SymbolicExecutor
+
+from benchmarks.flows import wide_and
+
+
+LEVELS = 15
+
+
+def main() -> None:
+    print('width   no path   on a path   queries   removed')
+
+    for width in map(int, sys.argv[1:] or ['20', '35', '50']):
+        executor = SymbolicExecutor(wide_and(width, LEVELS, seed=width))
+
+        # seconds without and with path constraints
+        spent = [0.0, 0.0]
+        simplify_with_context = executor._simplify_with_context
+
+        def timed(expr, base):
+            start = time.perf_counter()
+            simplified = simplify_with_context(expr, base)
+            spent[any(c is not None for c in base)] += time.perf_counter() - start
+            return simplified
+
+        executor._simplify_with_context = timed  # type: ignore[method-assign]
+        report = executor.execute()
+
+        removed = sum(len(reduction.removedParts) for reduction in report.reductions)
+        print(f'{width:5}   {spent[0] * 1e3:5.0f}ms   {spent[1] * 1e3:7.0f}ms   '
+              f'{report.metadata.solverQueries:7}   {removed:7}', flush=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,5 @@
 from .rate_limiter import get_limiter
+from .batch import get_batch_payloads
 from .service import get_flow_service, get_user_service
 from .auth import is_admin, get_current_user, get_authorized_user
 
@@ -7,6 +8,7 @@ __all__ = [
     'is_admin',
     'get_limiter',
     'get_flow_service',
+    'get_batch_payloads',
     'get_user_service',
     'get_current_user',
     'get_authorized_user',
@@ -0,0 +1,81 @@
+import json
+from typing import Any, AsyncIterator
+from fastapi import Request
+
+from src.app.core.config import get_settings
+from src.app.core.exceptions import InvalidPayloadException, PayloadTooLargeException
+
+
+settings = get_settings()
+
+NDJSON_MEDIA_TYPES = ('application/x-ndjson', 'application/ndjson')
+
+
+async def _read_chunks(request: Request) -> AsyncIterator[bytes]:
+    """The body as it arrives, cut off once it goes over the byte limit."""
+    size = 0
+
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > settings.EVALUATE_BATCH_MAX_BYTES:
+            raise PayloadTooLargeException(
+                f'body is larger than the limit of {settings.EVALUATE_BATCH_MAX_BYTES} bytes')
+        yield chunk
+
+
+async def _read_ndjson(request: Request) -> list[Any]:
+    payloads: list[Any] = []
+    line_number = 0
+
+    def read_line(line: bytes) -> None:
+        nonlocal line_number
+        line_number += 1
+
+        if not line.strip():
+            return
+
+        # stop at the first record over the limit, the rest is never parsed
+        if len(payloads) == settings.EVALUATE_BATCH_MAX_SIZE:
+            raise PayloadTooLargeException(
+                f'batch has more than {settings.EVALUATE_BATCH_MAX_SIZE} items, '
+                f'the limit is {settings.EVALUATE_BATCH_MAX_SIZE}')
+
+        try:
+            payloads.append(json.loads(line))
+        except ValueError as e:
+            raise InvalidPayloadException(
+                f'line {line_number} is not valid JSON: {e}')
+
+    pending = b''
+    async for chunk in _read_chunks(request):
+        *lines, pending = (pending + chunk).split(b'\n')
+        for line in lines:
+            read_line(line)
+    read_line(pending)
+
+    return payloads
+
+
+async def get_batch_payloads(request: Request) -> list[Any]:
+    # a declared size over the limit is refused before reading anything
+    content_length = request.headers.get('content-length', '')
+    if content_length.isdigit() and int(content_length) > settings.EVALUATE_BATCH_MAX_BYTES:
+        raise PayloadTooLargeException(
+            f'body has {content_length} bytes, the limit is {settings.EVALUATE_BATCH_MAX_BYTES}')
+
+    content_type = request.headers.get('content-type', '')
+
+    if content_type.split(';')[0].strip() in NDJSON_MEDIA_TYPES:
+        return await _read_ndjson(request)
+
+    body = b''.join([chunk async for chunk in _read_chunks(request)])
+
+    try:
+        payloads = json.loads(body)
+    except ValueError as e:
+        raise InvalidPayloadException(f'body is not valid JSON: {e}')
+
+    if not isinstance(payloads, list):
+        raise InvalidPayloadException('body must be a JSON array of payloads')
+
+    return payloads
@@ -1,8 +1,8 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Union
 from pydantic import BaseModel, RootModel, Field
 
 from src.app.models.flow_model import Flow, AnyNode
-from src.app.models.symbolic_model import SymbolicReport
+from src.app.models.symbolic_model import SymbolicJob, SymbolicReport
 
 
 class CreateFlowInDTO(BaseModel):
@@ -40,5 +40,17 @@ class EvaluateFlowResponseDTO(BaseModel):
     response: Any
 
 
+class EvaluateFlowErrorDTO(BaseModel):
+    error: Any
+
+
+class EvaluateFlowBatchResponseDTO(BaseModel):
+    results: List[Union[EvaluateFlowResponseDTO, EvaluateFlowErrorDTO]]
+
+
 class TestFlowResponseDTO(SymbolicReport):
     pass
+
+
+class TestJobOutDTO(SymbolicJob):
+    pass
@@ -1,12 +1,16 @@
-from fastapi import APIRouter, Request, Depends, status
+from typing import Any
+from fastapi import APIRouter, Request, Response, Depends, status
+from fastapi.responses import StreamingResponse
 
 from src.api.dtos import flow_dtos
+from src.utils.sse import sse_stream
 from src.app.services import FlowService, UserService
 from src.app.models.user_model import User
 from src.api.dependencies import (
     get_limiter,
     get_flow_service,
     get_user_service,
+    get_batch_payloads,
     get_current_user,
     get_authorized_user,
 )
@@ -116,6 +120,34 @@ async def evaluate_flow(id: str,
     )
 
 
+@router.post(
+    '/{id}/evaluate:batch',
+    dependencies=[Depends(get_authorized_user)],
+    response_model=flow_dtos.EvaluateFlowBatchResponseDTO,
+    openapi_extra={
+        'requestBody': {
+            'required': True,
+            'content': {
+                'application/json': {
+                    'schema': {'type': 'array', 'items': {'type': 'object'}}
+                },
+                'application/x-ndjson': {
+                    'schema': {'type': 'string'}
+                },
+            },
+        },
+    },
+)
+async def evaluate_flow_batch(id: str,
+                              payloads: list[Any] = Depends(get_batch_payloads),
+                              service: FlowService = Depends(get_flow_service)):
+    results = await service.evaluate_flow_batch(
+        id=id,
+        payloads=payloads
+    )
+    return {'results': results}
+
+
 @router.get(
     '/{id}/test',
     dependencies=[Depends(get_authorized_user)],
@@ -123,6 +155,64 @@ async def evaluate_flow(id: str,
 )
 @limiter.limit('10/minute')
 async def symbolic_evaluate_flow(request: Request,
+                                 response: Response,
                                  id: str,
                                  service: FlowService = Depends(get_flow_service)):
+    etag = await service.get_symbolic_report_etag(id=id)
+
+    tags = {tag.strip() for tag in request.headers.get('if-none-match', '').split(',')}
+    # `*` matches only when a report for this version was computed (RFC 9110)
+    if ((etag in tags or '*' in tags)
+            and await service.record_not_modified_test(id=id, any_report=etag not in tags)):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={'ETag': etag}
+        )
+
+    response.headers['ETag'] = etag
     return await service.symbolic_evaluate_flow(id=id)
+
+
+@router.get(
+    '/{id}/test/stream',
+    dependencies=[Depends(get_authorized_user)],
+    response_class=StreamingResponse,
+)
+@limiter.limit('10/minute')
+async def stream_symbolic_evaluation(request: Request,
+                                     id: str,
+                                     service: FlowService = Depends(get_flow_service)):
+    events = await service.stream_symbolic_evaluation(id=id)
+
+    return StreamingResponse(
+        sse_stream(events),
+        media_type='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
+@router.post(
+    '/{id}/test-jobs',
+    status_code=status.HTTP_202_ACCEPTED,
+    dependencies=[Depends(get_authorized_user)],
+    response_model=flow_dtos.TestJobOutDTO,
+)
+@limiter.limit('10/minute')
+async def submit_test_job(request: Request,
+                          response: Response,
+                          id: str,
+                          service: FlowService = Depends(get_flow_service)):
+    job = await service.submit_symbolic_job(id=id)
+
+    response.headers['Location'] = f'{request.url.path}/{job.id}'
+    return job
+
+
+@router.get(
+    '/{id}/test-jobs/{job_id}',
+    dependencies=[Depends(get_authorized_user)],
+    response_model=flow_dtos.TestJobOutDTO,
+)
+async def get_test_job(id: str, job_id: str,
+                       service: FlowService = Depends(get_flow_service)):
+    return await service.get_symbolic_job(id=id, job_id=job_id)
@@ -16,6 +16,28 @@ class Settings(BaseSettings):
     Z3_SOLVER_TIMEOUT_MILLISECONDS: int = 2000
     TEST_ENDPOINT_RATE_LIMIT: str = '10/minute'
     TESTER_MAX_FLOWS: int = 10
+    EXPRESSION_CACHE_MAX_SIZE: int = 2048
+    FLOW_PLAN_CACHE_MAX_SIZE: int = 256
+    EVALUATE_BATCH_MAX_SIZE: int = 1000
+    EVALUATE_BATCH_MAX_BYTES: int = 4 * 1024 * 1024
+    EVALUATE_BATCH_THREADPOOL_THRESHOLD: int = 200
+    EVALUATE_BATCH_VECTORIZE_MIN_SIZE: int = 64
+    FLOW_CACHE_MAX_SIZE: int = 512
+    FLOW_CACHE_TTL_SECONDS: float = 30.0
+    SYMBOLIC_QUERY_CACHE_SHARED: bool = True
+    SYMBOLIC_QUERY_CACHE_MAX_FLOWS: int = 64
+    SYMBOLIC_PATH_CACHE_MAX_SIZE: int = 20000
+    SYMBOLIC_POOL_SIZE: int = 2
+    SYMBOLIC_POOL_MAX_TASKS_PER_CHILD: int = 50
+    SYMBOLIC_JOB_DEADLINE_SECONDS: float = 60.0
+    SYMBOLIC_SPLIT_MIN_NODES: int = 400
+    SYMBOLIC_SPLIT_TASKS_PER_WORKER: int = 4
+    SYMBOLIC_JOB_TTL_SECONDS: int = 3600
+    SYMBOLIC_JOB_STALE_SECONDS: float = 900.0
+    SYMBOLIC_MINIMIZE_UNSAT_CORES: bool = False
+    SYMBOLIC_INTERVAL_FAST_PATH: bool = True
+    SYMBOLIC_SELECT_LOGIC: bool = True
+    SYMBOLIC_REPLAY_WITNESSES: bool = True
 
     class Config:
         env_file = '.env'
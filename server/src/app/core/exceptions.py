@@ -56,11 +56,21 @@ class InvalidFlowException(AppException):
         super().__init__(status.HTTP_500_INTERNAL_SERVER_ERROR, detail)
 
 
+class FlowValidationException(AppException):
+    def __init__(self, detail):
+        super().__init__(status.HTTP_422_UNPROCESSABLE_ENTITY, detail)
+
+
 class InvalidPayloadException(AppException):
     def __init__(self, detail):
         super().__init__(status.HTTP_422_UNPROCESSABLE_ENTITY, detail)
 
 
+class PayloadTooLargeException(AppException):
+    def __init__(self, detail: str = "Payload too large"):
+        super().__init__(status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail)
+
+
 class RuntimeException(AppException):
     def __init__(self, detail):
         super().__init__(status.HTTP_500_INTERNAL_SERVER_ERROR, detail)
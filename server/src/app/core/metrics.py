@@ -41,3 +41,43 @@ execution_duration_seconds = Histogram(
     "Duração da execução simbólica em segundos",
     buckets=[0.1, 0.2, 0.5, 1, 2, 5, 10, 20, 30, 60]
 )
+report_render_seconds = Histogram(
+    "report_render_seconds",
+    "Tempo em segundos gasto escrevendo as restrições do relatório simbólico em sintaxe ZF",
+    buckets=[0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1, 2, 5, 10]
+)
+
+# Expression Cache Metrics
+expression_cache_hits_total = Counter(
+    "expression_cache_hits_total",
+    "Número total de expressões encontradas já compiladas no cache",
+)
+expression_cache_misses_total = Counter(
+    "expression_cache_misses_total",
+    "Número total de expressões que precisaram ser analisadas pelo parser",
+)
+expression_cache_evictions_total = Counter(
+    "expression_cache_evictions_total",
+    "Número total de expressões removidas do cache por limite de tamanho",
+)
+expression_cache_size = Gauge(
+    "expression_cache_size",
+    "Quantidade de expressões compiladas mantidas no cache",
+)
+
+flow_cache_hits_total = Counter(
+    "flow_cache_hits_total",
+    "Número total de leituras de fluxo atendidas pelo cache em memória",
+)
+flow_cache_misses_total = Counter(
+    "flow_cache_misses_total",
+    "Número total de leituras de fluxo que precisaram carregar o documento do banco",
+)
+flow_cache_hit_ratio = Gauge(
+    "flow_cache_hit_ratio",
+    "Razão de acertos sobre o total de leituras do cache de fluxos",
+)
+flow_cache_size = Gauge(
+    "flow_cache_size",
+    "Quantidade de fluxos mantidos no cache em memória",
+)
@@ -0,0 +1,27 @@
+from .expression_cache import CompiledExpression, ExpressionCache, get_expression_cache
+from .query_cache import EMPTY_CONTEXT, QueryCache, get_query_cache, get_query_cache_for
+from .path_cache import (
+    PathCache,
+    PathRecord,
+    get_path_cache,
+    segment_key,
+    root_path_key,
+    child_path_key,
+)
+
+
+__all__ = [
+    'CompiledExpression',
+    'ExpressionCache',
+    'get_expression_cache',
+    'EMPTY_CONTEXT',
+    'QueryCache',
+    'get_query_cache',
+    'get_query_cache_for',
+    'PathCache',
+    'PathRecord',
+    'get_path_cache',
+    'segment_key',
+    'root_path_key',
+    'child_path_key',
+]
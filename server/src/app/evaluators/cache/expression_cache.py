@@ -0,0 +1,70 @@
+from typing import Any
+from lark import Tree
+
+from src.utils.cache import LRUCache
+from src.app.core.config import get_settings
+from src.app.evaluators.transformers import ConcreteInterpreter
+from src.app.evaluators.parser import get_parser, normalize_expression
+from src.app.core.metrics import (
+    expression_cache_size,
+    expression_cache_hits_total,
+    expression_cache_misses_total,
+    expression_cache_evictions_total,
+)
+
+
+settings = get_settings()
+
+
+class CompiledExpression:
+    __slots__ = ('source', 'tree')
+
+    def __init__(self, source: str, tree: Tree) -> None:
+        self.source = source
+        self.tree = tree
+
+    def __call__(self, env: dict[str, Any]) -> Any:
+        return ConcreteInterpreter(env).visit(self.tree)
+
+
+class ExpressionCache:
+    def __init__(self, maxsize: int) -> None:
+        self._entries: LRUCache[str, CompiledExpression] = LRUCache(
+            maxsize,
+            on_evict=lambda *_: expression_cache_evictions_total.inc()
+        )
+
+    def get(self, expression: str) -> CompiledExpression:
+        source = normalize_expression(expression)
+
+        compiled = self._entries.get(source)
+        if compiled is not None:
+            expression_cache_hits_total.inc()
+            return compiled
+
+        expression_cache_misses_total.inc()
+
+        compiled = CompiledExpression(source, get_parser().parse(source))
+        self._entries.set(source, compiled)
+        expression_cache_size.set(len(self._entries))
+
+        return compiled
+
+    def put(self, expression: str, tree: Tree) -> None:
+        """Adds an already parsed expression, e.g. one stored with its flow."""
+        source = normalize_expression(expression)
+
+        if source not in self._entries:
+            self._entries.set(source, CompiledExpression(source, tree))
+            expression_cache_size.set(len(self._entries))
+
+    def clear(self) -> None:
+        self._entries.clear()
+        expression_cache_size.set(0)
+
+
+expression_cache = ExpressionCache(settings.EXPRESSION_CACHE_MAX_SIZE)
+
+
+def get_expression_cache() -> ExpressionCache:
+    return expression_cache
@@ -0,0 +1,99 @@
+import json
+import hashlib
+from typing import Any, Optional
+from z3 import ExprRef  # type: ignore
+
+from src.utils.cache import LRUCache
+from src.app.core.config import get_settings
+from src.app.models.node_model import StartNode
+from src.app.models.symbolic_model import (
+    CaseResult,
+    PrunedBranch,
+    UncoveredPath,
+    ReductionInfo,
+)
+
+
+settings = get_settings()
+
+
+def _digest(*parts: Any) -> str:
+    content = json.dumps(parts, sort_keys=True, separators=(',', ':'), default=str)
+
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def root_path_key(start_node: StartNode) -> str:
+    """Path key of the START children: only the input types are known."""
+    return _digest(start_node.metadata.model_dump(mode='json'))
+
+
+def child_path_key(parent_key: str, expression: str, is_false_case: bool) -> str:
+    """Path key below the branch `is_false_case` of a normalized expression."""
+    return _digest(parent_key, expression, is_false_case)
+
+
+def segment_key(path_key: str, content_hash: str) -> str:
+    """Key of a node (by its node hash) or subtree (by its subtree hash)."""
+    return _digest(path_key, content_hash)
+
+
+class PathRecord:
+    """
+    What exploring one node added to the report and the constraint each
+    reachable branch adds to the path (None when it adds nothing), plus
+    the records of the children explored below it, in the order they were
+    explored. The whole subtree is replayed by walking the records.
+    """
+    __slots__ = ('reductions', 'pruned', 'uncovered', 'cases', 'case_exprs',
+                 'texts', 'branches', 'children', 'size')
+
+    def __init__(self) -> None:
+        self.reductions: list[ReductionInfo] = []
+        self.pruned: list[PrunedBranch] = []
+        self.uncovered: list[UncoveredPath] = []
+        self.cases: list[CaseResult] = []
+        self.case_exprs: list[list[Any]] = []
+        # writes to the ZF text map, which later texts depend on
+        self.texts: list[tuple[ExprRef, str]] = []
+        # (is_false_case, ids of the children to explore, added constraint)
+        self.branches: list[tuple[bool, list[str], Optional[ExprRef]]] = []
+        self.children: list['PathRecord'] = []
+        # explored nodes in the subtree, this one included
+        self.size = 1
+
+
+class PathCache:
+    """
+    Explored nodes and subtrees by `segment_key`. What a node adds to the
+    report only depends on the constraints along its path, identified by
+    the path key (START inputs, then the expression and branch of every
+    ancestor), and on the node and its direct children (node hash); a
+    whole subtree on the path key and its Merkle hash.
+
+    After an edit, unchanged subtrees are replayed, the ancestors of the
+    edited node reuse their own results and only the edited node and its
+    descendants, whose path keys changed, are solved again.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._records: LRUCache[str, PathRecord] = LRUCache(maxsize)
+
+    def get(self, key: str) -> Optional[PathRecord]:
+        return self._records.get(key)
+
+    def set(self, key: str, record: PathRecord) -> None:
+        self._records.set(key, record)
+
+    def clear(self) -> None:
+        self._records.clear()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+
+path_cache = PathCache(settings.SYMBOLIC_PATH_CACHE_MAX_SIZE)
+
+
+def get_path_cache() -> PathCache:
+    return path_cache
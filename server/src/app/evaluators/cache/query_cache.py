@@ -0,0 +1,103 @@
+from itertools import count
+from typing import Any, Hashable, Optional
+from z3 import simplify, unknown, ExprRef, CheckSatResult  # type: ignore
+
+from src.utils.cache import LRUCache
+from src.app.models.flow_model import Flow
+from src.app.core.config import get_settings
+from src.app.evaluators.plan import flow_version
+
+
+settings = get_settings()
+
+EMPTY_CONTEXT = 0
+
+
+class QueryCache:
+    """
+    Memoized solver answers of the symbolic executor.
+
+    Formulas are identified by the AST id of their simplified form: Z3
+    hash-conses ASTs, so structurally equal formulas share an id for as
+    long as one of them is alive. Every formula used in a key is kept
+    alive by the cache, which makes ids stable across runs of the same
+    flow and prevents them from being reused by other formulas.
+
+    Contexts (the constraints asserted along a path) are interned one
+    constraint at a time: `context(parent, constraint)` returns the id of
+    `parent` extended with `constraint`, `EMPTY_CONTEXT` being the root.
+    """
+
+    def __init__(self) -> None:
+        self._canonical: dict[int, tuple[ExprRef, ExprRef]] = {}
+        self._contexts: dict[tuple[int, int], int] = {}
+        self._context_ids = count(EMPTY_CONTEXT + 1)
+        self._results: dict[tuple[int, tuple[int, ...]], CheckSatResult] = {}
+        self._witnesses: dict[int, tuple[CheckSatResult, Optional[dict[str, Any]]]] = {}
+
+    def _id(self, expr: ExprRef) -> int:
+        raw_id = expr.get_id()
+
+        entry = self._canonical.get(raw_id)
+        if entry is None:
+            entry = (expr, simplify(expr))
+            self._canonical[raw_id] = entry
+
+        return entry[1].get_id()
+
+    def context(self, parent: int, constraint: ExprRef) -> int:
+        key = (parent, self._id(constraint))
+
+        context = self._contexts.get(key)
+        if context is None:
+            # setdefault keeps the first id if another run interned it too
+            context = self._contexts.setdefault(key, next(self._context_ids))
+
+        return context
+
+    def _key(self, context: int, assumptions: tuple[ExprRef, ...]) -> Optional[tuple[int, tuple[int, ...]]]:
+        # anything that is not a formula is left for the solver to reject
+        if not all(isinstance(a, ExprRef) for a in assumptions):
+            return None
+
+        return context, tuple(sorted(self._id(a) for a in assumptions))
+
+    def get(self, context: int, assumptions: tuple[ExprRef, ...]) -> Optional[CheckSatResult]:
+        key = self._key(context, assumptions)
+
+        return self._results.get(key) if key is not None else None
+
+    def set(self, context: int, assumptions: tuple[ExprRef, ...], result: CheckSatResult) -> None:
+        key = self._key(context, assumptions)
+
+        if key is not None and result != unknown:
+            self._results[key] = result
+
+    def get_witness(self, context: int) -> Optional[tuple[CheckSatResult, Optional[dict[str, Any]]]]:
+        return self._witnesses.get(context)
+
+    def set_witness(self, context: int, result: CheckSatResult,
+                    concrete: Optional[dict[str, Any]]) -> None:
+        if result != unknown:
+            self._witnesses[context] = (result, concrete)
+
+    def __len__(self) -> int:
+        return len(self._results) + len(self._witnesses)
+
+
+query_caches: LRUCache[tuple, QueryCache] = LRUCache(
+    settings.SYMBOLIC_QUERY_CACHE_MAX_FLOWS)
+
+
+def get_query_cache(flow: Flow) -> QueryCache:
+    return get_query_cache_for(flow_version(flow))
+
+
+def get_query_cache_for(key: Hashable) -> QueryCache:
+    """Query cache of the flow version `key`, for callers without the Flow."""
+    cache = query_caches.get(key)
+    if cache is None:
+        cache = QueryCache()
+        query_caches.set(key, cache)
+
+    return cache
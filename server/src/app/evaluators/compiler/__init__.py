@@ -0,0 +1,11 @@
+from .flow_compiler import CompiledFlow, FlowCompiler, get_compiled_flow
+from .flow_artifact import load_flow_artifact, precompile_flow
+
+
+__all__ = [
+    'CompiledFlow',
+    'FlowCompiler',
+    'get_compiled_flow',
+    'load_flow_artifact',
+    'precompile_flow',
+]
@@ -0,0 +1,80 @@
+from typing import Any
+from lark.exceptions import VisitError
+
+from src.app.models.flow_model import Flow, FlowArtifact
+from src.app.models.node_model import AnyNode, StartNode
+from src.app.evaluators.cache import get_expression_cache
+from src.app.evaluators.plan import FlowPlan, content_hash
+from src.app.evaluators.transformers import TypeCheckTransformer
+from src.app.evaluators.parser import dump_tree, load_tree, normalize_expression
+from src.app.core.exceptions import FlowValidationException, InvalidFlowException
+
+
+def _type_checker(nodes: list[AnyNode]) -> TypeCheckTransformer | None:
+    starts = [node for node in nodes if isinstance(node, StartNode)]
+
+    if len(starts) != 1:
+        return None
+
+    return TypeCheckTransformer({
+        i.displayName: i.type.value for i in starts[0].metadata.inputs
+    })
+
+
+def precompile_flow(nodes: list[AnyNode]) -> FlowArtifact:
+    """
+    Parses and type-checks every CONDITIONAL expression against the START
+    inputs and builds the flow plan, raising FlowValidationException with
+    every problem found. Blank expressions are drafts from the editor and
+    are left for evaluation to report.
+    """
+    errors: list[dict[str, Any]] = []
+    checker = _type_checker(nodes)
+
+    if any(node.nodeType == 'START' for node in nodes):
+        try:
+            FlowPlan(nodes)
+        except InvalidFlowException as e:
+            errors.append({'nodeId': None, 'error': e.detail})
+
+    expressions: dict[str, Any] = {}
+
+    for node in nodes:
+        if node.nodeType != 'CONDITIONAL':
+            continue
+
+        expression = node.metadata.expression
+        if not normalize_expression(expression):
+            continue
+
+        try:
+            tree = get_expression_cache().get(expression).tree
+            if checker is not None:
+                checker.transform(tree)
+        except VisitError as e:
+            errors.append({'nodeId': node.nodeId, 'expression': expression,
+                           'error': str(e.orig_exc)})
+        except Exception as e:
+            errors.append({'nodeId': node.nodeId, 'expression': expression,
+                           'error': str(e)})
+        else:
+            expressions[node.nodeId] = dump_tree(tree)
+
+    if errors:
+        raise FlowValidationException(errors)
+
+    return FlowArtifact(contentHash=content_hash(nodes), expressions=expressions)
+
+
+def load_flow_artifact(flow: Flow) -> None:
+    """Puts the expressions stored with the flow in the expression cache."""
+    if flow.compiled is None:
+        return
+
+    cache = get_expression_cache()
+
+    for node in flow.nodes:
+        tree = flow.compiled.expressions.get(node.nodeId)
+
+        if tree is not None and node.nodeType == 'CONDITIONAL':
+            cache.put(node.metadata.expression, load_tree(tree))
@@ -0,0 +1,163 @@
+from typing import Any, Callable, Optional
+from lark import Tree
+
+from src.utils.cache import LRUCache
+from src.app.models.flow_model import Flow
+from src.app.core.config import get_settings
+from src.app.models.node_model import AnyNode
+from src.app.evaluators.cache import get_expression_cache
+from src.app.evaluators.executors import ConcreteExecutor
+from src.app.evaluators.plan import FlowPlan, flow_version, get_flow_plan
+from src.app.evaluators.transformers import CodegenTransformer
+from src.app.evaluators.compiler.flow_artifact import load_flow_artifact
+
+
+settings = get_settings()
+
+# Python refuses more than 100 indentation levels, deeper subtrees are
+# emitted as separate functions.
+MAX_NESTING = 40
+
+
+class CompiledFlowFallback(Exception):
+    pass
+
+
+def lookup_name(env: dict, name: str, *rest: str) -> Any:
+    if name not in env:
+        raise NameError(f"Variable '{name}' not found in environment.")
+
+    val = env[name]
+
+    for key in rest:
+        if not isinstance(val, dict):
+            raise TypeError(
+                f"Expected a dict for key access in variable '{name}', got {type(val).__name__}.")
+        if key not in val:
+            raise KeyError(
+                f"Key '{key}' not found in nested environment for variable '{name}'.")
+        val = val[key]
+
+    return val
+
+
+class CompiledFlow:
+    __slots__ = ('plan', 'source', '_fn')
+
+    def __init__(self, plan: FlowPlan, source: str, fn: Optional[Callable[[dict], Any]]) -> None:
+        self.plan = plan
+        self.source = source
+        # None when Python could not compile the source
+        self._fn = fn
+
+    def execute(self, payload: dict[str, Any]) -> Any:
+        if self._fn is None:
+            return ConcreteExecutor(self.plan).execute(payload)
+
+        try:
+            return self._fn(payload)
+        except Exception:
+            # errors are the slow path: the interpreter raises the very same
+            # error (type and message) the flow has always reported
+            return ConcreteExecutor(self.plan).execute(payload)
+
+
+class FlowCompiler:
+    """Turns a flow's node tree into a single generated Python function.
+
+    Every CONDITIONAL becomes an `if` over the inlined expression code and
+    every END a `return` of its (constant) response.
+    """
+
+    def __init__(self, plan: FlowPlan) -> None:
+        self.plan = plan
+        self.namespace: dict[str, Any] = {
+            '_Tree': Tree,
+            '_Fallback': CompiledFlowFallback,
+            CodegenTransformer.LOOKUP: lookup_name,
+        }
+        self.codegen = CodegenTransformer(self.namespace)
+        self.functions: list[list[str]] = []
+
+    def compile(self) -> CompiledFlow:
+        self.functions.clear()
+        self._emit_function('_flow', self.plan.entry)
+
+        source = '\n\n'.join('\n'.join(lines) for lines in self.functions)
+        try:
+            code = compile(source, f'<flow {self.plan.start.nodeId}>', 'exec')
+        except (SyntaxError, RecursionError, MemoryError):
+            # valid expressions can exceed the limits of Python's parser
+            # (e.g. a long chain of + nests 200 parentheses): the flow
+            # then runs on the interpreter, and is cached as such
+            return CompiledFlow(self.plan, source, None)
+
+        exec(code, self.namespace)
+
+        return CompiledFlow(self.plan, source, self.namespace['_flow'])
+
+    def _emit_function(self, name: str, root: Optional[AnyNode]) -> None:
+        lines = [f'def {name}(env):']
+        self.functions.append(lines)
+
+        # items are either a line of code or a node to expand at a depth
+        stack: list[tuple[int, Any]] = [(1, root)]
+
+        while stack:
+            depth, item = stack.pop()
+            pad = '    ' * depth
+
+            if isinstance(item, str):
+                lines.append(pad + item)
+                continue
+
+            node: Optional[AnyNode] = item
+
+            if node is None:
+                lines.append(f'{pad}raise _Fallback()')
+                continue
+
+            if depth > MAX_NESTING:
+                function_name = f'_n{len(self.functions)}'
+                lines.append(f'{pad}return {function_name}(env)')
+                self._emit_function(function_name, node)
+                continue
+
+            match node.nodeType:
+                case 'END':
+                    response = self.codegen._const(node.metadata.response)
+                    lines.append(f'{pad}return {response}')
+
+                case 'CONDITIONAL':
+                    try:
+                        tree = get_expression_cache().get(node.metadata.expression).tree
+                        condition = self.codegen.transform(tree)
+                    except Exception:
+                        lines.append(f'{pad}raise _Fallback()')
+                        continue
+
+                    lines.append(f'{pad}if {condition}:')
+                    stack.append(
+                        (depth + 1, self.plan.next_node(node.nodeId, True)))
+                    stack.append((depth, 'else:'))
+                    stack.append(
+                        (depth + 1, self.plan.next_node(node.nodeId, False)))
+
+                case _:
+                    lines.append(f'{pad}raise _Fallback()')
+
+
+compiled_flows: LRUCache[tuple, CompiledFlow] = LRUCache(
+    settings.FLOW_PLAN_CACHE_MAX_SIZE)
+
+
+def get_compiled_flow(flow: Flow) -> CompiledFlow:
+    key = flow_version(flow)
+
+    compiled = compiled_flows.get(key)
+    if compiled is None:
+        load_flow_artifact(flow)
+        compiled = FlowCompiler(get_flow_plan(flow)).compile()
+        compiled_flows.set(key, compiled)
+
+    return compiled
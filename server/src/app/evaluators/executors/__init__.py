@@ -1,5 +1,16 @@
-from .symbolic_executor import SymbolicExecutor
+from .symbolic_executor import SymbolicExecutor, report_events
 from .concrete_executor import ConcreteExecutor
+from .vectorized_executor import VectorizedExecutor, get_vectorized_executor
+from .symbolic_pool import SymbolicPool, SymbolicWorkerError, get_symbolic_pool
 
 
-__all__ = ['SymbolicExecutor', 'ConcreteExecutor']
+__all__ = [
+    'SymbolicExecutor',
+    'report_events',
+    'ConcreteExecutor',
+    'VectorizedExecutor',
+    'get_vectorized_executor',
+    'SymbolicPool',
+    'SymbolicWorkerError',
+    'get_symbolic_pool',
+]
@@ -1,52 +1,41 @@
 from typing import Any
 
-from src.app.evaluators.parser import get_parser
+from src.app.evaluators.plan import FlowPlan
 from src.app.core.exceptions import InvalidFlowException
-from src.app.evaluators.transformers import ConcreteTransformer
-from src.app.models.node_model import AnyNode, ConditionalNode, EndNode
+from src.app.evaluators.cache import get_expression_cache
+from src.app.models.node_model import ConditionalNode, EndNode
 
 
 class ConcreteExecutor:
-    def __init__(self, nodes: list[AnyNode]) -> None:
-        self.nodes = nodes
+    def __init__(self, plan: FlowPlan) -> None:
+        self.plan = plan
 
     def _evaluate(self, rule: str, payload: dict) -> bool:
-        tree = get_parser().parse(rule)
-        transformer = ConcreteTransformer(payload)
+        return get_expression_cache().get(rule)(payload)
 
-        return transformer.transform(tree)
+    def execute(self, payload: dict[str, Any]) -> Any:
+        current_node = self.plan.entry
 
-    def execute(self, payload: dict[str, Any], start_node_id: str) -> Any:
-        current_node = next(
-            (node for node in self.nodes if node.parentNodeId == start_node_id),
-            None
-        )
-        assert current_node is not None
+        if current_node is None:
+            raise InvalidFlowException(
+                f'Flow is broken, could not find next node from {self.plan.start.nodeId}')
 
         while True:
-            self.nodes.remove(current_node)
-            if len(self.nodes) == 0:
-                raise InvalidFlowException(
-                    'Flow is broken, could not find a response')
-
             match current_node.nodeType:
                 case 'CONDITIONAL':
                     assert isinstance(
                         current_node,
                         ConditionalNode
                     )
-                    assert current_node.parentNodeId is not None
 
                     result = self._evaluate(
-                        current_node.metadata.expression.replace(
-                            "'", '"').strip(),
+                        current_node.metadata.expression,
                         payload
                     )
 
-                    next_node = next(
-                        (node for node in self.nodes if node.parentNodeId == current_node.nodeId
-                         and node.isFalseCase == (not result)),
-                        None
+                    next_node = self.plan.next_node(
+                        current_node.nodeId,
+                        not result
                     )
 
                 case 'END':
@@ -56,6 +45,10 @@ class ConcreteExecutor:
                     )
                     return current_node.metadata.response
 
+                case _:
+                    raise InvalidFlowException(
+                        f'Flow is broken, unexpected {current_node.nodeType} node {current_node.nodeId}')
+
             if next_node is None:
                 raise InvalidFlowException(
                     f'Flow is broken, could not find next node from {current_node.nodeId}')
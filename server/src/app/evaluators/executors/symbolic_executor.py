@@ -1,4 +1,7 @@
-from typing import Optional, List, Tuple
+import time
+from types import MappingProxyType
+from typing import Any, Callable, Iterator, Mapping, NamedTuple, Optional, List, Sequence, Tuple
+from pydantic import BaseModel
 from z3 import (   # type: ignore
     sat,
     unsat,
@@ -15,17 +18,30 @@ from z3 import (   # type: ignore
 
     Not,
     And,
+    Bool,
     Solver,
     BoolVal,
+    SolverFor,
     ExprRef,
     ModelRef,
     CheckSatResult,
 )
 
 from src.app.core.config import get_settings
-from src.app.evaluators.parser import get_parser
-from src.app.evaluators.transformers import SymbolicTransfomer
-from src.app.models.node_model import AnyNode, ConditionalNode, EndNode
+from src.app.evaluators.parser import normalize_expression
+from src.app.evaluators.plan import node_hashes, subtree_hashes
+from src.app.evaluators.cache import (
+    EMPTY_CONTEXT,
+    PathCache,
+    PathRecord,
+    QueryCache,
+    segment_key,
+    root_path_key,
+    child_path_key,
+    get_expression_cache,
+)
+from src.app.evaluators.transformers import ExprMap, SymbolicTransfomer
+from src.app.models.node_model import AnyNode, ConditionalNode, EndNode, StartNode
 from src.utils.symbolic_var import symbolic_var_factory, concretize_model
 from src.app.core.exceptions import (
     RuntimeException,
@@ -38,63 +54,188 @@ from src.app.models.symbolic_model import (
     PrunedBranch,
     UncoveredPath,
     ReductionInfo,
+    ReportMetadata,
     SymbolicReport,
 )
 
+from .symbolic_intervals import Domain, IntervalAnalysis
+from .symbolic_logic import flow_logic
+from .symbolic_redundancy import implied_conjuncts, redundant_conjuncts
+from .symbolic_witnesses import Witness, replay_witnesses
+
 
 settings = get_settings()
 
+# (event, report list) of the findings streamed while exploring
+REPORT_EVENTS = (
+    ('reduction', 'reductions'),
+    ('pruned', 'pruned'),
+    ('uncovered', 'uncovered'),
+    ('case', 'cases'),
+)
+
+Events = list[tuple[str, BaseModel]]
+
+
+def report_events(report: SymbolicReport) -> Iterator[tuple[str, BaseModel]]:
+    """The events a streamed run emits, from a finished report."""
+    for event, name in REPORT_EVENTS:
+        for item in getattr(report, name):
+            yield event, item
+
+
+class ZfPrinter:
+    """ZF syntax of Z3 expressions, memoized for every subexpression."""
+
+    def __init__(self) -> None:
+        self._texts: ExprMap[str] = ExprMap()
+
+    def __call__(self, expr: ExprRef) -> str:
+        text = self._texts.get(expr)
+        if text is None:
+            text = self._render(expr)
+            self._texts[expr] = text
+        return text
+
+    def _render(self, expr: ExprRef) -> str:
+        if is_and(expr):
+            return " and ".join(self(c) for c in expr.children())
+
+        if is_or(expr):
+            return " or ".join(self(c) for c in expr.children())
+
+        if is_not(expr):
+            inner = expr.children()[0]
+            # tenta detectar negações de comparadores e inverter para sintaxe ZF legível
+            if is_le(inner):
+                a, b = inner.children()
+                return f"{self(a)} > {self(b)}"
+            if is_lt(inner):
+                a, b = inner.children()
+                return f"{self(a)} >= {self(b)}"
+            if is_ge(inner):
+                a, b = inner.children()
+                return f"{self(a)} < {self(b)}"
+            if is_gt(inner):
+                a, b = inner.children()
+                return f"{self(a)} <= {self(b)}"
+            if is_not(inner):
+                return self(inner.children()[0])
+            # fallback
+            return f"not ({self(inner)})"
+
+        # Caso base: variável, número, comparação simples, função Z3
+        s = str(expr)
+        s = s.replace("==", "=")
+        s = s.replace("And", "and").replace("Or", "or").replace("Not", "not")
+        return s
+
 
 def expr_to_zf_string(expr: ExprRef) -> str:
-    if is_and(expr):
-        return " and ".join(expr_to_zf_string(c) for c in expr.children())
-
-    if is_or(expr):
-        return " or ".join(expr_to_zf_string(c) for c in expr.children())
-
-    if is_not(expr):
-        inner = expr.children()[0]
-        # tenta detectar negações de comparadores e inverter para sintaxe ZF legível
-        if is_le(inner):
-            a, b = inner.children()
-            return f"{expr_to_zf_string(a)} > {expr_to_zf_string(b)}"
-        if is_lt(inner):
-            a, b = inner.children()
-            return f"{expr_to_zf_string(a)} >= {expr_to_zf_string(b)}"
-        if is_ge(inner):
-            a, b = inner.children()
-            return f"{expr_to_zf_string(a)} < {expr_to_zf_string(b)}"
-        if is_gt(inner):
-            a, b = inner.children()
-            return f"{expr_to_zf_string(a)} <= {expr_to_zf_string(b)}"
-        if is_not(inner):
-            return expr_to_zf_string(inner.children()[0])
-        # fallback
-        return f"not ({expr_to_zf_string(inner)})"
-
-    # Caso base: variável, número, comparação simples, função Z3
-    s = str(expr)
-    s = s.replace("==", "=")
-    s = s.replace("And", "and").replace("Or", "or").replace("Not", "not")
-    return s
+    return ZfPrinter()(expr)
 
 
-class SymbolicExecutor:
-    def __init__(self, nodes: List[AnyNode]):
-        self.nodes = nodes
+class JournaledMap(ExprMap[str]):
+    """ExprMap that remembers every write, in order."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.journal: list[tuple] = []
+
+    def __setitem__(self, key, value) -> None:
+        self.journal.append((key, value))
+        super().__setitem__(key, value)
+
+
+class PathScope(NamedTuple):
+    """One solver scope on the current DFS path, asserting `constraint`."""
+    parent: Optional['PathScope']
+    constraint: ExprRef
+    depth: int
+    context: int
 
-        self.solver = Solver()
-        self.solver.set(
-            'timeout',
-            settings.Z3_SOLVER_TIMEOUT_MILLISECONDS
-        )
 
-        self.simplifier_solver = Solver()
+class PathEntry(NamedTuple):
+    """A node waiting to be explored."""
+    node: AnyNode
+    constraints: List[Optional[ExprRef]]
+    scope: Optional[PathScope]
+    path_key: str
+    parent: Optional[PathRecord]
+
+
+class Children(NamedTuple):
+    """Children of a node in list order: all of them and by branch."""
+    all: tuple[AnyNode, ...]
+    true: tuple[AnyNode, ...]
+    false: tuple[AnyNode, ...]
+
+
+NO_CHILDREN = Children((), (), ())
+
+
+class SubtreeEnd(NamedTuple):
+    """Popped once every node below `record` has been explored."""
+    key: Optional[str]
+    record: PathRecord
+    parent: Optional[PathRecord]
+
+
+class SymbolicExecutor:
+    def __init__(self, nodes: List[AnyNode],
+                 query_cache: Optional[QueryCache] = None,
+                 path_cache: Optional[PathCache] = None,
+                 on_events: Optional[Callable[[Events], None]] = None,
+                 witnesses: Sequence[dict[str, Any]] = ()):
+        self.nodes = nodes
+        self._index_nodes()
+        # called with the findings of every explored node, as they are found
+        self.on_events = on_events
+        self._emitted = {name: 0 for _, name in REPORT_EVENTS}
+        # pass a shared cache to reuse answers across runs of the same flow
+        self.query_cache = query_cache if query_cache is not None else QueryCache()
+        self._queries = 0
+        self._cache_hits = 0
+        # queries on simple comparisons are decided without the solver
+        self._interval_hits = 0
+        self._intervals = IntervalAnalysis()
+        self._domains: dict[int, Domain] = {EMPTY_CONTEXT: Domain()}
+        # pass a shared cache to reuse unchanged subtrees across flow edits
+        self.path_cache = path_cache
+        self._reused_nodes = 0
+        self._resolved_nodes = 0
+
+        # both solvers are set up for the logic the conditions need, when
+        # it is narrower than what Z3's default solver prepares for
+        self.logic = self._select_logic() if settings.SYMBOLIC_SELECT_LOGIC else None
+
+        # incremental solver: its scope stack mirrors the path being explored
+        self.solver = self._new_solver()
+        self._scopes: List[PathScope] = []
+
+        # empty between checks: tests expressions in isolation (assumptions)
+        # and builds case witnesses
+        self.simplifier_solver = self._new_solver()
+        # pruned branches list only the constraints in the core
+        self.simplifier_solver.set('core.minimize', settings.SYMBOLIC_MINIMIZE_UNSAT_CORES)
+        self._track_literals: List[ExprRef] = []
 
-        self.parser = get_parser()
         self.symbolic_vars = self._create_symbolic_vars()
+        # concrete inputs of a previous run (e.g. before the flow was edited)
+        # that satisfy the constraints along each path, by context
+        self._witnesses: dict[int, tuple[Witness, ...]] = {
+            EMPTY_CONTEXT: replay_witnesses(self.symbolic_vars, witnesses)}
+        self._witness_hits = 0
         self.transformer = SymbolicTransfomer(self.symbolic_vars)
+        # texts depend on every write made so far, so the writes of reused
+        # nodes are replayed as well
+        self.reverse_map = JournaledMap(self.transformer.reverse_map)
+        self.transformer.reverse_map = self.reverse_map
         self.transformer.reverse_map[BoolVal(True)] = "true"
+        # rendering only depends on the AST, the map is looked up each time
+        self._simplified: ExprMap[ExprRef] = ExprMap()
+        self._printer = ZfPrinter()
+        self._render_seconds = 0.0
 
         # aux (outputs)
         self.cases: List[CaseResult] = []
@@ -107,17 +248,27 @@ class SymbolicExecutor:
     # -------------------------
     # helpers
     # -------------------------
-    def _reset_simplifier(self):
+    def _select_logic(self) -> Optional[str]:
+        input_types = {i.displayName: i.type.value for i in self._start_node().metadata.inputs}
+
         try:
-            self.simplifier_solver.reset()
-        finally:
-            self.simplifier_solver.set(
-                "timeout",
-                settings.Z3_SOLVER_TIMEOUT_MILLISECONDS
-            )
+            trees = [
+                get_expression_cache().get(self._expression(node)).tree
+                for node in self._nodes_by_type.get("CONDITIONAL", ())
+            ]
+        except Exception:
+            # reported when exploration reaches the node
+            return None
+
+        return flow_logic(input_types, trees)
+
+    def _new_solver(self) -> Solver:
+        solver = SolverFor(self.logic) if self.logic is not None else Solver()
+        solver.set('timeout', settings.Z3_SOLVER_TIMEOUT_MILLISECONDS)
+        return solver
 
-    def _check_with_timeout(self, solver: Solver) -> CheckSatResult:
-        res = solver.check()
+    def _check_with_timeout(self, solver: Solver, *assumptions: ExprRef) -> CheckSatResult:
+        res = solver.check(*assumptions)
         if res == unknown:
             reason = solver.reason_unknown()
             if "timeout" in reason:
@@ -125,114 +276,400 @@ class SymbolicExecutor:
 
         return res
 
-    def _create_symbolic_vars(self) -> dict[str, ExprRef]:
-        start_node = next(
-            (node for node in self.nodes if node.nodeType == "START"), None)
+    def _counted_check(self, solver: Solver, *assumptions: ExprRef) -> CheckSatResult:
+        # queries on temporary assertions, which the query cache cannot key
+        self._queries += 1
+        return self._check_with_timeout(solver, *assumptions)
+
+    def _unsat_core(self, constraints: List[ExprRef]) -> Optional[List[ExprRef]]:
+        """The constraints of an unsat conjunction that conflict, in order."""
+        # one literal per position, shared by every call
+        while len(self._track_literals) < len(constraints):
+            self._track_literals.append(Bool(f'!track{len(self._track_literals)}'))
+        literals = self._track_literals[:len(constraints)]
+
+        self.simplifier_solver.push()
+        try:
+            for constraint, literal in zip(constraints, literals):
+                self.simplifier_solver.assert_and_track(constraint, literal)
+
+            try:
+                if self._counted_check(self.simplifier_solver) != unsat:
+                    return None
+            except SymbolicTimeoutException:
+                # only the explanation is lost, the branch is known unreachable
+                return None
+
+            core = {literal.get_id() for literal in self.simplifier_solver.unsat_core()}
+        finally:
+            self.simplifier_solver.pop()
+
+        return [c for c, literal in zip(constraints, literals) if literal.get_id() in core]
+
+    def _cached_check(self, solver: Solver, context: int, domain: Domain,
+                      *assumptions: ExprRef) -> CheckSatResult:
+        self._queries += 1
+
+        res = self.query_cache.get(context, assumptions)
+        if res is not None:
+            self._cache_hits += 1
+            return res
+
+        res = None
+        if settings.SYMBOLIC_INTERVAL_FAST_PATH:
+            res = self._intervals.decide(domain, assumptions)
+
+        if res is not None:
+            self._interval_hits += 1
+        else:
+            res = self._check_with_timeout(solver, *assumptions)
+        self.query_cache.set(context, assumptions, res)
+
+        return res
+
+    def _check_in_path(self, *assumptions: ExprRef) -> CheckSatResult:
+        scope = self._scopes[-1] if self._scopes else None
+        return self._cached_check(self.solver, self._context, self._domain(scope), *assumptions)
+
+    def _check_isolated(self, *assumptions: ExprRef) -> CheckSatResult:
+        return self._cached_check(
+            self.simplifier_solver, EMPTY_CONTEXT, self._domains[EMPTY_CONTEXT], *assumptions)
+
+    def _domain(self, scope: Optional[PathScope]) -> Domain:
+        """Interval domain of the constraints along `scope`, by context."""
+        missing: list[PathScope] = []
+        while scope is not None and scope.context not in self._domains:
+            missing.append(scope)
+            scope = scope.parent
+
+        domain = self._domains[scope.context if scope is not None else EMPTY_CONTEXT]
+        for pending in reversed(missing):
+            domain = self._intervals.meet(domain, pending.constraint)
+            self._domains[pending.context] = domain
+
+        return domain
+
+    def _path_witnesses(self, scope: Optional[PathScope]) -> tuple[Witness, ...]:
+        """Previous witnesses that satisfy the constraints along `scope`, by context."""
+        if not self._witnesses[EMPTY_CONTEXT]:
+            return ()
+
+        missing: list[PathScope] = []
+        while scope is not None and scope.context not in self._witnesses:
+            missing.append(scope)
+            scope = scope.parent
+
+        witnesses = self._witnesses[scope.context if scope is not None else EMPTY_CONTEXT]
+        for pending in reversed(missing):
+            witnesses = tuple(w for w in witnesses if w.satisfies(pending.constraint))
+            self._witnesses[pending.context] = witnesses
+
+        return witnesses
+
+    @property
+    def _context(self) -> int:
+        return self._scopes[-1].context if self._scopes else EMPTY_CONTEXT
+
+    def _child_scope(self, scope: Optional[PathScope], constraint: ExprRef) -> PathScope:
+        depth, context = (scope.depth, scope.context) if scope is not None else (0, EMPTY_CONTEXT)
+
+        return PathScope(scope, constraint, depth + 1,
+                         self.query_cache.context(context, constraint))
+
+    def _expression(self, node: AnyNode) -> str:
+        assert isinstance(node, ConditionalNode)
+        return normalize_expression(node.metadata.expression)
+
+    def _pop_scopes(self, depth: int) -> None:
+        while len(self._scopes) > depth:
+            self.solver.pop()
+            self._scopes.pop()
+
+    def _enter_scope(self, scope: Optional[PathScope]) -> None:
+        """
+        Aligns the solver with the path of `scope`. Scopes shared with the
+        current path are kept, so each constraint is asserted once per level.
+        """
+        missing: list[PathScope] = []
+        while scope is not None and not (
+                len(self._scopes) >= scope.depth and self._scopes[scope.depth - 1] is scope):
+            # usually only the last one, unless ancestors were reused from the path cache
+            missing.append(scope)
+            scope = scope.parent
+
+        self._pop_scopes(scope.depth if scope is not None else 0)
+
+        for pending in reversed(missing):
+            self.solver.push()
+            self.solver.add(pending.constraint)
+            self._scopes.append(pending)
+
+    def _index_nodes(self) -> None:
+        # built once, children are looked up for every explored branch
+        by_id: dict[str, AnyNode] = {}
+        by_type: dict[str, list[AnyNode]] = {}
+        children: dict[str, tuple[list[AnyNode], list[AnyNode], list[AnyNode]]] = {}
+
+        for node in self.nodes:
+            by_id[node.nodeId] = node
+            by_type.setdefault(node.nodeType, []).append(node)
+
+            if node.parentNodeId is None:
+                continue
+
+            siblings = children.setdefault(node.parentNodeId, ([], [], []))
+            siblings[0].append(node)
+            if node.isFalseCase is not None:
+                siblings[2 if node.isFalseCase else 1].append(node)
+
+        self._nodes_by_id: Mapping[str, AnyNode] = MappingProxyType(by_id)
+        self._nodes_by_type: Mapping[str, tuple[AnyNode, ...]] = MappingProxyType(
+            {k: tuple(v) for k, v in by_type.items()})
+        self._children: Mapping[str, Children] = MappingProxyType(
+            {k: Children(*map(tuple, v)) for k, v in children.items()})
+
+    def _start_node(self) -> StartNode:
+        start_node = next(iter(self._nodes_by_type.get("START", ())), None)
         if not start_node:
             raise InvalidFlowException("flow is broken, has no start node")
-        return symbolic_var_factory(start_node.metadata)
+        assert isinstance(start_node, StartNode)
+        return start_node
 
-    def _get_children(self, node_id: str, is_false_case: Optional[bool] = None) -> List[AnyNode]:
-        children = [node for node in self.nodes if node.parentNodeId == node_id]
-        if is_false_case is not None:
-            children = [c for c in children if c.isFalseCase == is_false_case]
-        return children
+    def _create_symbolic_vars(self) -> dict[str, ExprRef]:
+        return symbolic_var_factory(self._start_node().metadata)
+
+    def _get_children(self, node_id: str, is_false_case: Optional[bool] = None) -> tuple[AnyNode, ...]:
+        children = self._children.get(node_id, NO_CHILDREN)
+        if is_false_case is None:
+            return children.all
+        return children.false if is_false_case else children.true
 
     def _zf_text(self, expr: Optional[ExprRef]) -> str:
         if expr is None:
             return "<undecidable>"
 
+        start = time.perf_counter()
+        try:
+            return self._render_text(expr)
+        finally:
+            self._render_seconds += time.perf_counter() - start
+
+    def _render_text(self, expr: ExprRef) -> str:
         try:
             # attempt to find canonical simplified key in reverse_map
-            simp = simplify(expr)
+            simp = self._simplified.get(expr)
+            if simp is None:
+                simp = simplify(expr)
+                self._simplified[expr] = simp
             if simp in self.transformer.reverse_map:
                 return self.transformer.reverse_map[simp]
             if expr in self.transformer.reverse_map:
                 return self.transformer.reverse_map[expr]
         except Exception:
             pass
-        return expr_to_zf_string(expr)
+        return self._printer(expr)
 
     # -------------------------
     # public API
     # -------------------------
     def execute(self) -> SymbolicReport:
-        start_node = next(
-            (node for node in self.nodes if node.nodeType == "START"), None)
-        if not start_node:
-            raise InvalidFlowException("flow is broken, has no start node")
+        self._explore()
+
+        # post-processing
+        coverage = self._calculate_coverage()
+
+        return SymbolicReport(
+            cases=self.cases,
+            coverage=coverage,
+            pruned=self.pruned,
+            uncovered=self.uncovered,
+            reductions=self.reductions,
+            metadata=self._metadata(),
+        )
+
+    def execute_partial(self, root: Optional[str] = None,
+                        cut: frozenset[str] = frozenset()) -> Optional[dict[str, Any]]:
+        """
+        Explores one part of a split run: the subtree of `root`, after the
+        path leading to it, or the whole flow except the subtrees in `cut`.
+
+        Returns the report lists and where each cut subtree was reached
+        (`splits`, node id and list lengths at that point). Returns None
+        if `root` is not reached.
+        """
+        splits = self._explore(root, cut)
+
+        if root is None:
+            base = (0, 0, 0, 0)
+        elif splits and splits[0][0] == root:
+            base = splits.pop(0)[1]
+        else:
+            return None
+
+        return {
+            'reductions': [r.model_dump(mode='json') for r in self.reductions[base[0]:]],
+            'pruned': [p.model_dump(mode='json') for p in self.pruned[base[1]:]],
+            'uncovered': [u.model_dump(mode='json') for u in self.uncovered[base[2]:]],
+            'cases': [c.model_dump(mode='json') for c in self.cases[base[3]:]],
+            'splits': [
+                (node_id, tuple(m - b for m, b in zip(marks, base)))
+                for node_id, marks in splits
+            ],
+            'metadata': self._metadata().model_dump(),
+        }
+
+    def _metadata(self) -> ReportMetadata:
+        return ReportMetadata(
+            solverQueries=self._queries,
+            queryCacheHits=self._cache_hits,
+            intervalHits=self._interval_hits,
+            witnessHits=self._witness_hits,
+            reusedNodes=self._reused_nodes,
+            resolvedNodes=self._resolved_nodes,
+            renderSeconds=self._render_seconds,
+            solverLogic=self.logic,
+        )
+
+    def _marks(self) -> tuple[int, int, int, int, int]:
+        return (len(self.reductions), len(self.pruned), len(self.uncovered),
+                len(self.cases), len(self.reverse_map.journal))
+
+    def _emit(self) -> None:
+        events: Events = []
+
+        for event, name in REPORT_EVENTS:
+            items = getattr(self, name)
+            events.extend((event, item) for item in items[self._emitted[name]:])
+            self._emitted[name] = len(items)
+
+        if events and self.on_events is not None:
+            self.on_events(events)
+
+    def _partial_nodes(self, targets: list[str]) -> set[str]:
+        """Ancestors of `targets`: their subtrees are only partly explored."""
+        partial: set[str] = set()
+
+        for target in targets:
+            parent = self._parent_id(target)
+            while parent is not None and parent not in partial:
+                partial.add(parent)
+                parent = self._parent_id(parent)
+
+        return partial
+
+    def _parent_id(self, node_id: str) -> Optional[str]:
+        node = self._nodes_by_id.get(node_id)
+        return node.parentNodeId if node is not None else None
+
+    def _explore(self, root: Optional[str] = None,
+                 cut: frozenset[str] = frozenset()) -> list[tuple[str, tuple[int, ...]]]:
+        """
+        DFS over the flow. With `root`, only the path to it and its subtree
+        are explored; nodes in `cut` are skipped. Returns the marks taken
+        where `root` and the `cut` nodes were reached, in DFS order.
+        """
+        start_node = self._start_node()
 
         self.cases.clear()
         self.pruned.clear()
         self.uncovered.clear()
         self.reductions.clear()
         self._case_exprs.clear()
-
-        stack: list[tuple[AnyNode, list[Optional[ExprRef]], Optional[bool]]] = []
+        self._pop_scopes(0)
+        self._queries = 0
+        self._cache_hits = 0
+        self._interval_hits = 0
+        self._witness_hits = 0
+        self._reused_nodes = 0
+        self._resolved_nodes = 0
+        self._render_seconds = 0.0
+        self._emitted = dict.fromkeys(self._emitted, 0)
+
+        subtrees = subtree_hashes(self.nodes)
+        locals_ = node_hashes(self.nodes)
+        root_key = root_path_key(start_node)
+
+        # records of partly explored subtrees must not be cached
+        partial = self._partial_nodes([root] if root is not None else list(cut))
+        on_path = partial | {root} if root is not None else None
+        splits: list[tuple[str, tuple[int, ...]]] = []
+
+        stack: list[PathEntry | SubtreeEnd] = []
         for child in self._get_children(start_node.nodeId):
-            stack.append((child, [], None))
+            if on_path is None or child.nodeId in on_path:
+                stack.append(PathEntry(child, [], None, root_key, None))
 
         while stack:
-            node, constraints, is_false_case = stack.pop()
+            if self.on_events is not None:
+                self._emit()
 
-            if node.nodeType == "CONDITIONAL":
-                assert isinstance(node, ConditionalNode)
-                expr_text = node.metadata.expression.replace("'", '"').strip()
-                try:
-                    tree = self.parser.parse(expr_text)
-                    cond = self.transformer.transform(tree)
-                except Exception as e:
-                    raise RuntimeException(
-                        f'expression - {expr_text} - from node {node.nodeId} '
-                        f'could not be translated: {e}'
-                    )
+            entry = stack.pop()
 
-                # attempt to simplify with context
-                try:
-                    simplified, removed_parts = self._simplify_with_context(
-                        cond,
-                        [c for c in constraints if c is not None]
-                    )
-                except SymbolicTimeoutException:
-                    raise
-                except Exception:
-                    # fallback to original cond if simplification fails unexpectedly
-                    simplified, removed_parts = cond, []
+            if isinstance(entry, SubtreeEnd):
+                entry.record.size += sum(c.size for c in entry.record.children)
+                if self.path_cache is not None and entry.key is not None:
+                    self.path_cache.set(entry.key, entry.record)
+                if entry.parent is not None:
+                    entry.parent.children.append(entry.record)
+                continue
 
-                if removed_parts:
-                    # map removed parts to readable strings
-                    removed_texts = [self._zf_text(r) for r in removed_parts]
-                    orig_text = self._zf_text(cond)
-                    simp_text = self._zf_text(simplified)
-                    self.reductions.append(ReductionInfo(
-                        nodeId=node.nodeId,
-                        original=orig_text,
-                        simplified=simp_text,
-                        removedParts=removed_texts
-                    ))
-
-                # process true branch (is_false_case=False)
-                self._process_branch(
-                    node, simplified, constraints, stack, False)
-                # process false branch (is_false_case=True) using Not(simplified)
-                self._process_branch(node, Not(simplified),
-                                     constraints, stack, True)
-
-            elif node.nodeType == "END":
-                assert isinstance(node, EndNode)
-                # finalize case
-                self._finalize_case(node, constraints)
+            node, constraints, scope = entry.node, entry.constraints, entry.scope
 
-        # post-processing
-        coverage = self._calculate_coverage()
+            if node.nodeId in cut or node.nodeId == root:
+                splits.append((node.nodeId, self._marks()[:4]))
+                if node.nodeId in cut:
+                    continue
 
-        return SymbolicReport(
-            cases=self.cases,
-            coverage=coverage,
-            pruned=self.pruned,
-            uncovered=self.uncovered,
-            reductions=self.reductions,
-        )
+            key = None
+            cached = None
+            if node.nodeId not in partial:
+                key = segment_key(entry.path_key, subtrees[node.nodeId])
+                cached = self.path_cache.get(key) if self.path_cache is not None else None
+            if cached is not None:
+                self._replay(cached)
+                self._reused_nodes += cached.size
+                if entry.parent is not None:
+                    entry.parent.children.append(cached)
+                continue
+
+            record = PathRecord()
+            children: list[PathEntry] = []
+
+            node_key = segment_key(entry.path_key, locals_[node.nodeId])
+            reused = self.path_cache.get(node_key) if self.path_cache is not None else None
+            if reused is not None:
+                # the node itself is unchanged, only its subtree was edited
+                self._reused_nodes += 1
+                self._replay_node(reused, record)
+            else:
+                self._resolved_nodes += 1
+                self._explore_node(node, constraints, scope, record)
+                if self.path_cache is not None:
+                    self.path_cache.set(node_key, record)
+
+            for is_false_case, child_ids, added in record.branches:
+                if added is None:
+                    child_constraints, child_scope = constraints, scope
+                else:
+                    child_constraints = constraints + [added]
+                    child_scope = self._child_scope(scope, added)
+
+                child_key = child_path_key(entry.path_key, self._expression(node), is_false_case)
+                children.extend(
+                    PathEntry(self._nodes_by_id[child_id], child_constraints,
+                              child_scope, child_key, record)
+                    for child_id in child_ids
+                    if on_path is None or node.nodeId not in partial or child_id in on_path
+                )
+
+            # children are popped (and their subtrees explored) before the end
+            stack.append(SubtreeEnd(key, record, entry.parent))
+            stack.extend(children)
+
+        if self.on_events is not None:
+            self._emit()
+
+        return splits
 
     # -------------------------
     # core operations
@@ -242,15 +679,26 @@ class SymbolicExecutor:
         node: AnyNode,
         cond: Optional[ExprRef],
         constraints: list[Optional[ExprRef]],
-        stack: list[tuple[AnyNode, list[Optional[ExprRef]], Optional[bool]]],
+        record: PathRecord,
         is_false_case: bool,
     ):
+        """Records in `record` the children to explore below a reachable branch."""
+        witness = None
         if cond is not None:
-            # use a fresh reset of simplifier to check condition in isolation
-            self._reset_simplifier()
-            try:
-                self.simplifier_solver.add(cond)
-                chk = self._check_with_timeout(self.simplifier_solver)
+            scope = self._scopes[-1] if self._scopes else None
+            witness = next(
+                (w for w in self._path_witnesses(scope) if w.satisfies(cond)), None)
+
+        if witness is not None:
+            # a previous witness still takes the branch, so the condition
+            # and the path with it are satisfiable: both checks are skipped
+            self._queries += 2
+            self._witness_hits += 2
+            chk = sat
+        else:
+            if cond is not None:
+                # check the condition in isolation on the (empty) simplifier
+                chk = self._check_isolated(cond)
                 if chk == unsat:
                     # the condition itself is impossible
                     child_nodes = self._get_children(
@@ -264,76 +712,71 @@ class SymbolicExecutor:
                             unsatConstraints=unsat_constraints
                         ))
                     return
-            finally:
-                # always reset simplifier after this quick check
-                self._reset_simplifier()
 
-        # 2) Evaluate condition in the context of accumulated constraints using main solver
-        # push/pop to isolate context
-        self.solver.push()
-        try:
-            for c in constraints:
-                if c is not None:
-                    self.solver.add(c)
+            # 2) Evaluate condition in the context of accumulated constraints: the
+            # solver already holds them, the condition is only assumed
             if cond is not None:
-                self.solver.add(cond)
+                chk = self._check_in_path(cond)
+            else:
+                chk = self._check_in_path()
 
-            chk = self._check_with_timeout(self.solver)
-            if chk == sat:
-                new_constraints = list(constraints)
+        if chk == sat:
+            new_constraints = list(constraints)
+            added = None
 
-                if cond is not None:
-                    try:
-                        if not is_true(cond):
-                            new_constraints.append(cond)
-                    except Exception:
-                        new_constraints.append(cond)
-
-                child_nodes = self._get_children(node.nodeId, is_false_case)
-
-                if not child_nodes:
-                    if node.nodeType != 'END':
-                        self.uncovered.append(
-                            UncoveredPath(
-                                nodeId=node.nodeId,
-                                constraints=[
-                                    self._zf_text(c) for c in new_constraints if c is not None
-                                ]
-                            )
+            if cond is not None:
+                try:
+                    redundant = is_true(cond)
+                except Exception:
+                    redundant = False
+
+                if not redundant:
+                    new_constraints.append(cond)
+                    added = cond
+
+            child_nodes = self._get_children(node.nodeId, is_false_case)
+
+            if not child_nodes:
+                if node.nodeType != 'END':
+                    self.uncovered.append(
+                        UncoveredPath(
+                            nodeId=node.nodeId,
+                            constraints=[
+                                self._zf_text(c) for c in new_constraints if c is not None
+                            ]
                         )
-                    return
+                    )
+                return
+
+            record.branches.append(
+                (is_false_case, [child.nodeId for child in child_nodes], added))
+        elif chk == unsat:
+            # build unsat_constraints (dedupe and preserve order) from the
+            # constraints that conflict, the whole path if undecided
+            conflicting = [c for c in constraints if c is not None]
+            if cond is not None:
+                conflicting.append(cond)
+            conflicting = self._unsat_core(conflicting) or conflicting
 
-                for child in child_nodes:
-                    stack.append((child, new_constraints, is_false_case))
-            elif chk == unsat:
-                # build unsat_constraints (dedupe and preserve order)
-                unsat_constraints = []
-                seen = set()
-                for c in constraints:
-                    if c is not None:
-                        t = self._zf_text(c)
-                        if t not in seen:
-                            unsat_constraints.append(t)
-                            seen.add(t)
-                if cond is not None:
-                    t = self._zf_text(cond)
-                    if t not in seen:
-                        unsat_constraints.append(t)
-                        seen.add(t)
-
-                child_nodes = self._get_children(node.nodeId, is_false_case)
-                for child in child_nodes:
-                    self.pruned.append(PrunedBranch(
-                        nodeId=child.nodeId,
-                        isFalseCase=is_false_case,
-                        reason="unreachable",
-                        unsatConstraints=unsat_constraints
-                    ))
-            else:
-                # should not happen because _check_with_timeout raises on unknown
-                raise SymbolicTimeoutException()
-        finally:
-            self.solver.pop()
+            unsat_constraints = []
+            seen = set()
+            for c in conflicting:
+                t = self._zf_text(c)
+                if t not in seen:
+                    unsat_constraints.append(t)
+                    seen.add(t)
+
+            child_nodes = self._get_children(node.nodeId, is_false_case)
+            for child in child_nodes:
+                self.pruned.append(PrunedBranch(
+                    nodeId=child.nodeId,
+                    isFalseCase=is_false_case,
+                    reason="unreachable",
+                    unsatConstraints=unsat_constraints
+                ))
+        else:
+            # should not happen because _check_with_timeout raises on unknown
+            raise SymbolicTimeoutException()
 
     def _simplify_with_context(self, expr: ExprRef,
                                base: List[Optional[ExprRef]]) -> Tuple[ExprRef, List[ExprRef]]:
@@ -342,40 +785,20 @@ class SymbolicExecutor:
         # normalize base (filter None)
         concrete_base = [c for c in base if c is not None]
 
+        # The main solver already holds `base` (the current path), so the
+        # helpers below only assume the candidate instead of re-asserting it.
+
         # Helper: check base ∧ candidate is UNSAT (i.e., candidate impossible under base)
         def _base_contradicts(candidate: ExprRef) -> bool:
-            try:
-                self._reset_simplifier()
-                for c in concrete_base:
-                    self.simplifier_solver.add(c)
-                self.simplifier_solver.add(candidate)
-                chk = self._check_with_timeout(self.simplifier_solver)
-                return chk == unsat
-            finally:
-                self._reset_simplifier()
+            return self._check_in_path(candidate) == unsat
 
         # Helper: check base implies candidate (base => candidate)
         def _base_implies(candidate: ExprRef) -> bool:
-            try:
-                self._reset_simplifier()
-                for c in concrete_base:
-                    self.simplifier_solver.add(c)
-                self.simplifier_solver.add(Not(candidate))
-                chk = self._check_with_timeout(self.simplifier_solver)
-                return chk == unsat
-            finally:
-                self._reset_simplifier()
+            return self._check_in_path(Not(candidate)) == unsat
 
         # Helper: check if a => b without relying on base
         def _implies_without_base(a: ExprRef, b: ExprRef) -> bool:
-            try:
-                self._reset_simplifier()
-                self.simplifier_solver.add(a)
-                self.simplifier_solver.add(Not(b))
-                chk = self._check_with_timeout(self.simplifier_solver)
-                return chk == unsat
-            finally:
-                self._reset_simplifier()
+            return self._check_isolated(a, Not(b)) == unsat
 
         # 0) If no context, allow only "real" simplify improvements (conservative)
         if not concrete_base:
@@ -384,17 +807,12 @@ class SymbolicExecutor:
                 remaining = []
                 removed_parts = []
 
-                for ch in children:
-                    redundant = False
-                    for other in children:
-                        if ch is other:
-                            continue
-                        # Se other ⇒ ch, então ch é redundante
-                        if _implies_without_base(other, ch):
-                            redundant = True
-                            break
-
-                    if redundant:
+                # ch é redundante se algum outro termo other ⇒ ch
+                redundant = redundant_conjuncts(
+                    self.simplifier_solver, children, self._counted_check, _implies_without_base)
+
+                for ch, is_redundant in zip(children, redundant):
+                    if is_redundant:
                         removed_parts.append(ch)
                     else:
                         remaining.append(ch)
@@ -475,19 +893,22 @@ class SymbolicExecutor:
                 children = list(expr.children())
                 remaining = []
 
-                for ch in children:
-                    try:
-                        if _base_implies(ch):
-                            removed_parts.append(ch)
-                        else:
-                            # also protect: if base contradicts the child, that's inconsistency (handled elsewhere),
-                            # but don't treat as reduction here.
-                            remaining.append(ch)
-                    except SymbolicTimeoutException:
-                        # propagate timeout
-                        raise
-                    except Exception:
-                        # on unexpected errors, keep the child (conservative)
+                try:
+                    self._queries += 1
+                    implied = implied_conjuncts(self.solver, children)
+                except SymbolicTimeoutException:
+                    # propagate timeout
+                    raise
+                except Exception:
+                    # on unexpected errors, keep the children (conservative)
+                    implied = [False] * len(children)
+
+                for ch, is_implied in zip(children, implied):
+                    if is_implied:
+                        removed_parts.append(ch)
+                    else:
+                        # also protect: if base contradicts the child, that's inconsistency (handled elsewhere),
+                        # but don't treat as reduction here.
                         remaining.append(ch)
 
                 # if all children removed => expression fully redundant -> True
@@ -506,7 +927,8 @@ class SymbolicExecutor:
                 else:
                     new_expr = And(*remaining)
 
-                if str(new_expr) == str(expr):
+                # ASTs are shared: eq is a pointer comparison, str prints both
+                if new_expr.eq(expr):
                     return expr, []
 
                 # register pretty mapping only if textual form changed
@@ -567,70 +989,168 @@ class SymbolicExecutor:
             pass
 
         # 5) Final conservative fallback: try main solver to check base => expr (if simplifier unavailable)
-        try:
-            self.solver.push()
-            for c in concrete_base:
-                self.solver.add(c)
-            self.solver.add(Not(expr))
-            chk2 = self._check_with_timeout(self.solver)
-            if chk2 == unsat:
-                true_expr = BoolVal(True)
-                try:
-                    self.transformer.reverse_map[simplify(true_expr)] = "true"
-                except Exception:
-                    pass
-                return true_expr, [expr]
-        finally:
+        chk2 = self._check_in_path(Not(expr))
+        if chk2 == unsat:
+            true_expr = BoolVal(True)
             try:
-                self.solver.pop()
+                self.transformer.reverse_map[simplify(true_expr)] = "true"
             except Exception:
-                # defensive: if pop fails, raise clearer error upstream
-                raise RuntimeException(
-                    "Solver stack imbalance during simplify_with_context fallback")
+                pass
+            return true_expr, [expr]
 
         # nothing changed
         return expr, []
 
-    def _finalize_case(self, node: AnyNode, constraints: List[Optional[ExprRef]]) -> None:
-        self.solver.push()
+    def _explore_node(self, node: AnyNode, constraints: List[Optional[ExprRef]],
+                      scope: Optional[PathScope], record: PathRecord) -> None:
+        self._enter_scope(scope)
+
+        marks = self._marks()
+
+        if node.nodeType == "CONDITIONAL":
+            assert isinstance(node, ConditionalNode)
+            expr_text = normalize_expression(node.metadata.expression)
+            try:
+                tree = get_expression_cache().get(expr_text).tree
+                cond = self.transformer.transform(tree)
+            except Exception as e:
+                raise RuntimeException(
+                    f'expression - {expr_text} - from node {node.nodeId} '
+                    f'could not be translated: {e}'
+                )
+
+            # attempt to simplify with context
+            try:
+                simplified, removed_parts = self._simplify_with_context(
+                    cond,
+                    [c for c in constraints if c is not None]
+                )
+            except SymbolicTimeoutException:
+                raise
+            except Exception:
+                # fallback to original cond if simplification fails unexpectedly
+                simplified, removed_parts = cond, []
+
+            if removed_parts:
+                # map removed parts to readable strings
+                removed_texts = [self._zf_text(r) for r in removed_parts]
+                orig_text = self._zf_text(cond)
+                simp_text = self._zf_text(simplified)
+                self.reductions.append(ReductionInfo(
+                    nodeId=node.nodeId,
+                    original=orig_text,
+                    simplified=simp_text,
+                    removedParts=removed_texts
+                ))
+
+            # process true branch (is_false_case=False)
+            self._process_branch(
+                node, simplified, constraints, record, False)
+            # process false branch (is_false_case=True) using Not(simplified)
+            self._process_branch(node, Not(simplified),
+                                 constraints, record, True)
+
+        elif node.nodeType == "END":
+            assert isinstance(node, EndNode)
+            # finalize case
+            self._finalize_case(node, constraints)
+
+        record.reductions = self.reductions[marks[0]:]
+        record.pruned = self.pruned[marks[1]:]
+        record.uncovered = self.uncovered[marks[2]:]
+        record.cases = self.cases[marks[3]:]
+        record.case_exprs = self._case_exprs[marks[3]:]
+        record.texts = self.reverse_map.journal[marks[4]:]
+
+    def _replay_node(self, reused: PathRecord, record: PathRecord) -> None:
+        for expr, text in reused.texts:
+            self.reverse_map[expr] = text
+        self.reductions.extend(reused.reductions)
+        self.pruned.extend(reused.pruned)
+        self.uncovered.extend(reused.uncovered)
+        self.cases.extend(reused.cases)
+        self._case_exprs.extend(reused.case_exprs)
+
+        record.reductions = reused.reductions
+        record.pruned = reused.pruned
+        record.uncovered = reused.uncovered
+        record.cases = reused.cases
+        record.case_exprs = reused.case_exprs
+        record.branches = reused.branches
+        record.texts = reused.texts
+
+    def _replay(self, record: PathRecord) -> None:
+        pending = [record]
+        while pending:
+            current = pending.pop()
+            for expr, text in current.texts:
+                self.reverse_map[expr] = text
+            self.reductions.extend(current.reductions)
+            self.pruned.extend(current.pruned)
+            self.uncovered.extend(current.uncovered)
+            self.cases.extend(current.cases)
+            self._case_exprs.extend(current.case_exprs)
+            pending.extend(reversed(current.children))
+
+    def _solve_witness(self, constraints: List[Optional[ExprRef]]) -> Tuple[CheckSatResult, Optional[dict]]:
+        self.simplifier_solver.push()
         try:
             for c in constraints:
                 if c is not None:
-                    self.solver.add(c)
+                    self.simplifier_solver.add(c)
 
-            chk = self._check_with_timeout(self.solver)
+            chk = self._check_with_timeout(self.simplifier_solver)
             if chk == sat:
-                model: ModelRef = self.solver.model()
-                concrete = concretize_model(model, self.symbolic_vars)
-            else:
-                concrete = None
-
-            seen = set()
-            constraint_texts = []
-            for c in constraints:
-                if c is None:
-                    continue
-                text = self._zf_text(c)
-                if text not in seen:
-                    seen.add(text)
-                    constraint_texts.append(text)
+                model: ModelRef = self.simplifier_solver.model()
+                return chk, concretize_model(model, self.symbolic_vars)
 
-            assert isinstance(node, EndNode)
-            self.cases.append(CaseResult(
-                endNodeId=node.nodeId,
-                endMetadata=node.metadata,
-                constraints=constraint_texts,
-                concrete=concrete
-            ))
-            self._case_exprs.append(list(constraints))
+            return chk, None
         finally:
-            self.solver.pop()
+            self.simplifier_solver.pop()
+
+    def _finalize_case(self, node: AnyNode, constraints: List[Optional[ExprRef]]) -> None:
+        # witnesses come from the previous run or the isolated solver, so they
+        # only depend on the path constraints and not on what the incremental
+        # solver explored
+        self._queries += 1
+        witnesses = self._path_witnesses(self._scopes[-1] if self._scopes else None)
+
+        if witnesses:
+            self._witness_hits += 1
+            chk, concrete = sat, witnesses[0].inputs
+        else:
+            cached = self.query_cache.get_witness(self._context)
+            if cached is not None:
+                self._cache_hits += 1
+                chk, concrete = cached
+            else:
+                chk, concrete = self._solve_witness(constraints)
+                self.query_cache.set_witness(self._context, chk, concrete)
+
+        seen = set()
+        constraint_texts = []
+        for c in constraints:
+            if c is None:
+                continue
+            text = self._zf_text(c)
+            if text not in seen:
+                seen.add(text)
+                constraint_texts.append(text)
+
+        assert isinstance(node, EndNode)
+        self.cases.append(CaseResult(
+            endNodeId=node.nodeId,
+            endMetadata=node.metadata,
+            constraints=constraint_texts,
+            concrete=concrete
+        ))
+        self._case_exprs.append(list(constraints))
 
     # -------------------------
     # coverage
     # -------------------------
     def _calculate_coverage(self) -> Coverage:
-        total_end_nodes = len([n for n in self.nodes if n.nodeType == "END"])
+        total_end_nodes = len(self._nodes_by_type.get("END", ()))
         covered_ends = len(
             {case.endNodeId for case in self.cases if case.concrete is not None})
         return Coverage(endCount=covered_ends, totalEndNodes=total_end_nodes)
@@ -0,0 +1,338 @@
+from fractions import Fraction
+from typing import NamedTuple, Optional, Union
+from z3 import (   # type: ignore
+    sat,
+    unsat,
+    is_app,
+
+    ExprRef,
+    RatNumRef,
+    CheckSatResult,
+    Z3_OP_LT,
+    Z3_OP_LE,
+    Z3_OP_GT,
+    Z3_OP_GE,
+    Z3_OP_EQ,
+    Z3_OP_OR,
+    Z3_OP_AND,
+    Z3_OP_NOT,
+    Z3_OP_ADD,
+    Z3_OP_SUB,
+    Z3_OP_MUL,
+    Z3_OP_DIV,
+    Z3_OP_ANUM,
+    Z3_OP_TRUE,
+    Z3_OP_FALSE,
+    Z3_OP_UMINUS,
+    Z3_OP_DISTINCT,
+    Z3_OP_UNINTERPRETED,
+    Z3_BOOL_SORT,
+    Z3_REAL_SORT,
+)
+
+from src.app.evaluators.transformers import ExprMap
+
+
+class Bound(NamedTuple):
+    value: Fraction
+    closed: bool
+
+
+class Interval(NamedTuple):
+    """Values a number input may take: between the bounds, but `excluded`."""
+    lower: Optional[Bound] = None
+    upper: Optional[Bound] = None
+    excluded: frozenset[Fraction] = frozenset()
+
+    def is_empty(self) -> bool:
+        if self.lower is None or self.upper is None:
+            return False
+
+        if self.lower.value != self.upper.value:
+            return self.lower.value > self.upper.value
+
+        # inputs are reals: any other interval has infinitely many values
+        closed = self.lower.closed and self.upper.closed
+        return not closed or self.lower.value in self.excluded
+
+
+class NumberAtom(NamedTuple):
+    """`variable op value`, op being one of <, <=, >, >=, = and !=."""
+    variable: int
+    op: str
+    value: Fraction
+
+
+class BoolAtom(NamedTuple):
+    variable: int
+    value: bool
+
+
+class FalseAtom(NamedTuple):
+    pass
+
+
+Atom = Union[NumberAtom, BoolAtom, FalseAtom]
+
+NEGATED_OPS = {'<': '>=', '<=': '>', '>': '<=', '>=': '<', '=': '!=', '!=': '='}
+
+FLIPPED_OPS = {'<': '>', '<=': '>=', '>': '<', '>=': '<=', '=': '=', '!=': '!='}
+
+
+def _variable(expr: ExprRef, kind: int, sort: int) -> bool:
+    return kind == Z3_OP_UNINTERPRETED and expr.num_args() == 0 and expr.sort().kind() == sort
+
+
+def _linear(expr: ExprRef) -> Optional[tuple[dict[int, Fraction], Fraction]]:
+    """Coefficients by variable and constant term of an arithmetic term."""
+    if not is_app(expr):
+        return None
+
+    kind = expr.decl().kind()
+
+    if kind == Z3_OP_ANUM and isinstance(expr, RatNumRef):
+        return {}, Fraction(expr.numerator_as_long(), expr.denominator_as_long())
+
+    if _variable(expr, kind, Z3_REAL_SORT):
+        return {expr.get_id(): Fraction(1)}, Fraction(0)
+
+    if kind not in (Z3_OP_ADD, Z3_OP_SUB, Z3_OP_UMINUS, Z3_OP_MUL, Z3_OP_DIV):
+        return None
+
+    children = [_linear(c) for c in expr.children()]
+    if any(c is None for c in children):
+        return None
+
+    if kind in (Z3_OP_ADD, Z3_OP_SUB, Z3_OP_UMINUS):
+        coefs: dict[int, Fraction] = {}
+        constant = Fraction(0)
+        for i, (child_coefs, child_constant) in enumerate(children):
+            sign = -1 if (i > 0 and kind == Z3_OP_SUB) or kind == Z3_OP_UMINUS else 1
+            for variable, coef in child_coefs.items():
+                coefs[variable] = coefs.get(variable, Fraction(0)) + sign * coef
+            constant += sign * child_constant
+        return coefs, constant
+
+    if kind == Z3_OP_MUL:
+        coefs, constant = {}, Fraction(1)
+        for child_coefs, child_constant in children:
+            if child_coefs and coefs:
+                return None  # non-linear
+            if child_coefs:
+                coefs = {v: c * constant for v, c in child_coefs.items()}
+            else:
+                coefs = {v: c * child_constant for v, c in coefs.items()}
+            constant *= child_constant
+        return coefs, constant
+
+    (coefs, constant), *divisors = children
+    if len(divisors) != 1:
+        return None
+
+    divisor_coefs, divisor = divisors[0]
+    # x / 0 is unspecified in Z3, not a number we can compute
+    if divisor_coefs or divisor == 0:
+        return None
+    return {v: c / divisor for v, c in coefs.items()}, constant / divisor
+
+
+def _bool_literal(expr: ExprRef) -> Optional[bool]:
+    kind = expr.decl().kind()
+    return True if kind == Z3_OP_TRUE else False if kind == Z3_OP_FALSE else None
+
+
+def _comparison(expr: ExprRef, op: str, positive: bool) -> Optional[list[Atom]]:
+    left, right = expr.children()
+
+    if left.sort().kind() == Z3_BOOL_SORT:
+        # b = true, b != false (and the reverse)
+        if _bool_literal(left) is not None:
+            left, right = right, left
+        literal = _bool_literal(right)
+        if literal is None or not _variable(left, left.decl().kind(), Z3_BOOL_SORT):
+            return None
+        value = literal == (op == '=')
+        return [BoolAtom(left.get_id(), value == positive)]
+
+    terms = (_linear(left), _linear(right))
+    if terms[0] is None or terms[1] is None:
+        return None
+
+    # left - right op 0
+    (left_coefs, left_constant), (right_coefs, right_constant) = terms
+    coefs = dict(left_coefs)
+    for variable, coef in right_coefs.items():
+        coefs[variable] = coefs.get(variable, Fraction(0)) - coef
+    coefs = {v: c for v, c in coefs.items() if c != 0}
+    constant = left_constant - right_constant
+
+    if not positive:
+        op = NEGATED_OPS[op]
+
+    if not coefs:
+        holds = {
+            '<': constant < 0, '<=': constant <= 0, '>': constant > 0,
+            '>=': constant >= 0, '=': constant == 0, '!=': constant != 0,
+        }[op]
+        return [] if holds else [FalseAtom()]
+
+    if len(coefs) > 1:
+        return None
+
+    # coef * x + constant op 0  <=>  x op' -constant / coef
+    (variable, coef), = coefs.items()
+    if coef < 0:
+        op = FLIPPED_OPS[op]
+    return [NumberAtom(variable, op, -constant / coef)]
+
+
+COMPARISONS = {
+    Z3_OP_LT: '<', Z3_OP_LE: '<=', Z3_OP_GT: '>', Z3_OP_GE: '>=',
+    Z3_OP_EQ: '=', Z3_OP_DISTINCT: '!=',
+}
+
+
+def conjunction_atoms(expr: ExprRef, positive: bool = True) -> Optional[list[Atom]]:
+    """
+    `expr` (or its negation) as a conjunction of comparisons of one input
+    with a constant, None when it cannot be written as one.
+    """
+    if not is_app(expr):
+        return None
+
+    kind = expr.decl().kind()
+
+    if kind in (Z3_OP_TRUE, Z3_OP_FALSE):
+        return [] if (kind == Z3_OP_TRUE) == positive else [FalseAtom()]
+
+    if kind == Z3_OP_NOT:
+        return conjunction_atoms(expr.arg(0), not positive)
+
+    if kind in (Z3_OP_AND, Z3_OP_OR):
+        children = expr.children()
+        # a and b, not (a or b); a disjunction only with one term
+        if (kind == Z3_OP_AND) != positive and len(children) != 1:
+            return None
+
+        atoms: list[Atom] = []
+        for child in children:
+            child_atoms = conjunction_atoms(child, positive)
+            if child_atoms is None:
+                return None
+            atoms.extend(child_atoms)
+        return atoms
+
+    if _variable(expr, kind, Z3_BOOL_SORT):
+        return [BoolAtom(expr.get_id(), positive)]
+
+    op = COMPARISONS.get(kind)
+    if op is not None and expr.num_args() == 2:
+        return _comparison(expr, op, positive)
+
+    return None
+
+
+class Domain:
+    """
+    Values of the number inputs (intervals) and bool inputs a conjunction
+    of constraints allows. Constraints it cannot represent are left out,
+    so it over-approximates them: `exact` is False once one was.
+    """
+    __slots__ = ('numbers', 'bools', 'empty', 'exact')
+
+    def __init__(self, numbers: Optional[dict[int, Interval]] = None,
+                 bools: Optional[dict[int, bool]] = None,
+                 empty: bool = False, exact: bool = True) -> None:
+        self.numbers = numbers if numbers is not None else {}
+        self.bools = bools if bools is not None else {}
+        self.empty = empty
+        self.exact = exact
+
+    def meet(self, atoms: Optional[tuple[Atom, ...]]) -> 'Domain':
+        """Domain with one more constraint, given by its atoms (None if it has none)."""
+        if self.empty:
+            return self
+
+        if atoms is None:
+            return Domain(self.numbers, self.bools, False, False)
+
+        numbers = dict(self.numbers)
+        bools = dict(self.bools)
+
+        for atom in atoms:
+            if isinstance(atom, FalseAtom):
+                return Domain(empty=True, exact=self.exact)
+
+            if isinstance(atom, BoolAtom):
+                if bools.setdefault(atom.variable, atom.value) != atom.value:
+                    return Domain(empty=True, exact=self.exact)
+                continue
+
+            interval = _restrict(numbers.get(atom.variable, Interval()), atom)
+            if interval.is_empty():
+                return Domain(empty=True, exact=self.exact)
+            numbers[atom.variable] = interval
+
+        return Domain(numbers, bools, False, self.exact)
+
+
+def _restrict(interval: Interval, atom: NumberAtom) -> Interval:
+    lower, upper, excluded = interval
+
+    if atom.op in ('>', '>=', '='):
+        bound = Bound(atom.value, atom.op != '>')
+        if lower is None or bound.value > lower.value or (
+                bound.value == lower.value and not bound.closed):
+            lower = bound
+
+    if atom.op in ('<', '<=', '='):
+        bound = Bound(atom.value, atom.op != '<')
+        if upper is None or bound.value < upper.value or (
+                bound.value == upper.value and not bound.closed):
+            upper = bound
+
+    if atom.op == '!=':
+        excluded = excluded | {atom.value}
+
+    return Interval(lower, upper, excluded)
+
+
+class IntervalAnalysis:
+    """
+    Decides queries from interval domains, with the atoms of each constraint
+    parsed once: the same ASTs come back on every query along a path.
+    """
+
+    def __init__(self) -> None:
+        # keeps the expressions alive, so their ids are not reused
+        self._atoms: ExprMap[Optional[tuple[Atom, ...]]] = ExprMap()
+
+    def atoms(self, expr: ExprRef) -> Optional[tuple[Atom, ...]]:
+        # anything that is not a formula is left for the solver to reject
+        if not isinstance(expr, ExprRef):
+            return None
+
+        if expr in self._atoms:
+            return self._atoms[expr]
+
+        atoms = conjunction_atoms(expr)
+        self._atoms[expr] = tuple(atoms) if atoms is not None else None
+        return self._atoms[expr]
+
+    def meet(self, domain: Domain, expr: ExprRef) -> Domain:
+        return domain.meet(self.atoms(expr))
+
+    def decide(self, domain: Domain, assumptions: tuple[ExprRef, ...]) -> Optional[CheckSatResult]:
+        """
+        sat or unsat for the constraints of `domain` and `assumptions`, None
+        when the domain cannot tell and the solver has to.
+        """
+        for assumption in assumptions:
+            domain = self.meet(domain, assumption)
+
+        if domain.empty:
+            return unsat
+
+        # every input is constrained on its own, so each non-empty domain
+        # has a value and together they satisfy all the constraints
+        return sat if domain.exact else None
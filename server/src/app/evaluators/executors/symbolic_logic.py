@@ -0,0 +1,65 @@
+from lark import Tree
+from typing import Iterable, Optional
+
+
+# rules the symbolic transformer turns into arithmetic terms or atoms
+ARITHMETIC = frozenset({'number', 'add', 'sub', 'neg', 'lt', 'le', 'gt', 'ge'})
+
+# rules that only combine what their operands already are
+PROPOSITIONAL = frozenset({'true', 'false', 'and_op', 'or_op', 'not_op', 'if_expr',
+                           'compare', 'eq', 'ne'})
+
+
+def _name(tree: Tree) -> str:
+    # same key the symbolic transformer looks the input up with
+    return '_'.join(tok.value for tok in tree.children)
+
+
+def _has_inputs(tree: Tree) -> bool:
+    return any(sub.data in ('name_access', 'func_call') for sub in tree.iter_subtrees())
+
+
+def _nonzero_number(tree: Tree) -> bool:
+    return tree.data == 'number' and float(tree.children[0].value) != 0
+
+
+def flow_logic(input_types: dict[str, str], trees: Iterable[Tree]) -> Optional[str]:
+    """
+    SMT-LIB logic of the constraints the symbolic transformer builds from
+    `trees`: QF_UF when they only combine bool inputs, QF_LRA with linear
+    arithmetic and QF_NRA with products or divisions of inputs.
+
+    None when they may need anything else (text, functions, lists), which
+    is left to Z3's default solver: a solver for a narrower logic than the
+    constraints use answers wrongly instead of failing.
+    """
+    arithmetic = nonlinear = False
+
+    for tree in trees:
+        for sub in tree.iter_subtrees():
+            if sub.data == 'name_access':
+                kind = input_types.get(_name(sub))
+                if kind == 'number':
+                    arithmetic = True
+                elif kind != 'bool':
+                    return None
+
+            elif sub.data == 'mul':
+                arithmetic = True
+                nonlinear = nonlinear or all(_has_inputs(operand) for operand in sub.children)
+
+            elif sub.data == 'div':
+                # x / 0 is an uninterpreted value, outside linear arithmetic
+                arithmetic = True
+                nonlinear = nonlinear or not _nonzero_number(sub.children[1])
+
+            elif sub.data in ARITHMETIC:
+                arithmetic = True
+
+            elif sub.data not in PROPOSITIONAL:
+                return None
+
+    if not arithmetic:
+        return 'QF_UF'
+
+    return 'QF_NRA' if nonlinear else 'QF_LRA'
@@ -0,0 +1,329 @@
+import signal
+import asyncio
+import multiprocessing
+from pydantic import TypeAdapter
+from multiprocessing.connection import Connection
+from typing import Any, AsyncIterator, Awaitable, Callable, Hashable, Optional, Sequence
+
+from src.app.models.node_model import AnyNode
+from src.app.core.config import get_settings
+from src.app.models.symbolic_model import SymbolicReport
+from src.app.core.exceptions import RuntimeException, SymbolicTimeoutException
+from src.app.evaluators.cache import get_path_cache, get_query_cache_for
+
+from .symbolic_executor import Events, SymbolicExecutor
+from .symbolic_split import merge_parts, plan_split
+
+
+settings = get_settings()
+
+nodes_adapter = TypeAdapter(list[AnyNode])
+
+Progress = Callable[[int, int], Awaitable[None]]
+
+
+class SymbolicWorkerError(Exception):
+    """Error raised by the executor inside a worker, keeping its type name."""
+
+    def __init__(self, error_type: str, message: str) -> None:
+        super().__init__(message)
+        self.error_type = error_type
+
+
+def run_symbolic_job(nodes: list[dict[str, Any]], version: Optional[Hashable],
+                     witnesses: Sequence[dict[str, Any]] = (),
+                     task: Optional[tuple[str, Any]] = None,
+                     on_events: Optional[Callable[[Events], None]] = None) -> Optional[dict[str, Any]]:
+    # query and path caches are per worker and live until it is recycled
+    executor = SymbolicExecutor(
+        nodes_adapter.validate_python(nodes),
+        get_query_cache_for(version) if version is not None else None,
+        get_path_cache(),
+        on_events,
+        witnesses
+    )
+
+    if task is None:
+        return executor.execute().model_dump(mode='json')
+
+    kind, target = task
+    if kind == 'top':
+        return executor.execute_partial(cut=frozenset(target))
+
+    return executor.execute_partial(root=target)
+
+
+def _serve(conn: Connection) -> None:
+    # shutdown is driven by the API process, not by the terminal
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    conn.send(('ready',))
+
+    def send_events(events: Events) -> None:
+        # blocks while the pipe is full, until the API process reads on
+        conn.send(('events', [(event, item.model_dump(mode='json')) for event, item in events]))
+
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            return
+
+        if job is None:
+            return
+
+        nodes, version, witnesses, *task = job
+        streamed = bool(task) and task[0][0] == 'stream'
+
+        try:
+            if streamed:
+                result = run_symbolic_job(nodes, version, witnesses, None, send_events)
+            else:
+                result = run_symbolic_job(nodes, version, witnesses, *task)
+            conn.send(('ok', result))
+        except SymbolicTimeoutException as e:
+            conn.send(('timeout', e.detail))
+        except Exception as e:
+            conn.send(('error', type(e).__name__, str(e)))
+
+
+class SymbolicWorker:
+    def __init__(self, context: Any) -> None:
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_serve, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+
+        self.tasks = 0
+
+    def wait_ready(self, timeout: float) -> bool:
+        try:
+            return self.conn.poll(timeout) and self.conn.recv() == ('ready',)
+        except (EOFError, OSError):
+            return False
+
+    def run(self, job: tuple, deadline: float) -> Optional[tuple]:
+        """Result message of `job`, or None if the deadline passed first."""
+        self.conn.send(job)
+
+        return self.receive(deadline)
+
+    def receive(self, timeout: float) -> Optional[tuple]:
+        if not self.conn.poll(max(timeout, 0)):
+            return None
+
+        return self.conn.recv()
+
+    def stop(self) -> None:
+        try:
+            self.conn.send(None)
+        except OSError:
+            self.kill()
+
+    def kill(self) -> None:
+        # the pipe is left open: a thread may still be polling it
+        self.process.kill()
+        self.process.join()
+
+
+class SymbolicPool:
+    """
+    Runs symbolic tests in worker processes, so exploration does not hold
+    the GIL of the API process and a job can be stopped at any point.
+
+    Jobs are serialized node lists, with the concrete inputs of a previous
+    run to replay before asking the solver. A job still running after
+    `deadline` seconds has its worker killed and replaced; workers are also replaced
+    after `max_tasks_per_child` jobs, which bounds the memory Z3 and the
+    per-worker caches accumulate.
+    """
+
+    def __init__(self, size: int, max_tasks_per_child: int, deadline: float) -> None:
+        if size <= 0:
+            raise ValueError('size must be a positive integer')
+
+        self.size = size
+        self.max_tasks_per_child = max_tasks_per_child
+        self.deadline = deadline
+
+        self._context = multiprocessing.get_context('spawn')
+        self._idle: list[SymbolicWorker] = []
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._slots_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+
+        if self._slots is None or self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(self.size)
+            self._slots_loop = loop
+
+        return self._slots
+
+    def _spawn(self) -> SymbolicWorker:
+        worker = SymbolicWorker(self._context)
+
+        if not worker.wait_ready(self.deadline):
+            worker.kill()
+            raise RuntimeException('symbolic worker failed to start')
+
+        return worker
+
+    async def _acquire_worker(self) -> SymbolicWorker:
+        if self._idle:
+            return self._idle.pop()
+
+        return await asyncio.get_running_loop().run_in_executor(None, self._spawn)
+
+    def _release_worker(self, worker: SymbolicWorker) -> None:
+        worker.tasks += 1
+        if worker.tasks >= self.max_tasks_per_child:
+            worker.stop()
+        else:
+            self._idle.append(worker)
+
+    async def _receive(self, worker: SymbolicWorker, call: Callable[..., Optional[tuple]],
+                       *args: Any) -> tuple:
+        try:
+            message = await asyncio.get_running_loop().run_in_executor(None, call, *args)
+        except (EOFError, OSError):
+            worker.kill()
+            raise RuntimeException('symbolic worker exited unexpectedly')
+        except BaseException:
+            # cancelled mid-job, the worker would still be busy
+            worker.kill()
+            raise
+
+        if message is None:
+            worker.kill()
+            raise SymbolicTimeoutException(
+                f'symbolic test exceeded the {self.deadline:g}s deadline')
+
+        return message
+
+    def _result(self, message: tuple) -> Any:
+        status, *payload = message
+
+        if status == 'ok':
+            return payload[0]
+
+        if status == 'timeout':
+            raise SymbolicTimeoutException(payload[0])
+
+        raise SymbolicWorkerError(*payload)
+
+    async def _submit(self, job: tuple) -> Any:
+        async with self._get_slots():
+            worker = await self._acquire_worker()
+            message = await self._receive(worker, worker.run, job, self.deadline)
+            self._release_worker(worker)
+
+        return self._result(message)
+
+    async def stream(self, nodes: list[dict[str, Any]], version: Optional[Hashable] = None,
+                     witnesses: Sequence[dict[str, Any]] = ()) -> AsyncIterator[tuple[str, Any]]:
+        """
+        Runs the flow in one job, yielding its findings as (event, item)
+        while the worker explores and ('report', report) at the end.
+
+        Nothing is buffered beyond the pipe: while the consumer is behind,
+        the worker blocks on its next send. The deadline covers the whole
+        stream, and a consumer that stops reading has the worker killed.
+        """
+        loop = asyncio.get_running_loop()
+
+        async with self._get_slots():
+            worker = await self._acquire_worker()
+            give_up = loop.time() + self.deadline
+            finished = False
+
+            try:
+                await loop.run_in_executor(
+                    None, worker.conn.send, (nodes, version, witnesses, ('stream', None)))
+
+                while True:
+                    message = await self._receive(
+                        worker, worker.receive, give_up - loop.time())
+                    if message[0] != 'events':
+                        break
+
+                    for event in message[1]:
+                        yield event
+
+                finished = True
+            finally:
+                if not finished:
+                    worker.kill()
+
+            self._release_worker(worker)
+
+        yield 'report', self._result(message)
+
+    async def _run_split(self, nodes: list[dict[str, Any]], version: Optional[Hashable],
+                         witnesses: Sequence[dict[str, Any]], cut: list[str],
+                         progress: Optional[Progress]) -> Optional[SymbolicReport]:
+        # the semaphore is FIFO: idle workers take the next part in order,
+        # so a deep subtree keeps one worker while the others drain the rest
+        jobs = [(nodes, version, witnesses, ('top', cut))]
+        jobs.extend((nodes, version, witnesses, ('subtree', root)) for root in cut)
+        done = 0
+
+        async def submit(job: tuple) -> Any:
+            nonlocal done
+            result = await self._submit(job)
+
+            done += 1
+            if progress is not None:
+                await progress(done, len(jobs))
+
+            return result
+
+        tasks = [asyncio.ensure_future(submit(job)) for job in jobs]
+
+        try:
+            top, *parts = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        total_end_nodes = sum(1 for n in nodes if n['nodeType'] == 'END')
+
+        return merge_parts(top, dict(zip(cut, parts)), total_end_nodes)
+
+    async def run(self, nodes: list[dict[str, Any]], version: Optional[Hashable] = None,
+                  progress: Optional[Progress] = None,
+                  witnesses: Sequence[dict[str, Any]] = ()) -> SymbolicReport:
+        """
+        Large flows are split into subtrees explored by several workers.
+        Each subtree job explores the path to its root again, which the
+        worker's path cache replays after its first part of the flow. If
+        a part disagrees with the rest on whether its subtree is reached,
+        the flow is run in one job. `progress` is awaited with the
+        finished and total parts.
+        """
+        cut: list[str] = []
+        if self.size > 1 and len(nodes) >= settings.SYMBOLIC_SPLIT_MIN_NODES:
+            cut = plan_split(nodes, self.size * settings.SYMBOLIC_SPLIT_TASKS_PER_WORKER)
+
+        if cut:
+            report = await self._run_split(nodes, version, witnesses, cut, progress)
+            if report is not None:
+                return report
+
+        return SymbolicReport.model_validate(await self._submit((nodes, version, witnesses)))
+
+
+symbolic_pool: Optional[SymbolicPool] = None
+
+
+def get_symbolic_pool() -> SymbolicPool:
+    global symbolic_pool
+
+    if symbolic_pool is None:
+        symbolic_pool = SymbolicPool(
+            settings.SYMBOLIC_POOL_SIZE,
+            settings.SYMBOLIC_POOL_MAX_TASKS_PER_CHILD,
+            settings.SYMBOLIC_JOB_DEADLINE_SECONDS
+        )
+
+    return symbolic_pool
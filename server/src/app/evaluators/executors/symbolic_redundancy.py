@@ -0,0 +1,100 @@
+from typing import Callable
+from z3 import (   # type: ignore
+    sat,
+    unsat,
+    unknown,
+
+    Not,
+    Bool,
+    Implies,
+    Solver,
+    ExprRef,
+    CheckSatResult,
+)
+
+from src.app.core.exceptions import SymbolicTimeoutException
+
+
+Check = Callable[..., CheckSatResult]
+
+
+def _indicator(name: str, i: int) -> ExprRef:
+    # '!' is not valid in ZF identifiers, so it never names a flow input
+    return Bool(f'!{name}{i}')
+
+
+def redundant_conjuncts(solver: Solver, conjuncts: list[ExprRef], check: Check,
+                        implies: Callable[[ExprRef, ExprRef], bool]) -> list[bool]:
+    """
+    Whether each conjunct is implied by another single conjunct, with no
+    path constraints. `solver` must be empty; `implies(a, b)` checks a
+    pair and is only used when an unsat core leaves the answer open.
+
+    Each conjunct is guarded by an indicator literal, so one check per
+    conjunct assumes its negation with all the others: if that is sat no
+    other conjunct implies it, and if the core keeps at most one of the
+    others, that one does.
+    """
+    positive = [_indicator('keep', i) for i in range(len(conjuncts))]
+    negative = [_indicator('drop', i) for i in range(len(conjuncts))]
+    redundant = [False] * len(conjuncts)
+    # conjuncts whose core named several others, with those others
+    undecided: list[tuple[int, list[int]]] = []
+
+    solver.push()
+    try:
+        for i, conjunct in enumerate(conjuncts):
+            solver.add(Implies(positive[i], conjunct), Implies(negative[i], Not(conjunct)))
+
+        for i in range(len(conjuncts)):
+            others = [j for j in range(len(conjuncts)) if j != i]
+            res = check(solver, negative[i], *(positive[j] for j in others))
+            if res != unsat:
+                continue
+
+            core = {lit.get_id() for lit in solver.unsat_core()}
+            in_core = [j for j in others if positive[j].get_id() in core]
+            if len(in_core) <= 1:
+                redundant[i] = True
+            else:
+                undecided.append((i, in_core))
+    finally:
+        solver.pop()
+
+    for i, in_core in undecided:
+        # the core is not minimal nor unique, every other conjunct may be the one
+        rest = [j for j in range(len(conjuncts)) if j != i and j not in in_core]
+        redundant[i] = any(implies(conjuncts[j], conjuncts[i]) for j in in_core + rest)
+
+    return redundant
+
+
+def implied_conjuncts(solver: Solver, conjuncts: list[ExprRef]) -> list[bool]:
+    """
+    Whether the constraints asserted on `solver` imply each conjunct.
+
+    Each conjunct is bound to an indicator literal and Z3 computes, in one
+    call, which indicators every model of the assertions fixes to true.
+    """
+    positive = [_indicator('keep', i) for i in range(len(conjuncts))]
+
+    solver.push()
+    try:
+        for i, conjunct in enumerate(conjuncts):
+            solver.add(positive[i] == conjunct)
+
+        res, consequences = solver.consequences([], positive)
+    finally:
+        solver.pop()
+
+    if res == unknown and "timeout" in solver.reason_unknown():
+        raise SymbolicTimeoutException()
+
+    if res != sat:
+        # conservative: nothing is removed
+        return [False] * len(conjuncts)
+
+    # Implies(True, p) when p is fixed to true, Implies(True, Not(p)) to false
+    fixed = {consequence.arg(1).get_id() for consequence in consequences}
+
+    return [literal.get_id() in fixed for literal in positive]
@@ -0,0 +1,112 @@
+import heapq
+from typing import Any, Optional
+
+from src.app.models.symbolic_model import SymbolicReport
+
+
+LISTS = ('reductions', 'pruned', 'uncovered', 'cases')
+
+METADATA_COUNTERS = ('solverQueries', 'queryCacheHits', 'intervalHits', 'witnessHits',
+                     'reusedNodes', 'resolvedNodes', 'renderSeconds')
+
+
+def plan_split(nodes: list[dict[str, Any]], parts: int) -> list[str]:
+    """
+    Roots of the subtrees a split run explores separately: the largest
+    subtree on the frontier is replaced by its children until there are
+    `parts` of them. Only CONDITIONAL roots are split off, END nodes are
+    left to the part that explores the rest of the flow.
+    """
+    children: dict[Optional[str], list[dict[str, Any]]] = {}
+    for node in nodes:
+        children.setdefault(node['parentNodeId'], []).append(node)
+
+    start = next((n for n in nodes if n['nodeType'] == 'START'), None)
+    if start is None:
+        return []
+
+    # subtree sizes, from START down (nodes in cycles are never reached)
+    order: list[dict[str, Any]] = []
+    visited = {start['nodeId']}
+    pending = [start]
+    while pending:
+        node = pending.pop()
+        order.append(node)
+        for child in children.get(node['nodeId'], []):
+            if child['nodeId'] not in visited:
+                visited.add(child['nodeId'])
+                pending.append(child)
+
+    sizes: dict[str, int] = {}
+    for node in reversed(order):
+        sizes[node['nodeId']] = 1 + sum(
+            sizes.get(c['nodeId'], 0) for c in children.get(node['nodeId'], []))
+
+    frontier = [(-sizes[c['nodeId']], i, c)
+                for i, c in enumerate(children.get(start['nodeId'], []))]
+    heapq.heapify(frontier)
+    leaves: list[dict[str, Any]] = []
+    counter = len(frontier)
+
+    while frontier and len(frontier) + len(leaves) < parts:
+        _, _, node = heapq.heappop(frontier)
+        below = children.get(node['nodeId'], [])
+        if not below:
+            leaves.append(node)
+            continue
+
+        for child in below:
+            counter += 1
+            heapq.heappush(frontier, (-sizes.get(child['nodeId'], 1), counter, child))
+
+    cut = [node['nodeId'] for _, _, node in frontier
+           if node['nodeType'] == 'CONDITIONAL' and children.get(node['nodeId'])]
+
+    return cut if len(cut) > 1 else []
+
+
+def merge_parts(top: dict[str, Any], parts: dict[str, Optional[dict[str, Any]]],
+                total_end_nodes: int) -> Optional[SymbolicReport]:
+    """
+    Report of a split run, with every list in the order a sequential run
+    produces it: the segments of `top` with each cut subtree inserted where
+    `top` reached it. None if a subtree `top` reached was not reached by
+    its own part (the solver answered differently on the path to it).
+
+    ZF texts are rendered by each part, from the reverse map it built, and
+    may read differently than in a sequential run. So may the texts of two
+    sequential runs: Z3 orders the operands of simplified expressions by
+    AST id, which depends on everything the process translated before.
+    """
+    merged: dict[str, list[Any]] = {name: [] for name in LISTS}
+    # counters are added up below, the rest is the same for every part
+    metadata = dict(top['metadata'])
+
+    previous = (0, 0, 0, 0)
+    segments = [(node_id, marks) for node_id, marks in top['splits']]
+    end = tuple(len(top[name]) for name in LISTS)
+
+    for node_id, marks in segments + [(None, end)]:
+        for i, name in enumerate(LISTS):
+            merged[name].extend(top[name][previous[i]:marks[i]])
+        previous = marks
+
+        if node_id is None:
+            continue
+
+        part = parts.get(node_id)
+        if part is None:
+            return None
+
+        for name in LISTS:
+            merged[name].extend(part[name])
+        for name in METADATA_COUNTERS:
+            metadata[name] += part['metadata'][name]
+
+    covered = {case['endNodeId'] for case in merged['cases'] if case['concrete'] is not None}
+
+    return SymbolicReport.model_validate({
+        **merged,
+        'coverage': {'endCount': len(covered), 'totalEndNodes': total_end_nodes},
+        'metadata': metadata,
+    })
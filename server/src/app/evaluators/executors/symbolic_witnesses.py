@@ -0,0 +1,80 @@
+import math
+from typing import Any, Optional, Sequence
+from z3 import (   # type: ignore
+    is_true,
+
+    Model,
+    BoolVal,
+    ExprRef,
+    RealVal,
+    StringVal,
+    Z3_BOOL_SORT,
+    Z3_REAL_SORT,
+    Z3_SEQ_SORT,
+)
+
+from src.app.evaluators.transformers import ExprMap
+
+
+def _value(var: ExprRef, value: Any) -> Optional[ExprRef]:
+    kind = var.sort().kind()
+
+    if kind == Z3_BOOL_SORT and isinstance(value, bool):
+        return BoolVal(value)
+
+    if kind == Z3_REAL_SORT and isinstance(value, (int, float)) and not isinstance(value, bool):
+        return RealVal(value) if math.isfinite(value) else None
+
+    if kind == Z3_SEQ_SORT and isinstance(value, str):
+        return StringVal(value)
+
+    return None
+
+
+class Witness:
+    """Inputs of a previous case, as a Z3 model of the current inputs."""
+    __slots__ = ('inputs', 'model', 'holds')
+
+    def __init__(self, inputs: dict[str, Any], model: Model) -> None:
+        self.inputs = inputs
+        self.model = model
+        # a branch condition is evaluated again as the constraint of its children
+        self.holds: ExprMap[bool] = ExprMap()
+
+    def satisfies(self, constraint: ExprRef) -> bool:
+        holds = self.holds.get(constraint)
+        if holds is None:
+            # exact: the model fixes every input, and whatever it completes
+            # (e.g. x / 0) is fixed for all the constraints of the path alike
+            holds = is_true(self.model.eval(constraint, model_completion=True))
+            self.holds[constraint] = holds
+
+        return holds
+
+
+def _witness(symbolic_vars: dict[str, ExprRef], payload: dict[str, Any]) -> Optional[Witness]:
+    # inputs were added, removed or retyped since: it cannot be replayed
+    if set(payload) != set(symbolic_vars):
+        return None
+
+    model = Model()
+    for name, var in symbolic_vars.items():
+        value = _value(var, payload[name])
+        if value is None:
+            return None
+        model.update_value(var, value)
+
+    return Witness(dict(payload), model)
+
+
+def replay_witnesses(symbolic_vars: dict[str, ExprRef],
+                     payloads: Sequence[dict[str, Any]]) -> tuple[Witness, ...]:
+    """Witnesses of the concrete inputs of a previous run that fit the current inputs."""
+    witnesses: dict[tuple, Witness] = {}
+    for payload in payloads:
+        witness = _witness(symbolic_vars, payload)
+        # cases that share their inputs are kept once
+        if witness is not None:
+            witnesses.setdefault(tuple(sorted(witness.inputs.items())), witness)
+
+    return tuple(witnesses.values())
@@ -0,0 +1,136 @@
+from typing import Any, Optional
+
+import numpy as np
+
+from src.utils.cache import LRUCache
+from src.app.models.flow_model import Flow
+from src.app.core.config import get_settings
+from src.app.evaluators.plan import FlowPlan, flow_version, get_flow_plan
+from src.app.evaluators.cache import get_expression_cache
+from src.app.models.metadata_model import InputType
+from src.app.models.node_model import ConditionalNode, EndNode
+from src.app.evaluators.transformers import (
+    VectorizedExpression,
+    VectorizedTransformer,
+)
+
+
+settings = get_settings()
+
+input_kinds = {
+    InputType.NUMBER: 'number',
+    InputType.BOOL: 'bool',
+}
+dtypes = {
+    InputType.NUMBER: np.float64,
+    InputType.BOOL: np.bool_,
+}
+
+
+class VectorizedExecutor:
+    """Evaluates a whole batch of payloads at once over NumPy columns.
+
+    Each CONDITIONAL is computed as a mask over the rows that reached it and
+    the row indexes are routed down the true/false branches. Rows the engine
+    cannot decide (missing branch, division by zero) are left as None so the
+    caller can run them through ConcreteExecutor and report the error.
+    """
+
+    def __init__(self, plan: FlowPlan) -> None:
+        inputs = plan.start.metadata.inputs
+
+        if any(inp.type not in input_kinds for inp in inputs):
+            raise NotImplementedError(
+                'only number and bool inputs can be vectorized')
+
+        self.plan = plan
+        self.dtypes = {inp.displayName: dtypes[inp.type] for inp in inputs}
+
+        transformer = VectorizedTransformer(
+            {inp.displayName: input_kinds[inp.type] for inp in inputs}  # type: ignore
+        )
+
+        self.conditions: dict[str, VectorizedExpression] = {}
+        for node in plan.nodes.values():
+            if node.nodeType == 'CONDITIONAL' and node.nodeId not in plan.orphans:
+                assert isinstance(node, ConditionalNode)
+                tree = get_expression_cache().get(node.metadata.expression).tree
+                self.conditions[node.nodeId] = transformer.transform(tree)
+
+    def build_columns(self, payloads: list[dict[str, Any]]) -> dict[str, np.ndarray]:
+        return {
+            name: np.fromiter((p[name] for p in payloads), dtype=dtype, count=len(payloads))
+            for name, dtype in self.dtypes.items()
+        }
+
+    def execute(self, columns: dict[str, np.ndarray], size: int) -> np.ndarray:
+        """Returns the END node id reached by each row (None if undecided)."""
+        end_ids = np.full(size, None, dtype=object)
+
+        if self.plan.entry is None:
+            return end_ids
+
+        stack = [(self.plan.entry, np.arange(size))]
+
+        with np.errstate(all='ignore'):
+            while stack:
+                node, idx = stack.pop()
+
+                if len(idx) == 0:
+                    continue
+
+                if node.nodeType == 'END':
+                    end_ids[idx] = node.nodeId
+                    continue
+
+                if node.nodeType != 'CONDITIONAL':
+                    continue
+
+                condition = self.conditions[node.nodeId]
+                subset = {name: col[idx] for name, col in columns.items()}
+
+                undecided = np.zeros(idx.shape, dtype=np.bool_)
+                value = condition.fn(subset, undecided)
+
+                mask = np.broadcast_to(
+                    np.asarray(value) if condition.kind == 'bool'
+                    else np.not_equal(value, 0),
+                    idx.shape
+                )
+
+                if condition.fails:
+                    # rows that raise row-wise stay None, the others go on
+                    idx, mask = idx[~undecided], mask[~undecided]
+
+                for is_false_case, branch in ((False, idx[mask]), (True, idx[~mask])):
+                    next_node = self.plan.next_node(node.nodeId, is_false_case)
+                    if next_node is not None:
+                        stack.append((next_node, branch))
+
+        return end_ids
+
+    def response(self, end_node_id: str) -> Any:
+        node = self.plan.nodes[end_node_id]
+        assert isinstance(node, EndNode)
+        return node.metadata.response
+
+
+vectorized_executors: LRUCache[tuple, Optional[VectorizedExecutor]] = LRUCache(
+    settings.FLOW_PLAN_CACHE_MAX_SIZE)
+
+
+def get_vectorized_executor(flow: Flow) -> Optional[VectorizedExecutor]:
+    """Returns the flow's vectorized executor, or None if it can't be vectorized."""
+    key = flow_version(flow)
+
+    if key in vectorized_executors:
+        return vectorized_executors.get(key)
+
+    try:
+        executor: Optional[VectorizedExecutor] = VectorizedExecutor(
+            get_flow_plan(flow))
+    except Exception:
+        executor = None
+
+    vectorized_executors.set(key, executor)
+    return executor
@@ -1,4 +1,5 @@
-from .ebnf_parser import get_parser
+from .ebnf_parser import get_parser, normalize_expression
+from .tree_serializer import dump_tree, load_tree
 
 
-__all__ = ['get_parser']
+__all__ = ['dump_tree', 'get_parser', 'load_tree', 'normalize_expression']
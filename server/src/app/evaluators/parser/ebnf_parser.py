@@ -1,11 +1,53 @@
+import hashlib
+from pathlib import Path
+from typing import Any, Dict
+
+import lark
 from lark import Lark
 
 
-with open('grammar.lark', 'r') as file:
-    grammar = file.read()
+GRAMMAR_PATH = Path(__file__).with_name('grammar.lark')
+PARSER_OPTIONS: Dict[str, Any] = {'parser': 'lalr', 'lexer': 'contextual'}
+
+
+def read_grammar() -> str:
+    return GRAMMAR_PATH.read_text(encoding='utf-8')
+
+
+def grammar_digest(grammar: str) -> str:
+    """Identifies the tables built from `grammar` by the installed lark."""
+    options = ','.join(f'{k}={v}' for k, v in sorted(PARSER_OPTIONS.items()))
+    key = f'{lark.__version__}\0{options}\0{grammar}'
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+
+def build_parser(grammar: str) -> Lark:
+    return Lark(grammar, **PARSER_OPTIONS)
 
-parser = Lark(grammar)
+
+def load_parser() -> Lark:
+    """
+    Loads the LALR tables shipped in `lalr_tables.py`, rebuilding them
+    from `grammar.lark` when the module is missing or out of date.
+    """
+    grammar = read_grammar()
+    try:
+        from . import lalr_tables
+    except ImportError:
+        return build_parser(grammar)
+
+    if lalr_tables.GRAMMAR_DIGEST != grammar_digest(grammar):
+        return build_parser(grammar)
+
+    return Lark.load({'data': lalr_tables.DATA, 'memo': lalr_tables.MEMO})
+
+
+parser = load_parser()
 
 
 def get_parser() -> Lark:
     return parser
+
+
+def normalize_expression(expression: str) -> str:
+    return expression.replace("'", '"').strip()
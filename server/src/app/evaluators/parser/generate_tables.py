@@ -0,0 +1,46 @@
+"""
+Regenerates `lalr_tables.py` from `grammar.lark`.
+
+Run from the server directory after editing the grammar or upgrading lark:
+
+    python -m src.app.evaluators.parser.generate_tables
+"""
+from pathlib import Path
+from pprint import pformat
+
+from lark.grammar import Rule
+from lark.lexer import TerminalDef
+
+from src.app.evaluators.parser.ebnf_parser import (
+    build_parser,
+    grammar_digest,
+    read_grammar,
+)
+
+
+TABLES_PATH = Path(__file__).with_name('lalr_tables.py')
+
+HEADER = '''# Generated by `python -m src.app.evaluators.parser.generate_tables`.
+# Do not edit by hand: regenerate after changing grammar.lark.
+from lark import Token  # noqa: F401  (referenced by the serialized rules)
+'''
+
+
+def render_tables() -> str:
+    grammar = read_grammar()
+    data, memo = build_parser(grammar).memo_serialize([TerminalDef, Rule])
+
+    return (
+        f'{HEADER}\n'
+        f'GRAMMAR_DIGEST = {grammar_digest(grammar)!r}\n\n'
+        f'DATA = {pformat(data, width=100)}\n\n'
+        f'MEMO = {pformat(memo, width=100)}\n'
+    )
+
+
+def main() -> None:
+    TABLES_PATH.write_text(render_tables(), encoding='utf-8')
+
+
+if __name__ == '__main__':
+    main()
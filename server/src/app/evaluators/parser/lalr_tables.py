@@ -0,0 +1,2721 @@
+# Generated by `python -m src.app.evaluators.parser.generate_tables`.
+# Do not edit by hand: regenerate after changing grammar.lark.
+from lark import Token  # noqa: F401  (referenced by the serialized rules)
+
+GRAMMAR_DIGEST = 'be4119f9fa624dd793e49cfcd98c94fec082cf44bebe1d365ff7c6eacdbc5ca2'
+
+DATA = {'__type__': 'Lark',
+ 'options': {'_plugins': {},
+             'ambiguity': 'auto',
+             'cache': False,
+             'debug': False,
+             'edit_terminals': None,
+             'g_regex_flags': 0,
+             'import_paths': [],
+             'keep_all_tokens': False,
+             'lexer': 'contextual',
+             'lexer_callbacks': {},
+             'maybe_placeholders': True,
+             'ordered_sets': True,
+             'parser': 'lalr',
+             'postlex': None,
+             'priority': 'normal',
+             'propagate_positions': False,
+             'regex': False,
+             'source_path': None,
+             'start': ['start'],
+             'strict': False,
+             'transformer': None,
+             'tree_class': None,
+             'use_bytes': False},
+ 'parser': {'__type__': 'ParsingFrontend',
+            'lexer_conf': {'__type__': 'LexerConf',
+                           'g_regex_flags': 0,
+                           'ignore': ['WS'],
+                           'lexer_type': 'contextual',
+                           'terminals': [{'@': 0},
+                                         {'@': 1},
+                                         {'@': 2},
+                                         {'@': 3},
+                                         {'@': 4},
+                                         {'@': 5},
+                                         {'@': 6},
+                                         {'@': 7},
+                                         {'@': 8},
+                                         {'@': 9},
+                                         {'@': 10},
+                                         {'@': 11},
+                                         {'@': 12},
+                                         {'@': 13},
+                                         {'@': 14},
+                                         {'@': 15},
+                                         {'@': 16},
+                                         {'@': 17},
+                                         {'@': 18},
+                                         {'@': 19},
+                                         {'@': 20},
+                                         {'@': 21},
+                                         {'@': 22},
+                                         {'@': 23},
+                                         {'@': 24},
+                                         {'@': 25},
+                                         {'@': 26},
+                                         {'@': 27},
+                                         {'@': 28},
+                                         {'@': 29},
+                                         {'@': 30},
+                                         {'@': 31},
+                                         {'@': 32}],
+                           'use_bytes': False},
+            'parser': {'end_states': {'start': 83},
+                       'start_states': {'start': 3},
+                       'states': {0: {0: (1, {'@': 74}),
+                                      1: (1, {'@': 74}),
+                                      2: (1, {'@': 74}),
+                                      3: (1, {'@': 74}),
+                                      4: (1, {'@': 74}),
+                                      5: (1, {'@': 74}),
+                                      6: (1, {'@': 74}),
+                                      7: (1, {'@': 74}),
+                                      8: (1, {'@': 74}),
+                                      9: (1, {'@': 74}),
+                                      10: (1, {'@': 74}),
+                                      11: (1, {'@': 74}),
+                                      12: (1, {'@': 74}),
+                                      13: (1, {'@': 74}),
+                                      14: (1, {'@': 74}),
+                                      15: (1, {'@': 74}),
+                                      16: (1, {'@': 74}),
+                                      17: (1, {'@': 74}),
+                                      18: (1, {'@': 74}),
+                                      19: (1, {'@': 74}),
+                                      20: (1, {'@': 74})},
+                                  1: {19: (0, 36), 21: (0, 67), 22: (0, 103), 23: (0, 45)},
+                                  2: {0: (1, {'@': 76}),
+                                      1: (1, {'@': 76}),
+                                      2: (1, {'@': 76}),
+                                      4: (1, {'@': 76}),
+                                      5: (1, {'@': 76}),
+                                      6: (1, {'@': 76}),
+                                      7: (1, {'@': 76}),
+                                      8: (1, {'@': 76}),
+                                      9: (1, {'@': 76}),
+                                      10: (1, {'@': 76}),
+                                      11: (1, {'@': 76}),
+                                      12: (1, {'@': 76}),
+                                      13: (1, {'@': 76}),
+                                      14: (1, {'@': 76}),
+                                      15: (1, {'@': 76}),
+                                      16: (1, {'@': 76}),
+                                      17: (1, {'@': 76}),
+                                      18: (1, {'@': 76}),
+                                      19: (1, {'@': 76}),
+                                      20: (1, {'@': 76})},
+                                  3: {3: (0, 51),
+                                      14: (0, 96),
+                                      22: (0, 19),
+                                      23: (0, 6),
+                                      24: (0, 42),
+                                      25: (0, 34),
+                                      26: (0, 49),
+                                      27: (0, 14),
+                                      28: (0, 12),
+                                      29: (0, 9),
+                                      30: (0, 10),
+                                      31: (0, 4),
+                                      32: (0, 1),
+                                      33: (0, 99),
+                                      34: (0, 40),
+                                      35: (0, 102),
+                                      36: (0, 105),
+                                      37: (0, 47),
+                                      38: (0, 55),
+                                      39: (0, 35),
+                                      40: (0, 33),
+                                      41: (0, 66),
+                                      42: (0, 72),
+                                      43: (0, 23),
+                                      44: (0, 22),
+                                      45: (0, 29),
+                                      46: (0, 77),
+                                      47: (0, 83),
+                                      48: (0, 86)},
+                                  4: {0: (0, 44),
+                                      2: (0, 79),
+                                      5: (0, 13),
+                                      6: (1, {'@': 43}),
+                                      7: (1, {'@': 43}),
+                                      8: (1, {'@': 43}),
+                                      9: (0, 57),
+                                      10: (0, 24),
+                                      11: (0, 7),
+                                      12: (0, 62),
+                                      13: (0, 37),
+                                      14: (0, 38),
+                                      15: (1, {'@': 43}),
+                                      16: (1, {'@': 43}),
+                                      17: (1, {'@': 43}),
+                                      18: (1, {'@': 43}),
+                                      19: (1, {'@': 43}),
+                                      20: (1, {'@': 43}),
+                                      49: (0, 41)},
+                                  5: {15: (0, 17), 16: (0, 32)},
+                                  6: {0: (1, {'@': 81}),
+                                      1: (1, {'@': 81}),
+                                      2: (1, {'@': 81}),
+                                      3: (0, 87),
+                                      4: (1, {'@': 81}),
+                                      5: (1, {'@': 81}),
+                                      6: (1, {'@': 81}),
+                                      7: (1, {'@': 81}),
+                                      8: (1, {'@': 81}),
+                                      9: (1, {'@': 81}),
+                                      10: (1, {'@': 81}),
+                                      11: (1, {'@': 81}),
+                                      12: (1, {'@': 81}),
+                                      13: (1, {'@': 81}),
+                                      14: (1, {'@': 81}),
+                                      15: (1, {'@': 81}),
+                                      16: (1, {'@': 81}),
+                                      17: (1, {'@': 81}),
+                                      18: (1, {'@': 81}),
+                                      19: (1, {'@': 81}),
+                                      20: (1, {'@': 81}),
+                                      25: (0, 8),
+                                      50: (0, 30),
+                                      51: (0, 70)},
+                                  7: {3: (1, {'@': 50}),
+                                      14: (1, {'@': 50}),
+                                      22: (1, {'@': 50}),
+                                      23: (1, {'@': 50}),
+                                      25: (1, {'@': 50}),
+                                      30: (1, {'@': 50}),
+                                      32: (1, {'@': 50}),
+                                      34: (1, {'@': 50}),
+                                      39: (1, {'@': 50}),
+                                      48: (1, {'@': 50})},
+                                  8: {3: (0, 51),
+                                      14: (0, 96),
+                                      15: (0, 26),
+                                      22: (0, 19),
+                                      23: (0, 6),
+                                      24: (0, 42),
+                                      25: (0, 34),
+                                      26: (0, 49),
+                                      27: (0, 14),
+                                      28: (0, 63),
+                                      29: (0, 9),
+                                      30: (0, 10),
+                                      31: (0, 4),
+                                      32: (0, 1),
+                                      33: (0, 99),
+                                      34: (0, 40),
+                                      35: (0, 102),
+                                      36: (0, 105),
+                                      37: (0, 47),
+                                      38: (0, 55),
+                                      39: (0, 35),
+                                      40: (0, 33),
+                                      41: (0, 66),
+                                      42: (0, 72),
+                                      43: (0, 23),
+                                      44: (0, 22),
+                                      45: (0, 29),
+                                      46: (0, 77),
+                                      48: (0, 86)},
+                                  9: {0: (1, {'@': 57}),
+                                      1: (1, {'@': 57}),
+                                      2: (1, {'@': 57}),
+                                      4: (1, {'@': 57}),
+                                      5: (1, {'@': 57}),
+                                      6: (1, {'@': 57}),
+                                      7: (1, {'@': 57}),
+                                      8: (1, {'@': 57}),
+                                      9: (1, {'@': 57}),
+                                      10: (1, {'@': 57}),
+                                      11: (1, {'@': 57}),
+                                      12: (1, {'@': 57}),
+                                      13: (1, {'@': 57}),
+                                      14: (1, {'@': 57}),
+                                      15: (1, {'@': 57}),
+                                      16: (1, {'@': 57}),
+                                      17: (1, {'@': 57}),
+                                      18: (1, {'@': 57}),
+                                      19: (1, {'@': 57}),
+                                      20: (1, {'@': 57})},
+                                  10: {0: (1, {'@': 67}),
+                                       1: (1, {'@': 67}),
+                                       2: (1, {'@': 67}),
+                                       4: (1, {'@': 67}),
+                                       5: (1, {'@': 67}),
+                                       6: (1, {'@': 67}),
+                                       7: (1, {'@': 67}),
+                                       8: (1, {'@': 67}),
+                                       9: (1, {'@': 67}),
+                                       10: (1, {'@': 67}),
+                                       11: (1, {'@': 67}),
+                                       12: (1, {'@': 67}),
+                                       13: (1, {'@': 67}),
+                                       14: (1, {'@': 67}),
+                                       15: (1, {'@': 67}),
+                                       16: (1, {'@': 67}),
+                                       17: (1, {'@': 67}),
+                                       18: (1, {'@': 67}),
+                                       19: (1, {'@': 67}),
+                                       20: (1, {'@': 67})},
+                                  11: {6: (1, {'@': 40}),
+                                       7: (1, {'@': 40}),
+                                       8: (1, {'@': 40}),
+                                       15: (1, {'@': 40}),
+                                       16: (1, {'@': 40}),
+                                       17: (1, {'@': 40}),
+                                       18: (1, {'@': 40}),
+                                       19: (1, {'@': 40}),
+                                       20: (1, {'@': 40})},
+                                  12: {8: (1, {'@': 33})},
+                                  13: {3: (1, {'@': 51}),
+                                       14: (1, {'@': 51}),
+                                       22: (1, {'@': 51}),
+                                       23: (1, {'@': 51}),
+                                       25: (1, {'@': 51}),
+                                       30: (1, {'@': 51}),
+                                       32: (1, {'@': 51}),
+                                       34: (1, {'@': 51}),
+                                       39: (1, {'@': 51}),
+                                       48: (1, {'@': 51})},
+                                  14: {0: (1, {'@': 66}),
+                                       1: (1, {'@': 66}),
+                                       2: (1, {'@': 66}),
+                                       4: (1, {'@': 66}),
+                                       5: (1, {'@': 66}),
+                                       6: (1, {'@': 66}),
+                                       7: (1, {'@': 66}),
+                                       8: (1, {'@': 66}),
+                                       9: (1, {'@': 66}),
+                                       10: (1, {'@': 66}),
+                                       11: (1, {'@': 66}),
+                                       12: (1, {'@': 66}),
+                                       13: (1, {'@': 66}),
+                                       14: (1, {'@': 66}),
+                                       15: (1, {'@': 66}),
+                                       16: (1, {'@': 66}),
+                                       17: (1, {'@': 66}),
+                                       18: (1, {'@': 66}),
+                                       19: (1, {'@': 66}),
+                                       20: (1, {'@': 66})},
+                                  15: {15: (1, {'@': 90}), 16: (1, {'@': 90}), 17: (1, {'@': 90})},
+                                  16: {0: (1, {'@': 87}),
+                                       1: (1, {'@': 87}),
+                                       2: (1, {'@': 87}),
+                                       4: (1, {'@': 87}),
+                                       5: (1, {'@': 87}),
+                                       6: (1, {'@': 87}),
+                                       7: (1, {'@': 87}),
+                                       8: (1, {'@': 87}),
+                                       9: (1, {'@': 87}),
+                                       10: (1, {'@': 87}),
+                                       11: (1, {'@': 87}),
+                                       12: (1, {'@': 87}),
+                                       13: (1, {'@': 87}),
+                                       14: (1, {'@': 87}),
+                                       15: (1, {'@': 87}),
+                                       16: (1, {'@': 87}),
+                                       17: (1, {'@': 87}),
+                                       18: (1, {'@': 87}),
+                                       19: (1, {'@': 87}),
+                                       20: (1, {'@': 87})},
+                                  17: {0: (1, {'@': 86}),
+                                       1: (1, {'@': 86}),
+                                       2: (1, {'@': 86}),
+                                       4: (1, {'@': 86}),
+                                       5: (1, {'@': 86}),
+                                       6: (1, {'@': 86}),
+                                       7: (1, {'@': 86}),
+                                       8: (1, {'@': 86}),
+                                       9: (1, {'@': 86}),
+                                       10: (1, {'@': 86}),
+                                       11: (1, {'@': 86}),
+                                       12: (1, {'@': 86}),
+                                       13: (1, {'@': 86}),
+                                       14: (1, {'@': 86}),
+                                       15: (1, {'@': 86}),
+                                       16: (1, {'@': 86}),
+                                       17: (1, {'@': 86}),
+                                       18: (1, {'@': 86}),
+                                       19: (1, {'@': 86}),
+                                       20: (1, {'@': 86})},
+                                  18: {23: (0, 25)},
+                                  19: {0: (1, {'@': 68}),
+                                       1: (1, {'@': 68}),
+                                       2: (1, {'@': 68}),
+                                       4: (1, {'@': 68}),
+                                       5: (1, {'@': 68}),
+                                       6: (1, {'@': 68}),
+                                       7: (1, {'@': 68}),
+                                       8: (1, {'@': 68}),
+                                       9: (1, {'@': 68}),
+                                       10: (1, {'@': 68}),
+                                       11: (1, {'@': 68}),
+                                       12: (1, {'@': 68}),
+                                       13: (1, {'@': 68}),
+                                       14: (1, {'@': 68}),
+                                       15: (1, {'@': 68}),
+                                       16: (1, {'@': 68}),
+                                       17: (1, {'@': 68}),
+                                       18: (1, {'@': 68}),
+                                       19: (1, {'@': 68}),
+                                       20: (1, {'@': 68})},
+                                  20: {16: (0, 31), 19: (0, 88)},
+                                  21: {0: (1, {'@': 83}),
+                                       1: (1, {'@': 83}),
+                                       2: (1, {'@': 83}),
+                                       4: (1, {'@': 83}),
+                                       5: (1, {'@': 83}),
+                                       6: (1, {'@': 83}),
+                                       7: (1, {'@': 83}),
+                                       8: (1, {'@': 83}),
+                                       9: (1, {'@': 83}),
+                                       10: (1, {'@': 83}),
+                                       11: (1, {'@': 83}),
+                                       12: (1, {'@': 83}),
+                                       13: (1, {'@': 83}),
+                                       14: (1, {'@': 83}),
+                                       15: (1, {'@': 83}),
+                                       16: (1, {'@': 83}),
+                                       17: (1, {'@': 83}),
+                                       18: (1, {'@': 83}),
+                                       19: (1, {'@': 83}),
+                                       20: (1, {'@': 83})},
+                                  22: {0: (1, {'@': 62}),
+                                       1: (1, {'@': 62}),
+                                       2: (1, {'@': 62}),
+                                       4: (1, {'@': 62}),
+                                       5: (1, {'@': 62}),
+                                       6: (1, {'@': 62}),
+                                       7: (1, {'@': 62}),
+                                       8: (1, {'@': 62}),
+                                       9: (1, {'@': 62}),
+                                       10: (1, {'@': 62}),
+                                       11: (1, {'@': 62}),
+                                       12: (1, {'@': 62}),
+                                       13: (1, {'@': 62}),
+                                       14: (1, {'@': 62}),
+                                       15: (1, {'@': 62}),
+                                       16: (1, {'@': 62}),
+                                       17: (1, {'@': 62}),
+                                       18: (1, {'@': 62}),
+                                       19: (1, {'@': 62}),
+                                       20: (1, {'@': 62})},
+                                  23: {0: (1, {'@': 59}),
+                                       1: (1, {'@': 59}),
+                                       2: (1, {'@': 59}),
+                                       4: (1, {'@': 59}),
+                                       5: (1, {'@': 59}),
+                                       6: (1, {'@': 59}),
+                                       7: (1, {'@': 59}),
+                                       8: (1, {'@': 59}),
+                                       9: (1, {'@': 59}),
+                                       10: (1, {'@': 59}),
+                                       11: (1, {'@': 59}),
+                                       12: (1, {'@': 59}),
+                                       13: (1, {'@': 59}),
+                                       14: (1, {'@': 59}),
+                                       15: (1, {'@': 59}),
+                                       16: (1, {'@': 59}),
+                                       17: (1, {'@': 59}),
+                                       18: (1, {'@': 59}),
+                                       19: (1, {'@': 59}),
+                                       20: (1, {'@': 59})},
+                                  24: {3: (1, {'@': 47}),
+                                       14: (1, {'@': 47}),
+                                       22: (1, {'@': 47}),
+                                       23: (1, {'@': 47}),
+                                       25: (1, {'@': 47}),
+                                       30: (1, {'@': 47}),
+                                       32: (1, {'@': 47}),
+                                       34: (1, {'@': 47}),
+                                       39: (1, {'@': 47}),
+                                       48: (1, {'@': 47})},
+                                  25: {0: (1, {'@': 94}),
+                                       1: (1, {'@': 94}),
+                                       2: (1, {'@': 94}),
+                                       3: (1, {'@': 94}),
+                                       4: (1, {'@': 94}),
+                                       5: (1, {'@': 94}),
+                                       6: (1, {'@': 94}),
+                                       7: (1, {'@': 94}),
+                                       8: (1, {'@': 94}),
+                                       9: (1, {'@': 94}),
+                                       10: (1, {'@': 94}),
+                                       11: (1, {'@': 94}),
+                                       12: (1, {'@': 94}),
+                                       13: (1, {'@': 94}),
+                                       14: (1, {'@': 94}),
+                                       15: (1, {'@': 94}),
+                                       16: (1, {'@': 94}),
+                                       17: (1, {'@': 94}),
+                                       18: (1, {'@': 94}),
+                                       19: (1, {'@': 94}),
+                                       20: (1, {'@': 94}),
+                                       51: (1, {'@': 94})},
+                                  26: {0: (1, {'@': 88}),
+                                       1: (1, {'@': 88}),
+                                       2: (1, {'@': 88}),
+                                       4: (1, {'@': 88}),
+                                       5: (1, {'@': 88}),
+                                       6: (1, {'@': 88}),
+                                       7: (1, {'@': 88}),
+                                       8: (1, {'@': 88}),
+                                       9: (1, {'@': 88}),
+                                       10: (1, {'@': 88}),
+                                       11: (1, {'@': 88}),
+                                       12: (1, {'@': 88}),
+                                       13: (1, {'@': 88}),
+                                       14: (1, {'@': 88}),
+                                       15: (1, {'@': 88}),
+                                       16: (1, {'@': 88}),
+                                       17: (1, {'@': 88}),
+                                       18: (1, {'@': 88}),
+                                       19: (1, {'@': 88}),
+                                       20: (1, {'@': 88})},
+                                  27: {16: (1, {'@': 79}), 19: (1, {'@': 79})},
+                                  28: {3: (0, 51),
+                                       14: (0, 96),
+                                       22: (0, 19),
+                                       23: (0, 6),
+                                       25: (0, 34),
+                                       26: (0, 49),
+                                       27: (0, 14),
+                                       29: (0, 98),
+                                       30: (0, 10),
+                                       32: (0, 1),
+                                       33: (0, 99),
+                                       34: (0, 40),
+                                       39: (0, 35),
+                                       40: (0, 33),
+                                       43: (0, 23),
+                                       44: (0, 22),
+                                       46: (0, 77),
+                                       48: (0, 86)},
+                                  29: {3: (0, 51),
+                                       14: (0, 96),
+                                       22: (0, 19),
+                                       23: (0, 6),
+                                       24: (0, 42),
+                                       25: (0, 34),
+                                       26: (0, 49),
+                                       27: (0, 14),
+                                       29: (0, 9),
+                                       30: (0, 10),
+                                       31: (0, 4),
+                                       32: (0, 1),
+                                       33: (0, 99),
+                                       34: (0, 40),
+                                       36: (0, 105),
+                                       39: (0, 35),
+                                       40: (0, 33),
+                                       41: (0, 91),
+                                       43: (0, 23),
+                                       44: (0, 22),
+                                       45: (0, 29),
+                                       46: (0, 77),
+                                       48: (0, 86)},
+                                  30: {0: (1, {'@': 80}),
+                                       1: (1, {'@': 80}),
+                                       2: (1, {'@': 80}),
+                                       3: (0, 89),
+                                       4: (1, {'@': 80}),
+                                       5: (1, {'@': 80}),
+                                       6: (1, {'@': 80}),
+                                       7: (1, {'@': 80}),
+                                       8: (1, {'@': 80}),
+                                       9: (1, {'@': 80}),
+                                       10: (1, {'@': 80}),
+                                       11: (1, {'@': 80}),
+                                       12: (1, {'@': 80}),
+                                       13: (1, {'@': 80}),
+                                       14: (1, {'@': 80}),
+                                       15: (1, {'@': 80}),
+                                       16: (1, {'@': 80}),
+                                       17: (1, {'@': 80}),
+                                       18: (1, {'@': 80}),
+                                       19: (1, {'@': 80}),
+                                       20: (1, {'@': 80}),
+                                       51: (0, 18)},
+                                  31: {21: (0, 93), 22: (0, 103), 23: (0, 45)},
+                                  32: {3: (0, 51),
+                                       14: (0, 96),
+                                       22: (0, 19),
+                                       23: (0, 6),
+                                       24: (0, 42),
+                                       25: (0, 34),
+                                       26: (0, 49),
+                                       27: (0, 14),
+                                       28: (0, 15),
+                                       29: (0, 9),
+                                       30: (0, 10),
+                                       31: (0, 4),
+                                       32: (0, 1),
+                                       33: (0, 99),
+                                       34: (0, 40),
+                                       35: (0, 102),
+                                       36: (0, 105),
+                                       37: (0, 47),
+                                       38: (0, 55),
+                                       39: (0, 35),
+                                       40: (0, 33),
+                                       41: (0, 66),
+                                       42: (0, 72),
+                                       43: (0, 23),
+                                       44: (0, 22),
+                                       45: (0, 29),
+                                       46: (0, 77),
+                                       48: (0, 86)},
+                                  33: {0: (1, {'@': 61}),
+                                       1: (1, {'@': 61}),
+                                       2: (1, {'@': 61}),
+                                       4: (1, {'@': 61}),
+                                       5: (1, {'@': 61}),
+                                       6: (1, {'@': 61}),
+                                       7: (1, {'@': 61}),
+                                       8: (1, {'@': 61}),
+                                       9: (1, {'@': 61}),
+                                       10: (1, {'@': 61}),
+                                       11: (1, {'@': 61}),
+                                       12: (1, {'@': 61}),
+                                       13: (1, {'@': 61}),
+                                       14: (1, {'@': 61}),
+                                       15: (1, {'@': 61}),
+                                       16: (1, {'@': 61}),
+                                       17: (1, {'@': 61}),
+                                       18: (1, {'@': 61}),
+                                       19: (1, {'@': 61}),
+                                       20: (1, {'@': 61})},
+                                  34: {3: (0, 51),
+                                       14: (0, 96),
+                                       22: (0, 19),
+                                       23: (0, 6),
+                                       24: (0, 42),
+                                       25: (0, 34),
+                                       26: (0, 49),
+                                       27: (0, 14),
+                                       28: (0, 75),
+                                       29: (0, 9),
+                                       30: (0, 10),
+                                       31: (0, 4),
+                                       32: (0, 1),
+                                       33: (0, 99),
+                                       34: (0, 40),
+                                       35: (0, 102),
+                                       36: (0, 105),
+                                       37: (0, 47),
+                                       38: (0, 55),
+                                       39: (0, 35),
+                                       40: (0, 33),
+                                       41: (0, 66),
+                                       42: (0, 72),
+                                       43: (0, 23),
+                                       44: (0, 22),
+                                       45: (0, 29),
+                                       46: (0, 77),
+                                       48: (0, 86)},
+                                  35: {0: (1, {'@': 69}),
+                                       1: (1, {'@': 69}),
+                                       2: (1, {'@': 69}),
+                                       4: (1, {'@': 69}),
+                                       5: (1, {'@': 69}),
+                                       6: (1, {'@': 69}),
+                                       7: (1, {'@': 69}),
+                                       8: (1, {'@': 69}),
+                                       9: (1, {'@': 69}),
+                                       10: (1, {'@': 69}),
+                                       11: (1, {'@': 69}),
+                                       12: (1, {'@': 69}),
+                                       13: (1, {'@': 69}),
+                                       14: (1, {'@': 69}),
+                                       15: (1, {'@': 69}),
+                                       16: (1, {'@': 69}),
+                                       17: (1, {'@': 69}),
+                                       18: (1, {'@': 69}),
+                                       19: (1, {'@': 69}),
+                                       20: (1, {'@': 69})},
+                                  36: {0: (1, {'@': 77}),
+                                       1: (1, {'@': 77}),
+                                       2: (1, {'@': 77}),
+                                       4: (1, {'@': 77}),
+                                       5: (1, {'@': 77}),
+                                       6: (1, {'@': 77}),
+                                       7: (1, {'@': 77}),
+                                       8: (1, {'@': 77}),
+                                       9: (1, {'@': 77}),
+                                       10: (1, {'@': 77}),
+                                       11: (1, {'@': 77}),
+                                       12: (1, {'@': 77}),
+                                       13: (1, {'@': 77}),
+                                       14: (1, {'@': 77}),
+                                       15: (1, {'@': 77}),
+                                       16: (1, {'@': 77}),
+                                       17: (1, {'@': 77}),
+                                       18: (1, {'@': 77}),
+                                       19: (1, {'@': 77}),
+                                       20: (1, {'@': 77})},
+                                  37: {3: (0, 51),
+                                       14: (0, 96),
+                                       22: (0, 19),
+                                       23: (0, 6),
+                                       24: (0, 39),
+                                       25: (0, 34),
+                                       26: (0, 49),
+                                       27: (0, 14),
+                                       29: (0, 9),
+                                       30: (0, 10),
+                                       32: (0, 1),
+                                       33: (0, 99),
+                                       34: (0, 40),
+                                       39: (0, 35),
+                                       40: (0, 33),
+                                       43: (0, 23),
+                                       44: (0, 22),
+                                       46: (0, 77),
+                                       48: (0, 86)},
+                                  38: {3: (0, 51),
+                                       14: (0, 96),
+                                       22: (0, 19),
+                                       23: (0, 6),
+                                       24: (0, 104),
+                                       25: (0, 34),
+                                       26: (0, 49),
+                                       27: (0, 14),
+                                       29: (0, 9),
+                                       30: (0, 10),
+                                       32: (0, 1),
+                                       33: (0, 99),
+                                       34: (0, 40),
+                                       39: (0, 35),
+                                       40: (0, 33),
+                                       43: (0, 23),
+                                       44: (0, 22),
+                                       46: (0, 77),
+                                       48: (0, 86)},
+                                  39: {0: (1, {'@': 52}),
+                                       1: (0, 106),
+                                       2: (1, {'@': 52}),
+                                       4: (0, 28),
+                                       5: (1, {'@': 52}),
+                                       6: (1, {'@': 52}),
+                                       7: (1, {'@': 52}),
+                                       8: (1, {'@': 52}),
+                                       9: (1, {'@': 52}),
+                                       10: (1, {'@': 52}),
+                                       11: (1, {'@': 52}),
+                                       12: (1, {'@': 52}),
+                                       13: (1, {'@': 52}),
+                                       14: (1, {'@': 52}),
+                                       15: (1, {'@': 52}),
+                                       16: (1, {'@': 52}),
+                                       17: (1, {'@': 52}),
+                                       18: (1, {'@': 52}),
+                                       19: (1, {'@': 52}),
+                                       20: (1, {'@': 52})},
+                                  40: {0: (1, {'@': 71}),
+                                       1: (1, {'@': 71}),
+                                       2: (1, {'@': 71}),
+                                       4: (1, {'@': 71}),
+                                       5: (1, {'@': 71}),
+                                       6: (1, {'@': 71}),
+                                       7: (1, {'@': 71}),
+                                       8: (1, {'@': 71}),
+                                       9: (1, {'@': 71}),
+                                       10: (1, {'@': 71}),
+                                       11: (1, {'@': 71}),
+                                       12: (1, {'@': 71}),
+                                       13: (1, {'@': 71}),
+                                       14: (1, {'@': 71}),
+                                       15: (1, {'@': 71}),
+                                       16: (1, {'@': 71}),
+                                       17: (1, {'@': 71}),
+                                       18: (1, {'@': 71}),
+                                       19: (1, {'@': 71}),
+                                       20: (1, {'@': 71})},
+                                  41: {3: (0, 51),
+                                       14: (0, 96),
+                                       22: (0, 19),
+                                       23: (0, 6),
+                                       24: (0, 42),
+                                       25: (0, 34),
+                                       26: (0, 49),
+                                       27: (0, 14),
+                                       29: (0, 9),
+                                       30: (0, 10),
+                                       31: (0, 61),
+                                       32: (0, 1),
+                                       33: (0, 99),
+                                       34: (0, 40),
+                                       39: (0, 35),
+                                       40: (0, 33),
+                                       43: (0, 23),
+                                       44: (0, 22),
+                                       46: (0, 77),
+                                       48: (0, 86)},
+                                  42: {0: (1, {'@': 54}),
+                                       1: (0, 106),
+                                       2: (1, {'@': 54}),
+                                       4: (0, 28),
+                                       5: (1, {'@': 54}),
+                                       6: (1, {'@': 54}),
+                                       7: (1, {'@': 54}),
+                                       8: (1, {'@': 54}),
+                                       9: (1, {'@': 54}),
+                                       10: (1, {'@': 54}),
+                                       11: (1, {'@': 54}),
+                                       12: (1, {'@': 54}),
+                                       13: (1, {'@': 54}),
+                                       14: (1, {'@': 54}),
+                                       15: (1, {'@': 54}),
+                                       16: (1, {'@': 54}),
+                                       17: (1, {'@': 54}),
+                                       18: (1, {'@': 54}),
+                                       19: (1, {'@': 54}),
+                                       20: (1, {'@': 54})},
+                                  43: {3: (0, 51),
+                                       14: (0, 96),
+                                       22: (0, 19),
+                                       23: (0, 6),
+                                       24: (0, 42),
+                                       25: (0, 34),
+                                       26: (0, 49),
+                                       27: (0, 14),
+                                       28: (0, 76),
+                                       29: (0, 9),
+                                       30: (0, 10),
+                                       31: (0, 4),
+                                       32: (0, 1),
+                                       33: (0, 99),
+                                       34: (0, 40),
+                                       35: (0, 102),
+                                       36: (0, 105),
+                                       37: (0, 47),
+                                       38: (0, 55),
+                                       39: (0, 35),
+                                       40: (0, 33),
+                                       41: (0, 66),
+                                       42: (0, 72),
+                                       43: (0, 23),
+                                       44: (0, 22),
+                                       45: (0, 29),
+                                       46: (0, 77),
+                                       48: (0, 86)},
+                                  44: {3: (1, {'@': 45}),
+                                       14: (1, {'@': 45}),
+                                       22: (1, {'@': 45}),
+                                       23: (1, {'@': 45}),
+                                       25: (1, {'@': 45}),
+                                       30: (1, {'@': 45}),
+                                       32: (1, {'@': 45}),
+                                       34: (1, {'@': 45}),
+                                       39: (1, {'@': 45}),
+                                       48: (1, {'@': 45})},
+                                  45: {52: (0, 82)},
+                                  46: {3: (0, 51),
+                                       14: (0, 96),
+                                       22: (0, 19),
+                                       23: (0, 6),
+                                       24: (0, 42),
+                                       25: (0, 34),
+                                       26: (0, 49),
+                                       27: (0, 14),
+                                       29: (0, 9),
+                                       30: (0, 10),
+                                       31: (0, 4),
+                                       32: (0, 1),
+                                       33: (0, 99),
+                                       34: (0, 40),
+                                       36: (0, 105),
+                                       39: (0, 35),
+                                       40: (0, 33),
+                                       41: (0, 11),
+                                       43: (0, 23),
+                                       44: (0, 22),
+                                       45: (0, 29),
+                                       46: (0, 77),
+                                       48: (0, 86)},
+                                  47: {6: (0, 90),
+                                       8: (1, {'@': 35}),
+                                       15: (1, {'@': 35}),
+                                       16: (1, {'@': 35}),
+                                       17: (1, {'@': 35}),
+                                       18: (1, {'@': 35}),
+                                       19: (1, {'@': 35}),
+                                       20: (1, {'@': 35})},
+                                  48: {17: (0, 21)},
+                                  49: {0: (1, {'@': 64}),
+                                       1: (1, {'@': 64}),
+                                       2: (1, {'@': 64}),
+                                       4: (1, {'@': 64}),
+                                       5: (1, {'@': 64}),
+                                       6: (1, {'@': 64}),
+                                       7: (1, {'@': 64}),
+                                       8: (1, {'@': 64}),
+                                       9: (1, {'@': 64}),
+                                       10: (1, {'@': 64}),
+                                       11: (1, {'@': 64}),
+                                       12: (1, {'@': 64}),
+                                       13: (1, {'@': 64}),
+                                       14: (1, {'@': 64}),
+                                       15: (1, {'@': 64}),
+                                       16: (1, {'@': 64}),
+                                       17: (1, {'@': 64}),
+                                       18: (1, {'@': 64}),
+                                       19: (1, {'@': 64}),
+                                       20: (1, {'@': 64})},
+                                  50: {18: (0, 54)},
+                                  51: {3: (0, 51),
+                                       14: (0, 96),
+                                       17: (0, 0),
+                                       22: (0, 19),
+                                       23: (0, 6),
+                                       24: (0, 42),
+                                       25: (0, 34),
+                                       26: (0, 49),
+                                       27: (0, 14),
+                                       28: (0, 95),
+                                       29: (0, 9),
+                                       30: (0, 10),
+                                       31: (0, 4),
+                                       32: (0, 1),
+                                       33: (0, 99),
+                                       34: (0, 40),
+                                       35: (0, 102),
+                                       36: (0, 105),
+                                       37: (0, 47),
+                                       38: (0, 55),
+                                       39: (0, 35),
+                                       40: (0, 33),
+                                       41: (0, 66),
+                                       42: (0, 72),
+                                       43: (0, 23),
+                                       44: (0, 22),
+                                       45: (0, 29),
+                                       46: (0, 77),
+                                       48: (0, 86)},
+                                  52: {0: (1, {'@': 72}),
+                                       1: (1, {'@': 72}),
+                                       2: (1, {'@': 72}),
+                                       3: (1, {'@': 72}),
+                                       4: (1, {'@': 72}),
+                                       5: (1, {'@': 72}),
+                                       6: (1, {'@': 72}),
+                                       7: (1, {'@': 72}),
+                                       8: (1, {'@': 72}),
+                                       9: (1, {'@': 72}),
+                                       10: (1, {'@': 72}),
+                                       11: (1, {'@': 72}),
+                                       12: (1, {'@': 72}),
+                                       13: (1, {'@': 72}),
+                                       14: (1, {'@': 72}),
+                                       15: (1, {'@': 72}),
+                                       16: (1, {'@': 72}),
+                                       17: (1, {'@': 72}),
+                                       18: (1, {'@': 72}),
+                                       19: (1, {'@': 72}),
+                                       20: (1, {'@': 72})},
+                                  53: {0: (1, {'@': 65}),
+                                       1: (1, {'@': 65}),
+                                       2: (1, {'@': 65}),
+                                       3: (0, 65),
+                                       4: (1, {'@': 65}),
+                                       5: (1, {'@': 65}),
+                                       6: (1, {'@': 65}),
+                                       7: (1, {'@': 65}),
+                                       8: (1, {'@': 65}),
+                                       9: (1, {'@': 65}),
+                                       10: (1, {'@': 65}),
+                                       11: (1, {'@': 65}),
+                                       12: (1, {'@': 65}),
+                                       13: (1, {'@': 65}),
+                                       14: (1, {'@': 65}),
+                                       15: (1, {'@': 65}),
+                                       16: (1, {'@': 65}),
+                                       17: (1, {'@': 65}),
+                                       18: (1, {'@': 65}),
+                                       19: (1, {'@': 65}),
+                                       20: (1, {'@': 65})},
+                                  54: {3: (0, 51),
+                                       14: (0, 96),
+                                       22: (0, 19),
+                                       23: (0, 6),
+                                       24: (0, 42),
+                                       25: (0, 34),
+                                       26: (0, 49),
+                                       27: (0, 14),
+                                       28: (0, 101),
+                                       29: (0, 9),
+                                       30: (0, 10),
+                                       31: (0, 4),
+                                       32: (0, 1),
+                                       33: (0, 99),
+                                       34: (0, 40),
+                                       35: (0, 102),
+                                       36: (0, 105),
+                                       37: (0, 47),
+                                       38: (0, 55),
+                                       39: (0, 35),
+                                       40: (0, 33),
+                                       41: (0, 66),
+                                       42: (0, 72),
+                                       43: (0, 23),
+                                       44: (0, 22),
+                                       45: (0, 29),
+                                       46: (0, 77),
+                                       48: (0, 86)},
+                                  55: {3: (0, 51),
+                                       14: (0, 96),
+                                       22: (0, 19),
+                                       23: (0, 6),
+                                       24: (0, 42),
+                                       25: (0, 34),
+                                       26: (0, 49),
+                                       27: (0, 14),
+                                       28: (0, 50),
+                                       29: (0, 9),
+                                       30: (0, 10),
+                                       31: (0, 4),
+                                       32: (0, 1),
+                                       33: (0, 99),
+                                       34: (0, 40),
+                                       35: (0, 102),
+                                       36: (0, 105),
+                                       37: (0, 47),
+                                       38: (0, 55),
+                                       39: (0, 35),
+                                       40: (0, 33),
+                                       41: (0, 66),
+                                       42: (0, 72),
+                                       43: (0, 23),
+                                       44: (0, 22),
+                                       45: (0, 29),
+                                       46: (0, 77),
+                                       48: (0, 86)},
+                                  56: {0: (1, {'@': 93}),
+                                       1: (1, {'@': 93}),
+                                       2: (1, {'@': 93}),
+                                       3: (1, {'@': 93}),
+                                       4: (1, {'@': 93}),
+                                       5: (1, {'@': 93}),
+                                       6: (1, {'@': 93}),
+                                       7: (1, {'@': 93}),
+                                       8: (1, {'@': 93}),
+                                       9: (1, {'@': 93}),
+                                       10: (1, {'@': 93}),
+                                       11: (1, {'@': 93}),
+                                       12: (1, {'@': 93}),
+                                       13: (1, {'@': 93}),
+                                       14: (1, {'@': 93}),
+                                       15: (1, {'@': 93}),
+                                       16: (1, {'@': 93}),
+                                       17: (1, {'@': 93}),
+                                       18: (1, {'@': 93}),
+                                       19: (1, {'@': 93}),
+                                       20: (1, {'@': 93}),
+                                       51: (1, {'@': 93})},
+                                  57: {3: (1, {'@': 46}),
+                                       14: (1, {'@': 46}),
+                                       22: (1, {'@': 46}),
+                                       23: (1, {'@': 46}),
+                                       25: (1, {'@': 46}),
+                                       30: (1, {'@': 46}),
+                                       32: (1, {'@': 46}),
+                                       34: (1, {'@': 46}),
+                                       39: (1, {'@': 46}),
+                                       48: (1, {'@': 46})},
+                                  58: {0: (1, {'@': 73}),
+                                       1: (1, {'@': 73}),
+                                       2: (1, {'@': 73}),
+                                       3: (1, {'@': 73}),
+                                       4: (1, {'@': 73}),
+                                       5: (1, {'@': 73}),
+                                       6: (1, {'@': 73}),
+                                       7: (1, {'@': 73}),
+                                       8: (1, {'@': 73}),
+                                       9: (1, {'@': 73}),
+                                       10: (1, {'@': 73}),
+                                       11: (1, {'@': 73}),
+                                       12: (1, {'@': 73}),
+                                       13: (1, {'@': 73}),
+                                       14: (1, {'@': 73}),
+                                       15: (1, {'@': 73}),
+                                       16: (1, {'@': 73}),
+                                       17: (1, {'@': 73}),
+                                       18: (1, {'@': 73}),
+                                       19: (1, {'@': 73}),
+                                       20: (1, {'@': 73})},
+                                  59: {0: (1, {'@': 82}),
+                                       1: (1, {'@': 82}),
+                                       2: (1, {'@': 82}),
+                                       4: (1, {'@': 82}),
+                                       5: (1, {'@': 82}),
+                                       6: (1, {'@': 82}),
+                                       7: (1, {'@': 82}),
+                                       8: (1, {'@': 82}),
+                                       9: (1, {'@': 82}),
+                                       10: (1, {'@': 82}),
+                                       11: (1, {'@': 82}),
+                                       12: (1, {'@': 82}),
+                                       13: (1, {'@': 82}),
+                                       14: (1, {'@': 82}),
+                                       15: (1, {'@': 82}),
+                                       16: (1, {'@': 82}),
+                                       17: (1, {'@': 82}),
+                                       18: (1, {'@': 82}),
+                                       19: (1, {'@': 82}),
+                                       20: (1, {'@': 82})},
+                                  60: {0: (1, {'@': 85}),
+                                       1: (1, {'@': 85}),
+                                       2: (1, {'@': 85}),
+                                       4: (1, {'@': 85}),
+                                       5: (1, {'@': 85}),
+                                       6: (1, {'@': 85}),
+                                       7: (1, {'@': 85}),
+                                       8: (1, {'@': 85}),
+                                       9: (1, {'@': 85}),
+                                       10: (1, {'@': 85}),
+                                       11: (1, {'@': 85}),
+                                       12: (1, {'@': 85}),
+                                       13: (1, {'@': 85}),
+                                       14: (1, {'@': 85}),
+                                       15: (1, {'@': 85}),
+                                       16: (1, {'@': 85}),
+                                       17: (1, {'@': 85}),
+                                       18: (1, {'@': 85}),
+                                       19: (1, {'@': 85}),
+                                       20: (1, {'@': 85})},
+                                  61: {6: (1, {'@': 44}),
+                                       7: (1, {'@': 44}),
+                                       8: (1, {'@': 44}),
+                                       13: (0, 37),
+                                       14: (0, 38),
+                                       15: (1, {'@': 44}),
+                                       16: (1, {'@': 44}),
+                                       17: (1, {'@': 44}),
+                                       18: (1, {'@': 44}),
+                                       19: (1, {'@': 44}),
+                                       20: (1, {'@': 44})},
+                                  62: {3: (1, {'@': 49}),
+                                       14: (1, {'@': 49}),
+                                       22: (1, {'@': 49}),
+                                       23: (1, {'@': 49}),
+                                       25: (1, {'@': 49}),
+                                       30: (1, {'@': 49}),
+                                       32: (1, {'@': 49}),
+                                       34: (1, {'@': 49}),
+                                       39: (1, {'@': 49}),
+                                       48: (1, {'@': 49})},
+                                  63: {15: (0, 16), 16: (0, 92), 53: (0, 5)},
+                                  64: {6: (1, {'@': 38}),
+                                       7: (0, 46),
+                                       8: (1, {'@': 38}),
+                                       15: (1, {'@': 38}),
+                                       16: (1, {'@': 38}),
+                                       17: (1, {'@': 38}),
+                                       18: (1, {'@': 38}),
+                                       19: (1, {'@': 38}),
+                                       20: (1, {'@': 38})},
+                                  65: {3: (0, 51),
+                                       14: (0, 96),
+                                       22: (0, 19),
+                                       23: (0, 6),
+                                       24: (0, 42),
+                                       25: (0, 34),
+                                       26: (0, 49),
+                                       27: (0, 14),
+                                       28: (0, 74),
+                                       29: (0, 9),
+                                       30: (0, 10),
+                                       31: (0, 4),
+                                       32: (0, 1),
+                                       33: (0, 99),
+                                       34: (0, 40),
+                                       35: (0, 102),
+                                       36: (0, 105),
+                                       37: (0, 47),
+                                       38: (0, 55),
+                                       39: (0, 35),
+                                       40: (0, 33),
+                                       41: (0, 66),
+                                       42: (0, 72),
+                                       43: (0, 23),
+                                       44: (0, 22),
+                                       45: (0, 29),
+                                       46: (0, 77),
+                                       48: (0, 86)},
+                                  66: {6: (1, {'@': 39}),
+                                       7: (1, {'@': 39}),
+                                       8: (1, {'@': 39}),
+                                       15: (1, {'@': 39}),
+                                       16: (1, {'@': 39}),
+                                       17: (1, {'@': 39}),
+                                       18: (1, {'@': 39}),
+                                       19: (1, {'@': 39}),
+                                       20: (1, {'@': 39})},
+                                  67: {16: (0, 97), 19: (0, 2), 54: (0, 20)},
+                                  68: {15: (1, {'@': 89}), 16: (1, {'@': 89}), 17: (1, {'@': 89})},
+                                  69: {17: (0, 84)},
+                                  70: {23: (0, 56)},
+                                  71: {0: (1, {'@': 58}),
+                                       1: (1, {'@': 58}),
+                                       2: (1, {'@': 58}),
+                                       4: (1, {'@': 58}),
+                                       5: (1, {'@': 58}),
+                                       6: (1, {'@': 58}),
+                                       7: (1, {'@': 58}),
+                                       8: (1, {'@': 58}),
+                                       9: (1, {'@': 58}),
+                                       10: (1, {'@': 58}),
+                                       11: (1, {'@': 58}),
+                                       12: (1, {'@': 58}),
+                                       13: (1, {'@': 58}),
+                                       14: (1, {'@': 58}),
+                                       15: (1, {'@': 58}),
+                                       16: (1, {'@': 58}),
+                                       17: (1, {'@': 58}),
+                                       18: (1, {'@': 58}),
+                                       19: (1, {'@': 58}),
+                                       20: (1, {'@': 58})},
+                                  72: {6: (1, {'@': 37}),
+                                       7: (0, 46),
+                                       8: (1, {'@': 37}),
+                                       15: (1, {'@': 37}),
+                                       16: (1, {'@': 37}),
+                                       17: (1, {'@': 37}),
+                                       18: (1, {'@': 37}),
+                                       19: (1, {'@': 37}),
+                                       20: (1, {'@': 37})},
+                                  73: {16: (0, 32), 17: (0, 52)},
+                                  74: {17: (0, 60)},
+                                  75: {15: (0, 53)},
+                                  76: {8: (1, {'@': 36}),
+                                       15: (1, {'@': 36}),
+                                       16: (1, {'@': 36}),
+                                       17: (1, {'@': 36}),
+                                       18: (1, {'@': 36}),
+                                       19: (1, {'@': 36}),
+                                       20: (1, {'@': 36})},
+                                  77: {0: (1, {'@': 60}),
+                                       1: (1, {'@': 60}),
+                                       2: (1, {'@': 60}),
+                                       4: (1, {'@': 60}),
+                                       5: (1, {'@': 60}),
+                                       6: (1, {'@': 60}),
+                                       7: (1, {'@': 60}),
+                                       8: (1, {'@': 60}),
+                                       9: (1, {'@': 60}),
+                                       10: (1, {'@': 60}),
+                                       11: (1, {'@': 60}),
+                                       12: (1, {'@': 60}),
+                                       13: (1, {'@': 60}),
+                                       14: (1, {'@': 60}),
+                                       15: (1, {'@': 60}),
+                                       16: (1, {'@': 60}),
+                                       17: (1, {'@': 60}),
+                                       18: (1, {'@': 60}),
+                                       19: (1, {'@': 60}),
+                                       20: (1, {'@': 60})},
+                                  78: {16: (1, {'@': 78}), 19: (1, {'@': 78})},
+                                  79: {3: (1, {'@': 48}),
+                                       14: (1, {'@': 48}),
+                                       22: (1, {'@': 48}),
+                                       23: (1, {'@': 48}),
+                                       25: (1, {'@': 48}),
+                                       30: (1, {'@': 48}),
+                                       32: (1, {'@': 48}),
+                                       34: (1, {'@': 48}),
+                                       39: (1, {'@': 48}),
+                                       48: (1, {'@': 48})},
+                                  80: {3: (0, 51),
+                                       14: (0, 96),
+                                       22: (0, 19),
+                                       23: (0, 6),
+                                       24: (0, 42),
+                                       25: (0, 34),
+                                       26: (0, 49),
+                                       27: (0, 14),
+                                       28: (0, 27),
+                                       29: (0, 9),
+                                       30: (0, 10),
+                                       31: (0, 4),
+                                       32: (0, 1),
+                                       33: (0, 99),
+                                       34: (0, 40),
+                                       35: (0, 102),
+                                       36: (0, 105),
+                                       37: (0, 47),
+                                       38: (0, 55),
+                                       39: (0, 35),
+                                       40: (0, 33),
+                                       41: (0, 66),
+                                       42: (0, 72),
+                                       43: (0, 23),
+                                       44: (0, 22),
+                                       45: (0, 29),
+                                       46: (0, 77),
+                                       48: (0, 86)},
+                                  81: {3: (0, 51),
+                                       14: (0, 96),
+                                       22: (0, 19),
+                                       23: (0, 6),
+                                       24: (0, 42),
+                                       25: (0, 34),
+                                       26: (0, 49),
+                                       27: (0, 14),
+                                       28: (0, 69),
+                                       29: (0, 9),
+                                       30: (0, 10),
+                                       31: (0, 4),
+                                       32: (0, 1),
+                                       33: (0, 99),
+                                       34: (0, 40),
+                                       35: (0, 102),
+                                       36: (0, 105),
+                                       37: (0, 47),
+                                       38: (0, 55),
+                                       39: (0, 35),
+                                       40: (0, 33),
+                                       41: (0, 66),
+                                       42: (0, 72),
+                                       43: (0, 23),
+                                       44: (0, 22),
+                                       45: (0, 29),
+                                       46: (0, 77),
+                                       48: (0, 86)},
+                                  82: {3: (0, 51),
+                                       14: (0, 96),
+                                       22: (0, 19),
+                                       23: (0, 6),
+                                       24: (0, 42),
+                                       25: (0, 34),
+                                       26: (0, 49),
+                                       27: (0, 14),
+                                       28: (0, 78),
+                                       29: (0, 9),
+                                       30: (0, 10),
+                                       31: (0, 4),
+                                       32: (0, 1),
+                                       33: (0, 99),
+                                       34: (0, 40),
+                                       35: (0, 102),
+                                       36: (0, 105),
+                                       37: (0, 47),
+                                       38: (0, 55),
+                                       39: (0, 35),
+                                       40: (0, 33),
+                                       41: (0, 66),
+                                       42: (0, 72),
+                                       43: (0, 23),
+                                       44: (0, 22),
+                                       45: (0, 29),
+                                       46: (0, 77),
+                                       48: (0, 86)},
+                                  83: {},
+                                  84: {0: (1, {'@': 84}),
+                                       1: (1, {'@': 84}),
+                                       2: (1, {'@': 84}),
+                                       4: (1, {'@': 84}),
+                                       5: (1, {'@': 84}),
+                                       6: (1, {'@': 84}),
+                                       7: (1, {'@': 84}),
+                                       8: (1, {'@': 84}),
+                                       9: (1, {'@': 84}),
+                                       10: (1, {'@': 84}),
+                                       11: (1, {'@': 84}),
+                                       12: (1, {'@': 84}),
+                                       13: (1, {'@': 84}),
+                                       14: (1, {'@': 84}),
+                                       15: (1, {'@': 84}),
+                                       16: (1, {'@': 84}),
+                                       17: (1, {'@': 84}),
+                                       18: (1, {'@': 84}),
+                                       19: (1, {'@': 84}),
+                                       20: (1, {'@': 84})},
+                                  85: {17: (0, 59)},
+                                  86: {0: (1, {'@': 70}),
+                                       1: (1, {'@': 70}),
+                                       2: (1, {'@': 70}),
+                                       4: (1, {'@': 70}),
+                                       5: (1, {'@': 70}),
+                                       6: (1, {'@': 70}),
+                                       7: (1, {'@': 70}),
+                                       8: (1, {'@': 70}),
+                                       9: (1, {'@': 70}),
+                                       10: (1, {'@': 70}),
+                                       11: (1, {'@': 70}),
+                                       12: (1, {'@': 70}),
+                                       13: (1, {'@': 70}),
+                                       14: (1, {'@': 70}),
+                                       15: (1, {'@': 70}),
+                                       16: (1, {'@': 70}),
+                                       17: (1, {'@': 70}),
+                                       18: (1, {'@': 70}),
+                                       19: (1, {'@': 70}),
+                                       20: (1, {'@': 70})},
+                                  87: {3: (0, 51),
+                                       14: (0, 96),
+                                       22: (0, 19),
+                                       23: (0, 6),
+                                       24: (0, 42),
+                                       25: (0, 34),
+                                       26: (0, 49),
+                                       27: (0, 14),
+                                       28: (0, 48),
+                                       29: (0, 9),
+                                       30: (0, 10),
+                                       31: (0, 4),
+                                       32: (0, 1),
+                                       33: (0, 99),
+                                       34: (0, 40),
+                                       35: (0, 102),
+                                       36: (0, 105),
+                                       37: (0, 47),
+                                       38: (0, 55),
+                                       39: (0, 35),
+                                       40: (0, 33),
+                                       41: (0, 66),
+                                       42: (0, 72),
+                                       43: (0, 23),
+                                       44: (0, 22),
+                                       45: (0, 29),
+                                       46: (0, 77),
+                                       48: (0, 86)},
+                                  88: {0: (1, {'@': 75}),
+                                       1: (1, {'@': 75}),
+                                       2: (1, {'@': 75}),
+                                       4: (1, {'@': 75}),
+                                       5: (1, {'@': 75}),
+                                       6: (1, {'@': 75}),
+                                       7: (1, {'@': 75}),
+                                       8: (1, {'@': 75}),
+                                       9: (1, {'@': 75}),
+                                       10: (1, {'@': 75}),
+                                       11: (1, {'@': 75}),
+                                       12: (1, {'@': 75}),
+                                       13: (1, {'@': 75}),
+                                       14: (1, {'@': 75}),
+                                       15: (1, {'@': 75}),
+                                       16: (1, {'@': 75}),
+                                       17: (1, {'@': 75}),
+                                       18: (1, {'@': 75}),
+                                       19: (1, {'@': 75}),
+                                       20: (1, {'@': 75})},
+                                  89: {3: (0, 51),
+                                       14: (0, 96),
+                                       22: (0, 19),
+                                       23: (0, 6),
+                                       24: (0, 42),
+                                       25: (0, 34),
+                                       26: (0, 49),
+                                       27: (0, 14),
+                                       28: (0, 85),
+                                       29: (0, 9),
+                                       30: (0, 10),
+                                       31: (0, 4),
+                                       32: (0, 1),
+                                       33: (0, 99),
+                                       34: (0, 40),
+                                       35: (0, 102),
+                                       36: (0, 105),
+                                       37: (0, 47),
+                                       38: (0, 55),
+                                       39: (0, 35),
+                                       40: (0, 33),
+                                       41: (0, 66),
+                                       42: (0, 72),
+                                       43: (0, 23),
+                                       44: (0, 22),
+                                       45: (0, 29),
+                                       46: (0, 77),
+                                       48: (0, 86)},
+                                  90: {3: (0, 51),
+                                       14: (0, 96),
+                                       22: (0, 19),
+                                       23: (0, 6),
+                                       24: (0, 42),
+                                       25: (0, 34),
+                                       26: (0, 49),
+                                       27: (0, 14),
+                                       29: (0, 9),
+                                       30: (0, 10),
+                                       31: (0, 4),
+                                       32: (0, 1),
+                                       33: (0, 99),
+                                       34: (0, 40),
+                                       36: (0, 105),
+                                       39: (0, 35),
+                                       40: (0, 33),
+                                       41: (0, 66),
+                                       42: (0, 64),
+                                       43: (0, 23),
+                                       44: (0, 22),
+                                       45: (0, 29),
+                                       46: (0, 77),
+                                       48: (0, 86)},
+                                  91: {6: (1, {'@': 41}),
+                                       7: (1, {'@': 41}),
+                                       8: (1, {'@': 41}),
+                                       15: (1, {'@': 41}),
+                                       16: (1, {'@': 41}),
+                                       17: (1, {'@': 41}),
+                                       18: (1, {'@': 41}),
+                                       19: (1, {'@': 41}),
+                                       20: (1, {'@': 41})},
+                                  92: {3: (0, 51),
+                                       14: (0, 96),
+                                       22: (0, 19),
+                                       23: (0, 6),
+                                       24: (0, 42),
+                                       25: (0, 34),
+                                       26: (0, 49),
+                                       27: (0, 14),
+                                       28: (0, 68),
+                                       29: (0, 9),
+                                       30: (0, 10),
+                                       31: (0, 4),
+                                       32: (0, 1),
+                                       33: (0, 99),
+                                       34: (0, 40),
+                                       35: (0, 102),
+                                       36: (0, 105),
+                                       37: (0, 47),
+                                       38: (0, 55),
+                                       39: (0, 35),
+                                       40: (0, 33),
+                                       41: (0, 66),
+                                       42: (0, 72),
+                                       43: (0, 23),
+                                       44: (0, 22),
+                                       45: (0, 29),
+                                       46: (0, 77),
+                                       48: (0, 86)},
+                                  93: {16: (1, {'@': 92}), 19: (1, {'@': 92})},
+                                  94: {16: (1, {'@': 91}), 19: (1, {'@': 91})},
+                                  95: {16: (0, 92), 17: (0, 58), 53: (0, 73)},
+                                  96: {3: (0, 51),
+                                       14: (0, 96),
+                                       22: (0, 19),
+                                       23: (0, 6),
+                                       25: (0, 34),
+                                       26: (0, 49),
+                                       27: (0, 14),
+                                       29: (0, 71),
+                                       30: (0, 10),
+                                       32: (0, 1),
+                                       33: (0, 99),
+                                       34: (0, 40),
+                                       39: (0, 35),
+                                       40: (0, 33),
+                                       43: (0, 23),
+                                       44: (0, 22),
+                                       46: (0, 77),
+                                       48: (0, 86)},
+                                  97: {21: (0, 94), 22: (0, 103), 23: (0, 45)},
+                                  98: {0: (1, {'@': 56}),
+                                       1: (1, {'@': 56}),
+                                       2: (1, {'@': 56}),
+                                       4: (1, {'@': 56}),
+                                       5: (1, {'@': 56}),
+                                       6: (1, {'@': 56}),
+                                       7: (1, {'@': 56}),
+                                       8: (1, {'@': 56}),
+                                       9: (1, {'@': 56}),
+                                       10: (1, {'@': 56}),
+                                       11: (1, {'@': 56}),
+                                       12: (1, {'@': 56}),
+                                       13: (1, {'@': 56}),
+                                       14: (1, {'@': 56}),
+                                       15: (1, {'@': 56}),
+                                       16: (1, {'@': 56}),
+                                       17: (1, {'@': 56}),
+                                       18: (1, {'@': 56}),
+                                       19: (1, {'@': 56}),
+                                       20: (1, {'@': 56})},
+                                  99: {0: (1, {'@': 63}),
+                                       1: (1, {'@': 63}),
+                                       2: (1, {'@': 63}),
+                                       3: (0, 81),
+                                       4: (1, {'@': 63}),
+                                       5: (1, {'@': 63}),
+                                       6: (1, {'@': 63}),
+                                       7: (1, {'@': 63}),
+                                       8: (1, {'@': 63}),
+                                       9: (1, {'@': 63}),
+                                       10: (1, {'@': 63}),
+                                       11: (1, {'@': 63}),
+                                       12: (1, {'@': 63}),
+                                       13: (1, {'@': 63}),
+                                       14: (1, {'@': 63}),
+                                       15: (1, {'@': 63}),
+                                       16: (1, {'@': 63}),
+                                       17: (1, {'@': 63}),
+                                       18: (1, {'@': 63}),
+                                       19: (1, {'@': 63}),
+                                       20: (1, {'@': 63})},
+                                  100: {0: (1, {'@': 55}),
+                                        1: (1, {'@': 55}),
+                                        2: (1, {'@': 55}),
+                                        4: (1, {'@': 55}),
+                                        5: (1, {'@': 55}),
+                                        6: (1, {'@': 55}),
+                                        7: (1, {'@': 55}),
+                                        8: (1, {'@': 55}),
+                                        9: (1, {'@': 55}),
+                                        10: (1, {'@': 55}),
+                                        11: (1, {'@': 55}),
+                                        12: (1, {'@': 55}),
+                                        13: (1, {'@': 55}),
+                                        14: (1, {'@': 55}),
+                                        15: (1, {'@': 55}),
+                                        16: (1, {'@': 55}),
+                                        17: (1, {'@': 55}),
+                                        18: (1, {'@': 55}),
+                                        19: (1, {'@': 55}),
+                                        20: (1, {'@': 55})},
+                                  101: {20: (0, 43)},
+                                  102: {8: (1, {'@': 34}),
+                                        15: (1, {'@': 34}),
+                                        16: (1, {'@': 34}),
+                                        17: (1, {'@': 34}),
+                                        18: (1, {'@': 34}),
+                                        19: (1, {'@': 34}),
+                                        20: (1, {'@': 34})},
+                                  103: {52: (0, 80)},
+                                  104: {0: (1, {'@': 53}),
+                                        1: (0, 106),
+                                        2: (1, {'@': 53}),
+                                        4: (0, 28),
+                                        5: (1, {'@': 53}),
+                                        6: (1, {'@': 53}),
+                                        7: (1, {'@': 53}),
+                                        8: (1, {'@': 53}),
+                                        9: (1, {'@': 53}),
+                                        10: (1, {'@': 53}),
+                                        11: (1, {'@': 53}),
+                                        12: (1, {'@': 53}),
+                                        13: (1, {'@': 53}),
+                                        14: (1, {'@': 53}),
+                                        15: (1, {'@': 53}),
+                                        16: (1, {'@': 53}),
+                                        17: (1, {'@': 53}),
+                                        18: (1, {'@': 53}),
+                                        19: (1, {'@': 53}),
+                                        20: (1, {'@': 53})},
+                                  105: {6: (1, {'@': 42}),
+                                        7: (1, {'@': 42}),
+                                        8: (1, {'@': 42}),
+                                        15: (1, {'@': 42}),
+                                        16: (1, {'@': 42}),
+                                        17: (1, {'@': 42}),
+                                        18: (1, {'@': 42}),
+                                        19: (1, {'@': 42}),
+                                        20: (1, {'@': 42})},
+                                  106: {3: (0, 51),
+                                        14: (0, 96),
+                                        22: (0, 19),
+                                        23: (0, 6),
+                                        25: (0, 34),
+                                        26: (0, 49),
+                                        27: (0, 14),
+                                        29: (0, 100),
+                                        30: (0, 10),
+                                        32: (0, 1),
+                                        33: (0, 99),
+                                        34: (0, 40),
+                                        39: (0, 35),
+                                        40: (0, 33),
+                                        43: (0, 23),
+                                        44: (0, 22),
+                                        46: (0, 77),
+                                        48: (0, 86)}},
+                       'tokens': {0: 'EQUAL',
+                                  1: 'STAR',
+                                  2: '__ANON_1',
+                                  3: 'LSQB',
+                                  4: 'SLASH',
+                                  5: 'IN',
+                                  6: 'OR',
+                                  7: 'AND',
+                                  8: '$END',
+                                  9: '__ANON_0',
+                                  10: 'LESSTHAN',
+                                  11: '__ANON_2',
+                                  12: 'MORETHAN',
+                                  13: 'PLUS',
+                                  14: 'MINUS',
+                                  15: 'RPAR',
+                                  16: 'COMMA',
+                                  17: 'RSQB',
+                                  18: 'THEN',
+                                  19: 'RBRACE',
+                                  20: 'ELSE',
+                                  21: 'pair',
+                                  22: 'STRING',
+                                  23: 'NAME',
+                                  24: 'mul_expr',
+                                  25: 'LPAR',
+                                  26: 'context',
+                                  27: 'index_access',
+                                  28: 'expr',
+                                  29: 'unary_expr',
+                                  30: 'NUMBER',
+                                  31: 'add_expr',
+                                  32: 'LBRACE',
+                                  33: 'list',
+                                  34: 'NULL',
+                                  35: 'if_expr',
+                                  36: 'comp_expr',
+                                  37: 'or_expr',
+                                  38: 'IF',
+                                  39: 'TRUE',
+                                  40: 'name_access',
+                                  41: 'not_expr',
+                                  42: 'and_expr',
+                                  43: 'atom',
+                                  44: 'func_call',
+                                  45: 'NOT',
+                                  46: 'literal',
+                                  47: 'start',
+                                  48: 'FALSE',
+                                  49: 'comparator',
+                                  50: '__name_access_star_2',
+                                  51: 'DOT',
+                                  52: 'COLON',
+                                  53: '__list_star_0',
+                                  54: '__context_star_1'}},
+            'parser_conf': {'__type__': 'ParserConf',
+                            'parser_type': 'lalr',
+                            'rules': [{'@': 33},
+                                      {'@': 34},
+                                      {'@': 35},
+                                      {'@': 36},
+                                      {'@': 37},
+                                      {'@': 38},
+                                      {'@': 39},
+                                      {'@': 40},
+                                      {'@': 41},
+                                      {'@': 42},
+                                      {'@': 43},
+                                      {'@': 44},
+                                      {'@': 45},
+                                      {'@': 46},
+                                      {'@': 47},
+                                      {'@': 48},
+                                      {'@': 49},
+                                      {'@': 50},
+                                      {'@': 51},
+                                      {'@': 52},
+                                      {'@': 53},
+                                      {'@': 54},
+                                      {'@': 55},
+                                      {'@': 56},
+                                      {'@': 57},
+                                      {'@': 58},
+                                      {'@': 59},
+                                      {'@': 60},
+                                      {'@': 61},
+                                      {'@': 62},
+                                      {'@': 63},
+                                      {'@': 64},
+                                      {'@': 65},
+                                      {'@': 66},
+                                      {'@': 67},
+                                      {'@': 68},
+                                      {'@': 69},
+                                      {'@': 70},
+                                      {'@': 71},
+                                      {'@': 72},
+                                      {'@': 73},
+                                      {'@': 74},
+                                      {'@': 75},
+                                      {'@': 76},
+                                      {'@': 77},
+                                      {'@': 78},
+                                      {'@': 79},
+                                      {'@': 80},
+                                      {'@': 81},
+                                      {'@': 82},
+                                      {'@': 83},
+                                      {'@': 84},
+                                      {'@': 85},
+                                      {'@': 86},
+                                      {'@': 87},
+                                      {'@': 88},
+                                      {'@': 89},
+                                      {'@': 90},
+                                      {'@': 91},
+                                      {'@': 92},
+                                      {'@': 93},
+                                      {'@': 94}],
+                            'start': ['start']}},
+ 'rules': [{'@': 33},
+           {'@': 34},
+           {'@': 35},
+           {'@': 36},
+           {'@': 37},
+           {'@': 38},
+           {'@': 39},
+           {'@': 40},
+           {'@': 41},
+           {'@': 42},
+           {'@': 43},
+           {'@': 44},
+           {'@': 45},
+           {'@': 46},
+           {'@': 47},
+           {'@': 48},
+           {'@': 49},
+           {'@': 50},
+           {'@': 51},
+           {'@': 52},
+           {'@': 53},
+           {'@': 54},
+           {'@': 55},
+           {'@': 56},
+           {'@': 57},
+           {'@': 58},
+           {'@': 59},
+           {'@': 60},
+           {'@': 61},
+           {'@': 62},
+           {'@': 63},
+           {'@': 64},
+           {'@': 65},
+           {'@': 66},
+           {'@': 67},
+           {'@': 68},
+           {'@': 69},
+           {'@': 70},
+           {'@': 71},
+           {'@': 72},
+           {'@': 73},
+           {'@': 74},
+           {'@': 75},
+           {'@': 76},
+           {'@': 77},
+           {'@': 78},
+           {'@': 79},
+           {'@': 80},
+           {'@': 81},
+           {'@': 82},
+           {'@': 83},
+           {'@': 84},
+           {'@': 85},
+           {'@': 86},
+           {'@': 87},
+           {'@': 88},
+           {'@': 89},
+           {'@': 90},
+           {'@': 91},
+           {'@': 92},
+           {'@': 93},
+           {'@': 94}]}
+
+MEMO = {0: {'__type__': 'TerminalDef',
+     'name': 'STRING',
+     'pattern': {'__type__': 'PatternRE',
+                 '_width': [2, 18446744073709551616],
+                 'flags': [],
+                 'raw': None,
+                 'value': '".*?(?<!\\\\)(\\\\\\\\)*?"'},
+     'priority': 0},
+ 1: {'__type__': 'TerminalDef',
+     'name': 'NAME',
+     'pattern': {'__type__': 'PatternRE',
+                 '_width': [1, 18446744073709551616],
+                 'flags': [],
+                 'raw': None,
+                 'value': '(?:(?:[A-Z]|[a-z])|_)(?:(?:(?:[A-Z]|[a-z])|[0-9]|_))*'},
+     'priority': 0},
+ 2: {'__type__': 'TerminalDef',
+     'name': 'WS',
+     'pattern': {'__type__': 'PatternRE',
+                 '_width': [1, 18446744073709551616],
+                 'flags': [],
+                 'raw': None,
+                 'value': '(?:[ \t\x0c\r\n])+'},
+     'priority': 0},
+ 3: {'__type__': 'TerminalDef',
+     'name': 'NUMBER',
+     'pattern': {'__type__': 'PatternRE',
+                 '_width': [1, 18446744073709551616],
+                 'flags': [],
+                 'raw': None,
+                 'value': '(?:\\+)?(?:(?:(?:[0-9])+(?:e|E)(?:(?:\\+|\\-))?(?:[0-9])+|(?:(?:[0-9])+\\.(?:(?:[0-9])+)?|\\.(?:[0-9])+)(?:(?:e|E)(?:(?:\\+|\\-))?(?:[0-9])+)?)|(?:[0-9])+)'},
+     'priority': 0},
+ 4: {'__type__': 'TerminalDef',
+     'name': 'IF',
+     'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"if"', 'value': 'if'},
+     'priority': 0},
+ 5: {'__type__': 'TerminalDef',
+     'name': 'THEN',
+     'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"then"', 'value': 'then'},
+     'priority': 0},
+ 6: {'__type__': 'TerminalDef',
+     'name': 'ELSE',
+     'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"else"', 'value': 'else'},
+     'priority': 0},
+ 7: {'__type__': 'TerminalDef',
+     'name': 'OR',
+     'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"or"', 'value': 'or'},
+     'priority': 0},
+ 8: {'__type__': 'TerminalDef',
+     'name': 'AND',
+     'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"and"', 'value': 'and'},
+     'priority': 0},
+ 9: {'__type__': 'TerminalDef',
+     'name': 'NOT',
+     'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"not"', 'value': 'not'},
+     'priority': 0},
+ 10: {'__type__': 'TerminalDef',
+      'name': 'EQUAL',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"="', 'value': '='},
+      'priority': 0},
+ 11: {'__type__': 'TerminalDef',
+      'name': '__ANON_0',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"!="', 'value': '!='},
+      'priority': 0},
+ 12: {'__type__': 'TerminalDef',
+      'name': 'LESSTHAN',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"<"', 'value': '<'},
+      'priority': 0},
+ 13: {'__type__': 'TerminalDef',
+      'name': '__ANON_1',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"<="', 'value': '<='},
+      'priority': 0},
+ 14: {'__type__': 'TerminalDef',
+      'name': 'MORETHAN',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '">"', 'value': '>'},
+      'priority': 0},
+ 15: {'__type__': 'TerminalDef',
+      'name': '__ANON_2',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '">="', 'value': '>='},
+      'priority': 0},
+ 16: {'__type__': 'TerminalDef',
+      'name': 'IN',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"in"', 'value': 'in'},
+      'priority': 0},
+ 17: {'__type__': 'TerminalDef',
+      'name': 'PLUS',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"+"', 'value': '+'},
+      'priority': 0},
+ 18: {'__type__': 'TerminalDef',
+      'name': 'MINUS',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"-"', 'value': '-'},
+      'priority': 0},
+ 19: {'__type__': 'TerminalDef',
+      'name': 'STAR',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"*"', 'value': '*'},
+      'priority': 0},
+ 20: {'__type__': 'TerminalDef',
+      'name': 'SLASH',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"/"', 'value': '/'},
+      'priority': 0},
+ 21: {'__type__': 'TerminalDef',
+      'name': 'LPAR',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"("', 'value': '('},
+      'priority': 0},
+ 22: {'__type__': 'TerminalDef',
+      'name': 'RPAR',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '")"', 'value': ')'},
+      'priority': 0},
+ 23: {'__type__': 'TerminalDef',
+      'name': 'TRUE',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"true"', 'value': 'true'},
+      'priority': 0},
+ 24: {'__type__': 'TerminalDef',
+      'name': 'FALSE',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"false"', 'value': 'false'},
+      'priority': 0},
+ 25: {'__type__': 'TerminalDef',
+      'name': 'NULL',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"null"', 'value': 'null'},
+      'priority': 0},
+ 26: {'__type__': 'TerminalDef',
+      'name': 'COMMA',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '","', 'value': ','},
+      'priority': 0},
+ 27: {'__type__': 'TerminalDef',
+      'name': 'LSQB',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"["', 'value': '['},
+      'priority': 0},
+ 28: {'__type__': 'TerminalDef',
+      'name': 'RSQB',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"]"', 'value': ']'},
+      'priority': 0},
+ 29: {'__type__': 'TerminalDef',
+      'name': 'LBRACE',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"{"', 'value': '{'},
+      'priority': 0},
+ 30: {'__type__': 'TerminalDef',
+      'name': 'RBRACE',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"}"', 'value': '}'},
+      'priority': 0},
+ 31: {'__type__': 'TerminalDef',
+      'name': 'COLON',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '":"', 'value': ':'},
+      'priority': 0},
+ 32: {'__type__': 'TerminalDef',
+      'name': 'DOT',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"."', 'value': '.'},
+      'priority': 0},
+ 33: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'expr'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'start')}},
+ 34: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'if_expr'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'expr')}},
+ 35: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'or_expr'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'expr')}},
+ 36: {'__type__': 'Rule',
+      'alias': 'if_expr',
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'IF'},
+                    {'__type__': 'NonTerminal', 'name': 'expr'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'THEN'},
+                    {'__type__': 'NonTerminal', 'name': 'expr'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'ELSE'},
+                    {'__type__': 'NonTerminal', 'name': 'expr'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'if_expr')}},
+ 37: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'and_expr'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'or_expr')}},
+ 38: {'__type__': 'Rule',
+      'alias': 'or_op',
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'or_expr'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'OR'},
+                    {'__type__': 'NonTerminal', 'name': 'and_expr'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'or_expr')}},
+ 39: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'not_expr'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'and_expr')}},
+ 40: {'__type__': 'Rule',
+      'alias': 'and_op',
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'and_expr'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'AND'},
+                    {'__type__': 'NonTerminal', 'name': 'not_expr'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'and_expr')}},
+ 41: {'__type__': 'Rule',
+      'alias': 'not_op',
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'NOT'},
+                    {'__type__': 'NonTerminal', 'name': 'not_expr'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'not_expr')}},
+ 42: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'comp_expr'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'not_expr')}},
+ 43: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'add_expr'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'comp_expr')}},
+ 44: {'__type__': 'Rule',
+      'alias': 'compare',
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'add_expr'},
+                    {'__type__': 'NonTerminal', 'name': 'comparator'},
+                    {'__type__': 'NonTerminal', 'name': 'add_expr'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'comp_expr')}},
+ 45: {'__type__': 'Rule',
+      'alias': 'eq',
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'EQUAL'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'comparator')}},
+ 46: {'__type__': 'Rule',
+      'alias': 'ne',
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': '__ANON_0'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'comparator')}},
+ 47: {'__type__': 'Rule',
+      'alias': 'lt',
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'LESSTHAN'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 2,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'comparator')}},
+ 48: {'__type__': 'Rule',
+      'alias': 'le',
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': '__ANON_1'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 3,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'comparator')}},
+ 49: {'__type__': 'Rule',
+      'alias': 'gt',
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'MORETHAN'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 4,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'comparator')}},
+ 50: {'__type__': 'Rule',
+      'alias': 'ge',
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': '__ANON_2'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 5,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'comparator')}},
+ 51: {'__type__': 'Rule',
+      'alias': 'in_op',
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'IN'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 6,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'comparator')}},
+ 52: {'__type__': 'Rule',
+      'alias': 'add',
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'add_expr'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'PLUS'},
+                    {'__type__': 'NonTerminal', 'name': 'mul_expr'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'add_expr')}},
+ 53: {'__type__': 'Rule',
+      'alias': 'sub',
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'add_expr'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'MINUS'},
+                    {'__type__': 'NonTerminal', 'name': 'mul_expr'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'add_expr')}},
+ 54: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'mul_expr'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 2,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'add_expr')}},
+ 55: {'__type__': 'Rule',
+      'alias': 'mul',
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'mul_expr'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'STAR'},
+                    {'__type__': 'NonTerminal', 'name': 'unary_expr'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'mul_expr')}},
+ 56: {'__type__': 'Rule',
+      'alias': 'div',
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'mul_expr'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'SLASH'},
+                    {'__type__': 'NonTerminal', 'name': 'unary_expr'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'mul_expr')}},
+ 57: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'unary_expr'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 2,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'mul_expr')}},
+ 58: {'__type__': 'Rule',
+      'alias': 'neg',
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'MINUS'},
+                    {'__type__': 'NonTerminal', 'name': 'unary_expr'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'unary_expr')}},
+ 59: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'atom'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'unary_expr')}},
+ 60: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'literal'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'atom')}},
+ 61: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'name_access'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'atom')}},
+ 62: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'func_call'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 2,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'atom')}},
+ 63: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'list'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 3,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'atom')}},
+ 64: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'context'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 4,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'atom')}},
+ 65: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'LPAR'},
+                    {'__type__': 'NonTerminal', 'name': 'expr'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RPAR'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 5,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'atom')}},
+ 66: {'__type__': 'Rule',
+      'alias': 'index_access',
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'index_access'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 6,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'atom')}},
+ 67: {'__type__': 'Rule',
+      'alias': 'number',
+      'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'NUMBER'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'literal')}},
+ 68: {'__type__': 'Rule',
+      'alias': 'string',
+      'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'STRING'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'literal')}},
+ 69: {'__type__': 'Rule',
+      'alias': 'true',
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'TRUE'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 2,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'literal')}},
+ 70: {'__type__': 'Rule',
+      'alias': 'false',
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'FALSE'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 3,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'literal')}},
+ 71: {'__type__': 'Rule',
+      'alias': 'null',
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'NULL'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 4,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'literal')}},
+ 72: {'__type__': 'Rule',
+      'alias': 'list_literal',
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'LSQB'},
+                    {'__type__': 'NonTerminal', 'name': 'expr'},
+                    {'__type__': 'NonTerminal', 'name': '__list_star_0'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RSQB'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'list')}},
+ 73: {'__type__': 'Rule',
+      'alias': 'list_literal',
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'LSQB'},
+                    {'__type__': 'NonTerminal', 'name': 'expr'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RSQB'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'list')}},
+ 74: {'__type__': 'Rule',
+      'alias': 'list_literal',
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'LSQB'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RSQB'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (False, True, False),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 2,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'list')}},
+ 75: {'__type__': 'Rule',
+      'alias': 'context_literal',
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'LBRACE'},
+                    {'__type__': 'NonTerminal', 'name': 'pair'},
+                    {'__type__': 'NonTerminal', 'name': '__context_star_1'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RBRACE'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'context')}},
+ 76: {'__type__': 'Rule',
+      'alias': 'context_literal',
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'LBRACE'},
+                    {'__type__': 'NonTerminal', 'name': 'pair'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RBRACE'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'context')}},
+ 77: {'__type__': 'Rule',
+      'alias': 'context_literal',
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'LBRACE'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RBRACE'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (False, True, False),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 2,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'context')}},
+ 78: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'NAME'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'COLON'},
+                    {'__type__': 'NonTerminal', 'name': 'expr'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'pair')}},
+ 79: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'STRING'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'COLON'},
+                    {'__type__': 'NonTerminal', 'name': 'expr'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'pair')}},
+ 80: {'__type__': 'Rule',
+      'alias': 'name_access',
+      'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'NAME'},
+                    {'__type__': 'NonTerminal', 'name': '__name_access_star_2'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'name_access')}},
+ 81: {'__type__': 'Rule',
+      'alias': 'name_access',
+      'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'NAME'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'name_access')}},
+ 82: {'__type__': 'Rule',
+      'alias': 'name_index',
+      'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'NAME'},
+                    {'__type__': 'NonTerminal', 'name': '__name_access_star_2'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LSQB'},
+                    {'__type__': 'NonTerminal', 'name': 'expr'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RSQB'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'index_access')}},
+ 83: {'__type__': 'Rule',
+      'alias': 'name_index',
+      'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'NAME'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LSQB'},
+                    {'__type__': 'NonTerminal', 'name': 'expr'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RSQB'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'index_access')}},
+ 84: {'__type__': 'Rule',
+      'alias': 'list_index',
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'list'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LSQB'},
+                    {'__type__': 'NonTerminal', 'name': 'expr'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RSQB'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 2,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'index_access')}},
+ 85: {'__type__': 'Rule',
+      'alias': 'expr_index',
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'LPAR'},
+                    {'__type__': 'NonTerminal', 'name': 'expr'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RPAR'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LSQB'},
+                    {'__type__': 'NonTerminal', 'name': 'expr'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RSQB'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 3,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'index_access')}},
+ 86: {'__type__': 'Rule',
+      'alias': 'func_call',
+      'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'NAME'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LPAR'},
+                    {'__type__': 'NonTerminal', 'name': 'expr'},
+                    {'__type__': 'NonTerminal', 'name': '__list_star_0'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RPAR'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'func_call')}},
+ 87: {'__type__': 'Rule',
+      'alias': 'func_call',
+      'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'NAME'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LPAR'},
+                    {'__type__': 'NonTerminal', 'name': 'expr'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RPAR'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'func_call')}},
+ 88: {'__type__': 'Rule',
+      'alias': 'func_call',
+      'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'NAME'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LPAR'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RPAR'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (False, False, True, False),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 2,
+      'origin': {'__type__': 'NonTerminal', 'name': Token('RULE', 'func_call')}},
+ 89: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'COMMA'},
+                    {'__type__': 'NonTerminal', 'name': 'expr'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': '__list_star_0'}},
+ 90: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': '__list_star_0'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'COMMA'},
+                    {'__type__': 'NonTerminal', 'name': 'expr'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': '__list_star_0'}},
+ 91: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'COMMA'},
+                    {'__type__': 'NonTerminal', 'name': 'pair'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': '__context_star_1'}},
+ 92: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': '__context_star_1'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'COMMA'},
+                    {'__type__': 'NonTerminal', 'name': 'pair'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': '__context_star_1'}},
+ 93: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'DOT'},
+                    {'__type__': 'Terminal', 'filter_out': False, 'name': 'NAME'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': '__name_access_star_2'}},
+ 94: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': '__name_access_star_2'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'DOT'},
+                    {'__type__': 'Terminal', 'filter_out': False, 'name': 'NAME'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': '__name_access_star_2'}}}
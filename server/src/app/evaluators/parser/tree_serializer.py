@@ -0,0 +1,23 @@
+from typing import Any, Optional
+from lark import Token, Tree
+
+
+def dump_tree(node: Optional[Tree | Token]) -> Any:
+    """Turns a parse tree into plain data that can be stored in Mongo."""
+    if isinstance(node, Tree):
+        return {'data': node.data, 'children': [dump_tree(child) for child in node.children]}
+
+    if isinstance(node, Token):
+        return {'type': node.type, 'value': node.value}
+
+    return None
+
+
+def load_tree(data: Any) -> Optional[Tree | Token]:
+    if data is None:
+        return None
+
+    if 'data' in data:
+        return Tree(data['data'], [load_tree(child) for child in data['children']])
+
+    return Token(data['type'], data['value'])
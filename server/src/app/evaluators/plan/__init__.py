@@ -0,0 +1,13 @@
+from .flow_plan import FlowPlan, get_flow_plan
+from .flow_version import content_hash, flow_content_hash, flow_version, node_hashes, subtree_hashes
+
+
+__all__ = [
+    'FlowPlan',
+    'content_hash',
+    'flow_content_hash',
+    'flow_version',
+    'get_flow_plan',
+    'node_hashes',
+    'subtree_hashes',
+]
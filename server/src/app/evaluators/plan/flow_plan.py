@@ -0,0 +1,142 @@
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping, Optional
+
+from src.utils.cache import LRUCache
+from src.app.models.flow_model import Flow
+from src.app.core.config import get_settings
+from src.app.core.exceptions import FlowValidationException, InvalidFlowException
+from src.app.models.node_model import AnyNode, StartNode
+from src.app.evaluators.plan.flow_version import flow_version
+
+
+settings = get_settings()
+
+
+class FlowPlan:
+    """Immutable, pre-validated index of a flow's node tree.
+
+    Built once per flow version so that walking the flow is a sequence of
+    O(1) lookups instead of linear scans over the node list.
+    """
+
+    def __init__(self, nodes: Iterable[AnyNode]) -> None:
+        nodes = tuple(nodes)
+
+        by_id: dict[str, AnyNode] = {}
+        for node in nodes:
+            if node.nodeId in by_id:
+                raise InvalidFlowException(
+                    f'Flow is broken, node {node.nodeId} is duplicated')
+            by_id[node.nodeId] = node
+
+        starts = [node for node in nodes if node.nodeType == 'START']
+        if len(starts) != 1:
+            raise InvalidFlowException(
+                f'Flow is broken, it has {len(starts)} START NODEs, '
+                'it should be 1'
+            )
+        start = starts[0]
+        assert isinstance(start, StartNode)
+
+        children: dict[str, list[AnyNode]] = {}
+        for node in nodes:
+            if node.parentNodeId is not None:
+                children.setdefault(node.parentNodeId, []).append(node)
+
+        # first child wins, matching the order the nodes were stored in
+        edges: dict[tuple[str, bool], AnyNode] = {}
+        for parent_id, siblings in children.items():
+            for child in siblings:
+                if child.isFalseCase is not None:
+                    edges.setdefault((parent_id, child.isFalseCase), child)
+
+        self._check_cycles(by_id)
+
+        reachable: set[str] = set()
+        pending = [start.nodeId]
+        while pending:
+            node_id = pending.pop()
+            reachable.add(node_id)
+            pending.extend(c.nodeId for c in children.get(node_id, []))
+
+        missing_branches = tuple(
+            (node.nodeId, is_false_case)
+            for node in nodes
+            if node.nodeType == 'CONDITIONAL' and node.nodeId in reachable
+            for is_false_case in (False, True)
+            if (node.nodeId, is_false_case) not in edges
+        )
+
+        self.start: StartNode = start
+        self.entry: Optional[AnyNode] = next(
+            iter(children.get(start.nodeId, [])), None)
+        self.nodes: Mapping[str, AnyNode] = MappingProxyType(by_id)
+        self.orphans: tuple[str, ...] = tuple(
+            node.nodeId for node in nodes if node.nodeId not in reachable)
+        self.missing_branches: tuple[tuple[str, bool], ...] = missing_branches
+
+        self._edges: Mapping[tuple[str, bool], AnyNode] = MappingProxyType(edges)
+        self._children: Mapping[str, tuple[AnyNode, ...]] = MappingProxyType(
+            {k: tuple(v) for k, v in children.items()})
+
+    @staticmethod
+    def _check_cycles(by_id: dict[str, AnyNode]) -> None:
+        acyclic: set[str] = set()
+
+        for node_id in by_id:
+            path: list[str] = []
+            on_path: set[str] = set()
+            current: Optional[str] = node_id
+
+            while current is not None and current in by_id and current not in acyclic:
+                if current in on_path:
+                    raise InvalidFlowException(
+                        f'Flow is broken, cycle detected at node {current}')
+                path.append(current)
+                on_path.add(current)
+                current = by_id[current].parentNodeId
+
+            acyclic.update(path)
+
+    def check_complete(self) -> None:
+        """
+        Raises FlowValidationException when the flow cannot be evaluated
+        as a whole: START has no next node, a node is not reachable from
+        START or a reachable CONDITIONAL lacks a branch. Saved drafts may
+        be incomplete, so only evaluation requires this.
+        """
+        errors: list[dict[str, Any]] = []
+
+        if self.entry is None:
+            errors.append({'nodeId': self.start.nodeId, 'error': 'START has no next node'})
+
+        for node_id in self.orphans:
+            errors.append({'nodeId': node_id, 'error': 'node is not reachable from START'})
+
+        for node_id, is_false_case in self.missing_branches:
+            branch = 'false' if is_false_case else 'true'
+            errors.append({'nodeId': node_id, 'error': f'{branch} branch has no next node'})
+
+        if errors:
+            raise FlowValidationException(errors)
+
+    def next_node(self, node_id: str, is_false_case: bool) -> Optional[AnyNode]:
+        return self._edges.get((node_id, is_false_case))
+
+    def children(self, node_id: str) -> tuple[AnyNode, ...]:
+        return self._children.get(node_id, ())
+
+
+flow_plans: LRUCache[tuple, FlowPlan] = LRUCache(
+    settings.FLOW_PLAN_CACHE_MAX_SIZE)
+
+
+def get_flow_plan(flow: Flow) -> FlowPlan:
+    key = flow_version(flow)
+
+    plan = flow_plans.get(key)
+    if plan is None:
+        plan = FlowPlan(flow.nodes)
+        flow_plans.set(key, plan)
+
+    return plan
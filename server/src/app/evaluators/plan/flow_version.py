@@ -0,0 +1,114 @@
+import json
+import hashlib
+from typing import Any, Hashable, Iterable, Optional
+
+from src.app.models.flow_model import Flow
+from src.app.models.node_model import AnyNode
+from src.app.evaluators.parser import normalize_expression
+
+
+def _node_content(node: AnyNode) -> list[Any]:
+    match node.nodeType:
+        case 'CONDITIONAL':
+            metadata: Any = normalize_expression(node.metadata.expression)
+        case _:
+            metadata = node.metadata.model_dump(mode='json')
+
+    return [node.nodeId, node.nodeType, node.parentNodeId, node.isFalseCase, metadata]
+
+
+def content_hash(nodes: Iterable[AnyNode]) -> str:
+    """
+    Hashes what decides how a flow evaluates. Node names and positions are
+    left out, so moving or renaming nodes keeps the same hash.
+    """
+    content = json.dumps(
+        [_node_content(node) for node in nodes],
+        sort_keys=True,
+        separators=(',', ':'),
+        default=str,
+    )
+
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def subtree_hashes(nodes: Iterable[AnyNode]) -> dict[str, str]:
+    """
+    Merkle hash of every node's subtree (the node and its descendants, in
+    list order) by nodeId, ignoring names and positions like `content_hash`.
+    """
+    nodes = list(nodes)
+    children: dict[Optional[str], list[AnyNode]] = {}
+    for node in nodes:
+        children.setdefault(node.parentNodeId, []).append(node)
+
+    hashes: dict[str, str] = {}
+    visiting: set[str] = set()
+    # iterative post-order, deep flows would overflow the recursion limit
+    pending: list[tuple[AnyNode, bool]] = [(node, False) for node in nodes]
+    while pending:
+        node, expanded = pending.pop()
+        if node.nodeId in hashes:
+            continue
+
+        node_children = children.get(node.nodeId, [])
+        if not expanded:
+            if node.nodeId in visiting:
+                # broken (cyclic) parent links, hashed as leaves
+                continue
+
+            visiting.add(node.nodeId)
+            pending.append((node, True))
+            pending.extend((child, False) for child in node_children
+                           if child.nodeId not in hashes)
+            continue
+
+        content = json.dumps(
+            [_node_content(node), [hashes.get(c.nodeId, '') for c in node_children]],
+            sort_keys=True,
+            separators=(',', ':'),
+            default=str,
+        )
+        hashes[node.nodeId] = hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+    return hashes
+
+
+def node_hashes(nodes: Iterable[AnyNode]) -> dict[str, str]:
+    """
+    Hash of every node with the ids and branches of its direct children by
+    nodeId: what a node's own evaluation depends on, besides its path.
+    """
+    nodes = list(nodes)
+    children: dict[Optional[str], list[AnyNode]] = {}
+    for node in nodes:
+        children.setdefault(node.parentNodeId, []).append(node)
+
+    hashes: dict[str, str] = {}
+    for node in nodes:
+        content = json.dumps(
+            [_node_content(node),
+             [[c.nodeId, c.isFalseCase] for c in children.get(node.nodeId, [])]],
+            sort_keys=True,
+            separators=(',', ':'),
+            default=str,
+        )
+        hashes[node.nodeId] = hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+    return hashes
+
+
+def flow_content_hash(flow: Flow) -> str:
+    """`content_hash` of the flow, read from its artifact when it has one."""
+    if flow.compiled is not None:
+        return flow.compiled.contentHash
+
+    return content_hash(flow.nodes)
+
+
+def flow_version(flow: Flow) -> Hashable:
+    """Cache key of everything derived from a flow's nodes."""
+    if flow.compiled is not None:
+        return flow.compiled.contentHash
+
+    return (flow.flowId, flow.updatedAt)
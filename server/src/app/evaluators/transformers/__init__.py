@@ -1,5 +1,21 @@
+from .codegen_transformer import CodegenTransformer
 from .concrete_transfomer import ConcreteTransformer
-from .symbolic_transformer import SymbolicTransfomer
+from .concrete_interpreter import ConcreteInterpreter
+from .symbolic_transformer import ExprMap, SymbolicTransfomer
+from .type_transformer import TypeCheckTransformer
+from .vectorized_transformer import (
+    VectorizedExpression,
+    VectorizedTransformer,
+)
 
 
-__all__ = ['ConcreteTransformer', 'SymbolicTransfomer']
+__all__ = [
+    'CodegenTransformer',
+    'ConcreteTransformer',
+    'ConcreteInterpreter',
+    'ExprMap',
+    'SymbolicTransfomer',
+    'TypeCheckTransformer',
+    'VectorizedExpression',
+    'VectorizedTransformer',
+]
@@ -0,0 +1,111 @@
+from typing import Any
+from lark import Transformer, Token, Tree
+
+from src.app.evaluators.transformers.concrete_transfomer import ConcreteTransformer
+
+
+class CodegenTransformer(Transformer):
+    """Translates an expression tree into Python source.
+
+    The generated code calls the very same ConcreteTransformer methods, in
+    the order ConcreteInterpreter visits them: `and_op`, `or_op` and
+    `if_expr` short-circuit through Python conditional expressions.
+    Literals and operator nodes are folded into constants kept in
+    `namespace`, which must be the globals of the compiled code.
+    """
+
+    RUNTIME = '_rt'
+    LOOKUP = '_lookup'
+
+    def __init__(self, namespace: dict[str, Any]):
+        super().__init__()
+        self.namespace = namespace
+        self._runtime = namespace.setdefault(self.RUNTIME, ConcreteTransformer())
+
+    def _const(self, value: Any) -> str:
+        name = f'_k{len(self.namespace)}'
+        self.namespace[name] = value
+        return name
+
+    def _method(self, name: str) -> str:
+        # v_args methods build a new wrapper on every attribute access, so
+        # each one is bound once and kept in the namespace
+        alias = f'{self.RUNTIME}_{name}'
+        if alias not in self.namespace:
+            self.namespace[alias] = getattr(self._runtime, name)
+
+        return alias
+
+    def _args(self, children: list) -> str:
+        args = []
+
+        for child in children:
+            if child is None:
+                args.append('None')
+            elif isinstance(child, Token):
+                args.append(self._const(child))
+            else:
+                args.append(child)
+
+        return ', '.join(args)
+
+    def __default__(self, data, children, meta):
+        if hasattr(self._runtime, data):
+            return f'{self._method(data)}({self._args(children)})'
+
+        return f'_Tree({data!r}, [{self._args(children)}])'
+
+    # --- LITERALS ---
+    def number(self, children):
+        return repr(float(children[0].value))
+
+    def string(self, children):
+        return repr(children[0].value[1:-1])
+
+    def true(self, children):
+        return 'True'
+
+    def false(self, children):
+        return 'False'
+
+    def null(self, children):
+        return 'None'
+
+    # -- CONDITIONAL | LOGIC ---
+    def if_expr(self, children):
+        cond, then_v, else_v = children
+        return f"({then_v} if {self._method('_condition')}({cond}) else {else_v})"
+
+    def or_op(self, children):
+        a, b = children
+        check = self._method('_logic_operand')
+        return (f"(True if {check}('or_op', 'First', {a}) "
+                f"else {check}('or_op', 'Second', {b}))")
+
+    def and_op(self, children):
+        a, b = children
+        check = self._method('_logic_operand')
+        return (f"({check}('and_op', 'Second', {b}) "
+                f"if {check}('and_op', 'First', {a}) else False)")
+
+    # --- NAME ACCESS AND INDEXING ---
+    def name_access(self, children):
+        names = ', '.join(repr(tok.value) for tok in children)
+        return f'{self.LOOKUP}(env, {names})'
+
+    def name_index(self, children):
+        *name_tokens, idx = children
+        names = ', '.join(repr(tok.value) for tok in name_tokens)
+        return f"{self._method('_do_index')}({self.LOOKUP}(env, {names}), {idx})"
+
+    # --- COMPARATORS ---
+    def _comparator(self, data: str) -> str:
+        return self._const(Tree(data, []))
+
+    def eq(self, children): return self._comparator('eq')
+    def ne(self, children): return self._comparator('ne')
+    def lt(self, children): return self._comparator('lt')
+    def le(self, children): return self._comparator('le')
+    def gt(self, children): return self._comparator('gt')
+    def ge(self, children): return self._comparator('ge')
+    def in_op(self, children): return self._comparator('in_op')
@@ -0,0 +1,61 @@
+from typing import Any, Callable
+from lark import Tree
+from lark.exceptions import VisitError
+from lark.visitors import Interpreter
+
+from src.app.evaluators.transformers.concrete_transfomer import ConcreteTransformer
+
+
+class ConcreteInterpreter(Interpreter):
+    """Top-down, short-circuiting counterpart of ConcreteTransformer.
+
+    `and_op`/`or_op` skip the right operand when the left one decides the
+    result and `if_expr` only evaluates the chosen branch, so errors in
+    branches that are never taken are not raised. Every other rule is
+    computed by the ConcreteTransformer methods and errors are wrapped in
+    the same VisitError the transformer raises.
+    """
+
+    def __init__(self, env: dict = {}):
+        self.runtime = ConcreteTransformer(env)
+
+    def _value(self, child: Any) -> Any:
+        return self.visit(child) if isinstance(child, Tree) else child
+
+    def _call(self, tree: Tree, fn: Callable, *args: Any) -> Any:
+        try:
+            return fn(*args)
+        except Exception as e:
+            raise VisitError(tree.data, tree, e)
+
+    def __default__(self, tree: Tree) -> Any:
+        return self._call(
+            tree,
+            getattr(self.runtime, tree.data),
+            *self.visit_children(tree)
+        )
+
+    # -- CONDITIONAL | LOGIC ---
+    def if_expr(self, tree: Tree) -> Any:
+        cond, then_branch, else_branch = tree.children
+
+        if self._call(tree, self.runtime._condition, self._value(cond)):
+            return self._value(then_branch)
+
+        return self._value(else_branch)
+
+    def or_op(self, tree: Tree) -> bool:
+        left, right = tree.children
+
+        if self._call(tree, self.runtime._logic_operand, 'or_op', 'First', self._value(left)):
+            return True
+
+        return self._call(tree, self.runtime._logic_operand, 'or_op', 'Second', self._value(right))
+
+    def and_op(self, tree: Tree) -> bool:
+        left, right = tree.children
+
+        if not self._call(tree, self.runtime._logic_operand, 'and_op', 'First', self._value(left)):
+            return False
+
+        return self._call(tree, self.runtime._logic_operand, 'and_op', 'Second', self._value(right))
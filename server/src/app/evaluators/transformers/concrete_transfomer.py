@@ -170,41 +170,35 @@ class ConcreteTransformer(Transformer):
 
     # -- CONDITIONAL | LOGIC ---
     def if_expr(self, cond, then_v, else_v):
-        if cond is None:
-            raise TypeError("Condition in if_expr is None.")
-        if not isinstance(cond, bool):
-            raise TypeError(
-                f"Condition in if_expr must be bool, got {type(cond).__name__}.")
-
-        return then_v if cond else else_v
+        return then_v if self._condition(cond) else else_v
 
     def or_op(self, a, b):
-        if not isinstance(a, bool):
-            raise TypeError(
-                f"First operand of or_op must be bool, got {type(a).__name__}.")
-
-        if a:
+        if self._logic_operand('or_op', 'First', a):
             return True
 
-        if not isinstance(b, bool):
-            raise TypeError(
-                f"Second operand of or_op must be bool, got {type(b).__name__}.")
-
-        return b
+        return self._logic_operand('or_op', 'Second', b)
 
     def and_op(self, a, b):
-        if not isinstance(a, bool):
+        if not self._logic_operand('and_op', 'First', a):
+            return False
+
+        return self._logic_operand('and_op', 'Second', b)
+
+    def _condition(self, cond) -> bool:
+        if cond is None:
+            raise TypeError("Condition in if_expr is None.")
+        if not isinstance(cond, bool):
             raise TypeError(
-                f"First operand of and_op must be bool, got {type(a).__name__}.")
+                f"Condition in if_expr must be bool, got {type(cond).__name__}.")
 
-        if not a:
-            return False
+        return cond
 
-        if not isinstance(b, bool):
+    def _logic_operand(self, op: str, position: str, value) -> bool:
+        if not isinstance(value, bool):
             raise TypeError(
-                f"Second operand of and_op must be bool, got {type(b).__name__}.")
+                f"{position} operand of {op} must be bool, got {type(value).__name__}.")
 
-        return b
+        return value
 
     def not_op(self, a):
         if not isinstance(a, bool):
@@ -1,5 +1,5 @@
-from typing import Literal
 from lark import Transformer, v_args, Token
+from typing import Generic, Literal, Optional, TypeVar, overload
 from z3 import (   # type: ignore
     And, Or, Not,
     ExprRef, RealVal, StringVal, BoolVal,
@@ -7,12 +7,49 @@ from z3 import (   # type: ignore
 )
 
 
+T = TypeVar('T')
+
+
+class ExprMap(Generic[T]):
+    """
+    Mapping keyed by Z3 AST id. Z3 hash-conses ASTs, so equal expressions
+    share an id, and a lookup does not build the `==` expression a dict
+    keyed by ExprRef compares keys with. Keys are kept alive with their
+    values: Z3 only reuses the id of a freed AST.
+    """
+
+    def __init__(self, other: Optional['ExprMap[T]'] = None) -> None:
+        self._items: dict[int, tuple[ExprRef, T]] = dict(other._items) if other is not None else {}
+
+    def __setitem__(self, key: ExprRef, value: T) -> None:
+        self._items[key.get_id()] = (key, value)
+
+    def __getitem__(self, key: ExprRef) -> T:
+        return self._items[key.get_id()][1]
+
+    def __contains__(self, key: ExprRef) -> bool:
+        return key.get_id() in self._items
+
+    @overload
+    def get(self, key: ExprRef) -> Optional[T]: ...
+
+    @overload
+    def get(self, key: ExprRef, default: T) -> T: ...
+
+    def get(self, key, default=None):
+        item = self._items.get(key.get_id())
+        return item[1] if item is not None else default
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
 @v_args(inline=True)
 class SymbolicTransfomer(Transformer):
     def __init__(self, symbolic_vars: dict[str, ExprRef]):
         super().__init__()
         self.symbolic_vars = symbolic_vars
-        self.reverse_map: dict[ExprRef, str] = {}  # 🔹 Z3 → ZF
+        self.reverse_map: ExprMap[str] = ExprMap()  # 🔹 Z3 → ZF
 
     # -------------------------------------------------
     # Helpers para registrar expressões
@@ -0,0 +1,228 @@
+from typing import Literal, Optional
+from lark import Transformer, v_args, Token
+
+
+Type = Literal['number', 'bool', 'text', 'list', 'context', 'null', 'any']
+
+NUMERIC: tuple[Type, ...] = ('number', 'bool')
+
+# name -> (argument types, required arguments, result); None accepts anything
+BUILTIN_SIGNATURES: dict[str, tuple[tuple[Optional[tuple[Type, ...]], ...], int, Type]] = {
+    'length': ((('text', 'list'),), 1, 'number'),
+    'substring': ((('text',), NUMERIC, NUMERIC), 2, 'text'),
+    'upper': ((('text',),), 1, 'text'),
+    'lower': ((('text',),), 1, 'text'),
+    'contains': ((('text', 'list'), None), 2, 'bool'),
+    'startsWith': ((('text',), ('text',)), 2, 'bool'),
+    'endsWith': ((('text',), ('text',)), 2, 'bool'),
+    'append': ((('list',), None), 2, 'list'),
+    'remove': ((('list',), None), 2, 'list'),
+    'count': ((None,), 1, 'number'),
+}
+
+
+@v_args(inline=True)
+class TypeCheckTransformer(Transformer):
+    """Infers the type of an expression from the START input types.
+
+    Mirrors the checks ConcreteTransformer makes at runtime and raises
+    NameError/TypeError for the ones that can be decided statically.
+    Operands whose type is only known at runtime are typed `any` and
+    always accepted, `null` operands are accepted wherever the runtime
+    propagates None.
+    """
+
+    def __init__(self, input_types: dict[str, Type]):
+        super().__init__()
+        self.input_types = input_types
+
+    def _expect(self, value: Type, accepted: tuple[Type, ...], message: str) -> None:
+        if value != 'any' and value not in accepted:
+            raise TypeError(message)
+
+    # --- LITERALS ---
+    def number(self, tok: Token) -> Type:
+        return 'number'
+
+    def string(self, tok: Token) -> Type:
+        return 'text'
+
+    def true(self) -> Type:
+        return 'bool'
+
+    def false(self) -> Type:
+        return 'bool'
+
+    def null(self) -> Type:
+        return 'null'
+
+    # --- CONTAINERS ---
+    def list_literal(self, *items) -> Type:
+        return 'list'
+
+    def pair(self, key_tok: Token, value: Type) -> Type:
+        return value
+
+    def context_literal(self, *pairs) -> Type:
+        return 'context'
+
+    # --- NAME ACCESS AND INDEXING ---
+    def name_access(self, first_name: Token, *rest_names: Token) -> Type:
+        name = first_name.value
+
+        if name not in self.input_types:
+            raise NameError(f"Variable '{name}' is not an input of the START node.")
+
+        value = self.input_types[name]
+        if rest_names:
+            raise TypeError(
+                f"Expected a dict for key access in variable '{name}', got {value}.")
+
+        return value
+
+    def name_index(self, *parts) -> Type:
+        *name_tokens, idx = parts
+        return self._do_index(self.name_access(*name_tokens), idx)
+
+    def list_index(self, lst: Type, idx: Type) -> Type:
+        return self._do_index(lst, idx)
+
+    def expr_index(self, expr_val: Type, idx: Type) -> Type:
+        return self._do_index(expr_val, idx)
+
+    def index_access(self, val: Type) -> Type:
+        return val
+
+    def _do_index(self, container: Type, idx: Type) -> Type:
+        self._expect(idx, NUMERIC, f"Index must be int or float, got {idx}.")
+        self._expect(container, ('text', 'list'),
+                     f"Container must be list, tuple, or str, got {container}.")
+
+        return 'text' if container == 'text' else 'any'
+
+    # --- FUNC CALLS ---
+    def func_call(self, name_tok: Token, *args: Optional[Type]) -> Type:
+        fname = name_tok.value
+
+        if fname == 'coalesce':
+            return 'any'
+
+        if fname not in BUILTIN_SIGNATURES:
+            raise NameError(f"Function '{fname}' is not a built-in.")
+
+        params, required, result = BUILTIN_SIGNATURES[fname]
+        types: list[Type] = ['null' if a is None else a for a in args]
+
+        if not required <= len(types) <= len(params):
+            raise TypeError(
+                f"Function '{fname}' takes {required} to {len(params)} arguments, got {len(types)}.")
+
+        for position, (value, accepted) in enumerate(zip(types, params), start=1):
+            if accepted is not None:
+                self._expect(value, accepted + ('null',),
+                             f"Argument {position} of '{fname}' must be {' or '.join(accepted)}, got {value}.")
+
+        return result
+
+    # -- CONDITIONAL | LOGIC ---
+    def if_expr(self, cond: Type, then_v: Type, else_v: Type) -> Type:
+        self._expect(cond, ('bool',), f"Condition in if_expr must be bool, got {cond}.")
+
+        return then_v if then_v == else_v else 'any'
+
+    def or_op(self, a: Type, b: Type) -> Type:
+        self._expect(a, ('bool',), f"First operand of or_op must be bool, got {a}.")
+        self._expect(b, ('bool',), f"Second operand of or_op must be bool, got {b}.")
+
+        return 'bool'
+
+    def and_op(self, a: Type, b: Type) -> Type:
+        self._expect(a, ('bool',), f"First operand of and_op must be bool, got {a}.")
+        self._expect(b, ('bool',), f"Second operand of and_op must be bool, got {b}.")
+
+        return 'bool'
+
+    def not_op(self, a: Type) -> Type:
+        self._expect(a, ('bool',), f"Operand of not_op must be bool, got {a}.")
+
+        return 'bool'
+
+    # --- COMPARATORS ---
+    def compare(self, left: Type, op: str, right: Type) -> Type:
+        if op in ('eq', 'ne'):
+            return 'bool'
+
+        if left == 'null' or right == 'null':
+            raise TypeError("Cannot compare None values.")
+
+        if op == 'in_op':
+            self._expect(right, ('text', 'list'),
+                         f"Right operand for 'in' must be str, list, or tuple, got {right}.")
+            if right == 'text':
+                self._expect(left, ('text',),
+                             f"Left operand for 'in' with string must be str, got {left}.")
+            return 'bool'
+
+        if 'any' not in (left, right) and left != right and not (
+                left in NUMERIC and right in NUMERIC):
+            raise TypeError(f"Cannot order {left} and {right}.")
+
+        if left == 'context' or right == 'context':
+            raise TypeError("Cannot order context values.")
+
+        return 'bool'
+
+    def eq(self): return 'eq'
+    def ne(self): return 'ne'
+    def lt(self): return 'lt'
+    def le(self): return 'le'
+    def gt(self): return 'gt'
+    def ge(self): return 'ge'
+    def in_op(self): return 'in_op'
+
+    # --- MATH ---
+    def add(self, a: Type, b: Type) -> Type:
+        if 'null' in (a, b):
+            return 'null'
+
+        if a in NUMERIC and b in NUMERIC:
+            return 'number'
+
+        if 'any' in (a, b):
+            return b if a == 'any' else a
+
+        if a == b and a in ('text', 'list'):
+            return a
+
+        raise TypeError(
+            "Operands for add must be both numbers, both strings, or both lists.")
+
+    def _arithmetic(self, op: str, a: Type, b: Type) -> Type:
+        if 'null' in (a, b):
+            return 'null'
+
+        self._expect(a, NUMERIC, f"Operands for {op} must be both numbers.")
+        self._expect(b, NUMERIC, f"Operands for {op} must be both numbers.")
+
+        return 'number'
+
+    def sub(self, a: Type, b: Type) -> Type:
+        return self._arithmetic('sub', a, b)
+
+    def mul(self, a: Type, b: Type) -> Type:
+        return self._arithmetic('mul', a, b)
+
+    def div(self, a: Type, b: Type) -> Type:
+        return self._arithmetic('div', a, b)
+
+    def neg(self, a: Type) -> Type:
+        if a == 'null':
+            return 'null'
+
+        self._expect(a, NUMERIC, f"Operand for neg must be numeric. Got {a}.")
+
+        return 'number'
+
+    # --- START (ENTRYPOINT) ---
+    def start(self, v: Type) -> Type:
+        return v
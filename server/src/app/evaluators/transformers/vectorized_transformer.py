@@ -0,0 +1,199 @@
+from typing import Any, Callable, Literal
+from lark import Transformer, v_args, Token, Tree
+
+import numpy as np
+
+
+Kind = Literal['number', 'bool']
+Columns = dict[str, np.ndarray]
+
+
+class VectorizedExpression:
+    """
+    `fn(cols, undecided)` computes the expression over the columns and sets
+    in `undecided` the rows the row-wise engine would raise on (division by
+    zero), whose values are meaningless. `fails` tells if it can set any.
+    """
+    __slots__ = ('kind', 'fn', 'fails')
+
+    def __init__(self, kind: Kind, fn: Callable[[Columns, np.ndarray], Any],
+                 fails: bool = False) -> None:
+        self.kind = kind
+        self.fn = fn
+        self.fails = fails
+
+
+def _taken(operand: VectorizedExpression, cols: Columns, undecided: np.ndarray, taken: Any) -> Any:
+    """Evaluates `operand`, counting its failures only on the rows that evaluate it."""
+    if not operand.fails:
+        return operand.fn(cols, undecided)
+
+    failed = np.zeros_like(undecided)
+    value = operand.fn(cols, failed)
+    undecided |= failed & taken
+    return value
+
+
+@v_args(inline=True)
+class VectorizedTransformer(Transformer):
+    """Compiles an expression tree into a function over input columns.
+
+    Only numeric/boolean expressions whose result matches what
+    ConcreteInterpreter would compute row by row are accepted, anything
+    else raises NotImplementedError so the caller falls back to the
+    row-wise engine.
+    """
+
+    def __init__(self, input_kinds: dict[str, Kind]):
+        super().__init__()
+        self.input_kinds = input_kinds
+
+    def _unsupported(self, what: str):
+        raise NotImplementedError(f'{what} is not supported by the vectorized engine')
+
+    def _expect(self, kind: Kind, *operands: VectorizedExpression) -> None:
+        for operand in operands:
+            if operand.kind != kind:
+                self._unsupported(f'{operand.kind} operand where {kind} is expected')
+
+    # --- LITERALS ---
+    def number(self, tok: Token):
+        value = float(tok.value)
+        return VectorizedExpression('number', lambda cols, undecided: value)
+
+    def true(self):
+        return VectorizedExpression('bool', lambda cols, undecided: np.True_)
+
+    def false(self):
+        return VectorizedExpression('bool', lambda cols, undecided: np.False_)
+
+    def string(self, tok: Token): self._unsupported('text literal')
+    def null(self): self._unsupported('null')
+    def list_literal(self, *items): self._unsupported('list')
+    def context_literal(self, *pairs): self._unsupported('context')
+    def pair(self, *args): self._unsupported('context')
+
+    # --- NAME ACCESS AND INDEXING ---
+    def name_access(self, first_name: Token, *rest_names):
+        name = first_name.value
+
+        if rest_names:
+            self._unsupported('nested access')
+
+        if name not in self.input_kinds:
+            self._unsupported(f"unknown variable '{name}'")
+
+        return VectorizedExpression(self.input_kinds[name], lambda cols, undecided: cols[name])
+
+    def name_index(self, *parts): self._unsupported('indexing')
+    def list_index(self, *parts): self._unsupported('indexing')
+    def expr_index(self, *parts): self._unsupported('indexing')
+    def index_access(self, *parts): self._unsupported('indexing')
+    def func_call(self, name_tok: Token, *args): self._unsupported('built-in call')
+
+    # -- CONDITIONAL | LOGIC ---
+    def if_expr(self, cond, then_v, else_v):
+        self._expect('bool', cond)
+        if then_v.kind != else_v.kind:
+            self._unsupported('if branches of different types')
+
+        def select(cols: Columns, undecided: np.ndarray):
+            c = cond.fn(cols, undecided)
+            t = _taken(then_v, cols, undecided, c)
+            e = _taken(else_v, cols, undecided, np.logical_not(c))
+            return np.where(c, t, e)
+
+        return VectorizedExpression(
+            then_v.kind, select, cond.fails or then_v.fails or else_v.fails)
+
+    # the second operand is only evaluated on the rows the first does not decide
+    def or_op(self, a, b):
+        self._expect('bool', a, b)
+
+        def either(cols: Columns, undecided: np.ndarray):
+            first = a.fn(cols, undecided)
+            return np.logical_or(first, _taken(b, cols, undecided, np.logical_not(first)))
+
+        return VectorizedExpression('bool', either, a.fails or b.fails)
+
+    def and_op(self, a, b):
+        self._expect('bool', a, b)
+
+        def both(cols: Columns, undecided: np.ndarray):
+            first = a.fn(cols, undecided)
+            return np.logical_and(first, _taken(b, cols, undecided, first))
+
+        return VectorizedExpression('bool', both, a.fails or b.fails)
+
+    def not_op(self, a):
+        self._expect('bool', a)
+        fa = a.fn
+        return VectorizedExpression(
+            'bool', lambda cols, undecided: np.logical_not(fa(cols, undecided)), a.fails)
+
+    # --- COMPARATORS ---
+    def compare(self, left, op_node, right):
+        op = op_node.data
+        fl, fr = left.fn, right.fn
+
+        if op in ('eq', 'ne'):
+            if left.kind != right.kind:
+                self._unsupported('comparison between number and bool')
+            ufunc = np.equal if op == 'eq' else np.not_equal
+        elif op in ('lt', 'le', 'gt', 'ge'):
+            self._expect('number', left, right)
+            ufunc = {
+                'lt': np.less,
+                'le': np.less_equal,
+                'gt': np.greater,
+                'ge': np.greater_equal,
+            }[op]
+        else:
+            self._unsupported(f"'{op}' operator")
+
+        return VectorizedExpression(
+            'bool', lambda cols, undecided: ufunc(fl(cols, undecided), fr(cols, undecided)),
+            left.fails or right.fails)
+
+    def eq(self): return Tree('eq', [])
+    def ne(self): return Tree('ne', [])
+    def lt(self): return Tree('lt', [])
+    def le(self): return Tree('le', [])
+    def gt(self): return Tree('gt', [])
+    def ge(self): return Tree('ge', [])
+    def in_op(self): return Tree('in_op', [])
+
+    # --- MATH ---
+    def _arith(self, a, b, ufunc):
+        self._expect('number', a, b)
+        fa, fb = a.fn, b.fn
+        return VectorizedExpression(
+            'number', lambda cols, undecided: ufunc(fa(cols, undecided), fb(cols, undecided)),
+            a.fails or b.fails)
+
+    def add(self, a, b): return self._arith(a, b, np.add)
+    def sub(self, a, b): return self._arith(a, b, np.subtract)
+    def mul(self, a, b): return self._arith(a, b, np.multiply)
+
+    def div(self, a, b):
+        self._expect('number', a, b)
+        fa, fb = a.fn, b.fn
+
+        def divide(cols: Columns, undecided: np.ndarray):
+            dividend = fa(cols, undecided)
+            divisor = fb(cols, undecided)
+            # only these rows raise, the others keep their quotient
+            undecided |= np.equal(divisor, 0)
+            return np.divide(dividend, divisor)
+
+        return VectorizedExpression('number', divide, fails=True)
+
+    def neg(self, a):
+        self._expect('number', a)
+        fa = a.fn
+        return VectorizedExpression(
+            'number', lambda cols, undecided: np.negative(fa(cols, undecided)), a.fails)
+
+    # --- START (ENTRYPOINT) ---
+    def start(self, v):
+        return v
@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from typing import List, Annotated, Optional
+from typing import Any, Dict, List, Annotated, Optional
 from pydantic import BaseModel, Field, ConfigDict, BeforeValidator
 
 from src.app.models.node_model import AnyNode
@@ -8,6 +8,13 @@ from src.app.models.node_model import AnyNode
 PyObjectId = Annotated[str, BeforeValidator(str)]
 
 
+class FlowArtifact(BaseModel):
+    """Precompiled form of a flow's nodes, written by update_flow_nodes."""
+
+    contentHash: str
+    expressions: Dict[str, Any] = {}
+
+
 class Flow(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
@@ -27,3 +34,4 @@ class Flow(BaseModel):
         default_factory=lambda: datetime.now(timezone.utc))
     updatedAt: datetime = Field(
         default_factory=lambda: datetime.now(timezone.utc))
+    compiled: Optional[FlowArtifact] = Field(default=None, exclude=True)
@@ -1,3 +1,4 @@
+from enum import Enum
 from datetime import datetime, timezone
 from typing import Optional, Any, Annotated
 from pydantic import Field, BaseModel, ConfigDict, BeforeValidator
@@ -36,12 +37,29 @@ class UncoveredPath(BaseModel):
     constraints: list[str]
 
 
+class ReportMetadata(BaseModel):
+    solverQueries: int = 0
+    queryCacheHits: int = 0
+    # queries decided by the interval domain, without the solver
+    intervalHits: int = 0
+    # queries answered by the concrete inputs of a previous run
+    witnessHits: int = 0
+    reusedNodes: int = 0
+    resolvedNodes: int = 0
+    # time spent writing constraints in ZF syntax
+    renderSeconds: float = 0.0
+    # logic the solvers were set up for, None for Z3's default solver
+    solverLogic: Optional[str] = None
+    cached: bool = False
+
+
 class SymbolicReport(BaseModel):
     cases: list[CaseResult]
     pruned: list[PrunedBranch]
     reductions: list[ReductionInfo]
     uncovered: list[UncoveredPath]
     coverage: Coverage
+    metadata: ReportMetadata = Field(default_factory=ReportMetadata)
 
 
 PyObjectId = Annotated[str, BeforeValidator(str)]
@@ -65,3 +83,33 @@ class SymbolicExecution(BaseModel):
     reductions: int
     uncovered: int
     coverage: float
+
+
+class JobStatus(str, Enum):
+    PENDING = 'PENDING'
+    RUNNING = 'RUNNING'
+    DONE = 'DONE'
+    FAILED = 'FAILED'
+
+
+class SymbolicJob(BaseModel):
+    model_config = ConfigDict(
+        populate_by_name=True,
+        arbitrary_types_allowed=True
+    )
+
+    id: Optional[PyObjectId] = Field(
+        alias='_id',
+        default=None,
+        serialization_alias='id'
+    )
+    flowId: PyObjectId
+    contentHash: str
+    status: JobStatus = JobStatus.PENDING
+    progress: float = 0.0
+    result: Optional[SymbolicReport] = None
+    error: Optional[str] = None
+    createdAt: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc))
+    startedAt: Optional[datetime] = None
+    finishedAt: Optional[datetime] = None
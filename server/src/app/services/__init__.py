@@ -1,5 +1,6 @@
+from .flow_cache import FlowCache, get_flow_cache
 from .flow_service import FlowService
 from .user_service import UserService
 
 
-__all__ = ['FlowService', 'UserService']
+__all__ = ['FlowCache', 'FlowService', 'UserService', 'get_flow_cache']
@@ -0,0 +1,97 @@
+import time
+from typing import Any, NamedTuple, Optional
+
+from src.utils.cache import LRUCache
+from src.app.models.flow_model import Flow
+from src.app.core.config import get_settings
+from src.app.core.metrics import (
+    flow_cache_size,
+    flow_cache_hit_ratio,
+    flow_cache_hits_total,
+    flow_cache_misses_total,
+)
+
+
+settings = get_settings()
+
+
+class CachedFlow(NamedTuple):
+    flow: Flow
+    updated_at: Any
+    expires_at: float
+
+    @property
+    def fresh(self) -> bool:
+        return time.monotonic() < self.expires_at
+
+
+class FlowCache:
+    """
+    In-process flow documents keyed by flowId. Entries younger than `ttl`
+    are served as is, older ones must be revalidated against the stored
+    `updatedAt` before being served again. Cached flows are shared between
+    requests and must be treated as read-only.
+
+    Every invalidation bumps `generation`: a load that read it before an
+    invalidation may have read the document before the write that caused
+    it, so `set` drops what it loaded instead of caching it again.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.ttl = ttl
+
+        self._entries: LRUCache[str, CachedFlow] = LRUCache(maxsize)
+        self.generation = 0
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, id: str) -> Optional[CachedFlow]:
+        return self._entries.get(id)
+
+    def set(self, id: str, flow: Flow, updated_at: Any,
+            generation: Optional[int] = None) -> None:
+        """Caches `flow`, unless it was loaded before `generation` changed."""
+        if generation is not None and generation != self.generation:
+            return
+
+        self._entries.set(
+            id, CachedFlow(flow, updated_at, time.monotonic() + self.ttl))
+        flow_cache_size.set(len(self._entries))
+
+    def invalidate(self, id: str) -> None:
+        self.generation += 1
+        self._entries.pop(id)
+        flow_cache_size.set(len(self._entries))
+
+    def invalidate_owner(self, owner_id: str) -> None:
+        self.generation += 1
+        for id, entry in self._entries.items():
+            if entry.flow.ownerId == owner_id:
+                self._entries.pop(id)
+
+        flow_cache_size.set(len(self._entries))
+
+    def record(self, hit: bool) -> None:
+        if hit:
+            self._hits += 1
+            flow_cache_hits_total.inc()
+        else:
+            self._misses += 1
+            flow_cache_misses_total.inc()
+
+        flow_cache_hit_ratio.set(self._hits / (self._hits + self._misses))
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._entries.clear()
+        flow_cache_size.set(0)
+
+
+flow_cache = FlowCache(
+    settings.FLOW_CACHE_MAX_SIZE,
+    settings.FLOW_CACHE_TTL_SECONDS
+)
+
+
+def get_flow_cache() -> FlowCache:
+    return flow_cache
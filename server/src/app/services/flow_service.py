@@ -1,16 +1,31 @@
 import time
-from typing import Any
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, Sequence
+from pydantic import TypeAdapter
 from bson import ObjectId
 from datetime import datetime, timezone
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
 from src.app.models.flow_model import Flow
+from src.app.core.config import get_settings
 from src.utils.pool import run_in_threadpool
 from src.app.models.node_model import AnyNode
-from src.utils.validation import create_dynamic_model
+from src.app.evaluators.plan import flow_content_hash, flow_version, get_flow_plan
+from src.app.evaluators.cache import get_path_cache, get_query_cache
+from src.app.evaluators.compiler import CompiledFlow, get_compiled_flow, precompile_flow
+from src.utils.validation import get_payload_validator
 from src.app.services.telemetry_service import TelemetryService
-from src.app.evaluators.executors import ConcreteExecutor, SymbolicExecutor
-from src.app.models.symbolic_model import SymbolicReport, SymbolicExecution
+from src.app.services.job_service import JobService
+from src.app.services.report_service import ReportService, symbolic_report_etag
+from src.app.services.flow_cache import get_flow_cache
+from src.app.evaluators.executors import (
+    SymbolicExecutor,
+    VectorizedExecutor,
+    report_events,
+    get_symbolic_pool,
+    get_vectorized_executor,
+)
+from src.app.models.symbolic_model import SymbolicJob, SymbolicReport, SymbolicExecution
 from src.app.core.metrics import (
     # per flow
     tests_total,
@@ -22,10 +37,12 @@ from src.app.core.metrics import (
     execution_errors_total,
     execution_timeouts_total,
     execution_duration_seconds,
+    report_render_seconds,
 )
 from src.app.core.exceptions import (
     translate_mongo_error,
 
+    AppException,
     ValidationError,
     RuntimeException,
     NotFoundException,
@@ -34,13 +51,27 @@ from src.app.core.exceptions import (
     InvalidPayloadException,
     InvalidObjectIdException,
     SymbolicTimeoutException,
+    PayloadTooLargeException,
 )
 
 
+settings = get_settings()
+
+# test jobs running in this process, referenced until they finish
+running_jobs: set[asyncio.Task] = set()
+
+
 class FlowService:
     def __init__(self, database: AsyncIOMotorDatabase) -> None:
         self.database = database
         self.telemetry_service = TelemetryService(database)
+        self.report_service = ReportService(database)
+        self.job_service = JobService(database)
+        self.flow_cache = get_flow_cache()
+
+        # FastAPI builds one service per request, so this memo lives exactly
+        # as long as the request that loaded the flows
+        self._flows: dict[str, Flow] = {}
 
     async def create_flow(self, flow_name: str, flow_description: str, owner_id: str) -> Flow:
         try:
@@ -68,18 +99,56 @@ class FlowService:
         return [Flow.model_validate(flow) for flow in flows_from_db]
 
     async def get_flow(self, id: str) -> Flow:
+        flow = self._flows.get(id)
+
+        if flow is None:
+            flow = await self._load_flow(id)
+            self._flows[id] = flow
+
+        return flow
+
+    async def _load_flow(self, id: str) -> Flow:
+        # read before the database: an update may land while we wait for it
+        generation = self.flow_cache.generation
+        cached = self.flow_cache.get(id)
+
+        if cached is not None and cached.fresh:
+            self.flow_cache.record(hit=True)
+            return cached.flow
+
         try:
             if not ObjectId.is_valid(id):
                 raise InvalidObjectIdException()
 
+            if cached is not None:
+                version = await self.database.decision_flows.find_one(
+                    {'_id': ObjectId(id)},
+                    {'updatedAt': 1}
+                )
+
+                if version and version.get('updatedAt') == cached.updated_at:
+                    self.flow_cache.set(id, cached.flow, cached.updated_at, generation)
+                    self.flow_cache.record(hit=True)
+                    return cached.flow
+
             flow_from_db = await self.database.decision_flows.find_one({'_id': ObjectId(id)})
         except Exception as e:
             raise translate_mongo_error(e)
 
+        self.flow_cache.record(hit=False)
+
         if not flow_from_db:
+            self.flow_cache.invalidate(id)
             raise NotFoundException()
 
-        return Flow.model_validate(flow_from_db)
+        flow = Flow.model_validate(flow_from_db)
+        self.flow_cache.set(id, flow, flow_from_db.get('updatedAt'), generation)
+
+        return flow
+
+    def _invalidate_flow(self, id: str) -> None:
+        self._flows.pop(id, None)
+        self.flow_cache.invalidate(id)
 
     async def update_flow_metadata(self, id: str, flow_name: str | None, flow_description: str | None) -> None:
         try:
@@ -106,6 +175,8 @@ class FlowService:
         except Exception as e:
             raise translate_mongo_error(e)
 
+        self._invalidate_flow(id)
+
         if result.matched_count == 0:
             raise NotFoundException()
 
@@ -126,6 +197,9 @@ class FlowService:
         except Exception as e:
             raise translate_mongo_error(e)
 
+        self._invalidate_flow(id)
+        await self.report_service.forget_flow(id)
+
         if result.deleted_count == 0:
             raise NotFoundException()
 
@@ -133,6 +207,8 @@ class FlowService:
         if not ObjectId.is_valid(id):
             raise InvalidObjectIdException()
 
+        compiled = precompile_flow(nodes)
+
         before = await self.telemetry_service.get_last_symbolic_execution_timestamp(id)
         now = datetime.now(timezone.utc)
 
@@ -141,6 +217,7 @@ class FlowService:
 
             update_flow: dict[str, Any] = {
                 'nodes': nodes_dict,
+                'compiled': compiled.model_dump(),
                 'updatedAt': now
             }
 
@@ -151,6 +228,8 @@ class FlowService:
         except Exception as e:
             raise translate_mongo_error(e)
 
+        self._invalidate_flow(id)
+
         if result.matched_count == 0:
             raise NotFoundException()
 
@@ -163,41 +242,118 @@ class FlowService:
                 flow_id=id
             ).set(delta)
 
-    async def evaluate_flow(self, id: str, payload: dict[str, Any]) -> dict:
-        flow = await self.get_flow(id)
-
-        start_node = next(
-            (node for node in flow.nodes if node.nodeType == 'START'),
-            None
-        )
-
-        if start_node is None:
-            raise InvalidFlowException(
-                'flow is broken, could not find start node')
+    def _validate_payload(self, validator: TypeAdapter, payload: Any) -> dict:
+        if not isinstance(payload, dict):
+            raise InvalidPayloadException('payload must be a JSON object')
 
         try:
-            DynModel = create_dynamic_model(start_node.metadata)
-            val_payload = DynModel(**payload)
+            return validator.validate_python(payload)
         except ValidationError as e:
             raise InvalidPayloadException(e.errors())
 
-        executor = ConcreteExecutor(flow.nodes)
-
+    def _execute_payload(self, executor: CompiledFlow, payload: dict) -> dict:
         try:
-            raw_resp = executor.execute(
-                payload=val_payload.dict(),
-                start_node_id=start_node.nodeId
-            )
+            raw_resp = executor.execute(payload=payload)
             return {'response': raw_resp}
         except Exception as e:
             re = RuntimeException(f'Error while executing flow {str(e)}')
             setattr(re, 'originalErrorType', type(e).__name__)
             raise re from e
 
-    async def symbolic_evaluate_flow(self, id: str) -> SymbolicReport:
+    def _evaluate_payload(self, validator: TypeAdapter, executor: CompiledFlow,
+                          payload: Any) -> dict:
+        return self._execute_payload(
+            executor,
+            self._validate_payload(validator, payload)
+        )
+
+    def _evaluate_vectorized(self, validator: TypeAdapter, executor: CompiledFlow,
+                             vectorized: VectorizedExecutor,
+                             payloads: list[Any]) -> list[dict]:
+        results: list[dict] = [{} for _ in payloads]
+        rows: list[int] = []
+        values: list[dict] = []
+        row_wise: list[tuple[int, dict]] = []
+
+        for i, payload in enumerate(payloads):
+            try:
+                value = self._validate_payload(validator, payload)
+            except AppException as e:
+                results[i] = {'error': e.detail}
+                continue
+
+            if any(v is None for v in value.values()):
+                row_wise.append((i, value))
+            else:
+                rows.append(i)
+                values.append(value)
+
+        end_ids = vectorized.execute(
+            vectorized.build_columns(values), len(values))
+
+        for i, value, end_id in zip(rows, values, end_ids):
+            if end_id is None:
+                row_wise.append((i, value))
+            else:
+                results[i] = {'response': vectorized.response(end_id)}
+
+        for i, value in row_wise:
+            try:
+                results[i] = self._execute_payload(executor, value)
+            except AppException as e:
+                results[i] = {'error': e.detail}
+
+        return results
+
+    async def evaluate_flow(self, id: str, payload: dict[str, Any]) -> dict:
         flow = await self.get_flow(id)
-        start = time.perf_counter()
+        get_flow_plan(flow).check_complete()
+        executor = get_compiled_flow(flow)
+        validator = get_payload_validator(flow)
+
+        return self._evaluate_payload(validator, executor, payload)
+
+    async def evaluate_flow_batch(self, id: str, payloads: list[Any]) -> list[dict]:
+        if len(payloads) > settings.EVALUATE_BATCH_MAX_SIZE:
+            raise PayloadTooLargeException(
+                f'batch has {len(payloads)} items, the limit is '
+                f'{settings.EVALUATE_BATCH_MAX_SIZE}'
+            )
+
+        flow = await self.get_flow(id)
+        get_flow_plan(flow).check_complete()
+        executor = get_compiled_flow(flow)
+        validator = get_payload_validator(flow)
+
+        vectorized = None
+        if len(payloads) >= settings.EVALUATE_BATCH_VECTORIZE_MIN_SIZE:
+            vectorized = get_vectorized_executor(flow)
+
+        def evaluate_all() -> list[dict]:
+            if vectorized is not None:
+                return self._evaluate_vectorized(
+                    validator, executor, vectorized, payloads)
+
+            results = []
+
+            for payload in payloads:
+                try:
+                    results.append(
+                        self._evaluate_payload(validator, executor, payload))
+                except AppException as e:
+                    results.append({'error': e.detail})
+
+            return results
 
+        if len(payloads) >= settings.EVALUATE_BATCH_THREADPOOL_THRESHOLD:
+            return await run_in_threadpool(evaluate_all)
+
+        return evaluate_all()
+
+    async def get_symbolic_report_etag(self, id: str) -> str:
+        return symbolic_report_etag(await self.get_flow(id))
+
+    def _check_testable(self, flow: Flow) -> None:
         num_start_nodes = sum(1 for n in flow.nodes if n.nodeType == 'START')
         num_end_nodes = sum(1 for n in flow.nodes if n.nodeType == 'END')
 
@@ -213,22 +369,184 @@ class FlowService:
                 'it should have at least 2'
             )
 
-        try:
-            executor = SymbolicExecutor(flow.nodes)
-            result: SymbolicReport = await run_in_threadpool(executor.execute)
+    async def symbolic_evaluate_flow(self, id: str) -> SymbolicReport:
+        flow = await self.get_flow(id)
+        self._check_testable(flow)
 
+        return await self._symbolic_evaluate(id, flow)
+
+    async def submit_symbolic_job(self, id: str) -> SymbolicJob:
+        flow = await self.get_flow(id)
+        self._check_testable(flow)
+
+        job, created = await self.job_service.submit_job(id, flow_content_hash(flow))
+
+        if created:
+            task = asyncio.create_task(self._run_symbolic_job(job, flow))
+            running_jobs.add(task)
+            task.add_done_callback(running_jobs.discard)
+
+        return job
+
+    async def get_symbolic_job(self, id: str, job_id: str) -> SymbolicJob:
+        return await self.job_service.get_job(id, job_id)
+
+    async def _run_symbolic_job(self, job: SymbolicJob, flow: Flow) -> None:
+        job_id = job.id
+        assert job_id is not None
+
+        async def progress(done: int, total: int) -> None:
+            await self.job_service.set_progress(job_id, done / total)
+
+        try:
+            # a job that could not be started is failed, not left pending
+            await self.job_service.start_job(job_id)
+            result = await self._symbolic_evaluate(job.flowId, flow, progress)
         except Exception as e:
-            if isinstance(e, SymbolicTimeoutException):
-                execution_timeouts_total.inc()
+            detail = e.detail if isinstance(e, AppException) else str(e)
+            await self.job_service.fail_job(job_id, detail)
+        else:
+            await self.job_service.complete_job(job_id, result)
 
-            execution_errors_total.inc()
+    async def _symbolic_evaluate(self, id: str, flow: Flow,
+                                 progress: Optional[Callable[[int, int], Awaitable[None]]] = None) -> SymbolicReport:
+        start = time.perf_counter()
+        report_hash = flow_content_hash(flow)
 
-            re = RuntimeException(f'Error while testing flow {str(e)}')
-            setattr(re, 'originalErrorType', type(e).__name__)
-            raise re from e
+        result = await self.report_service.get_report(report_hash)
+        if result is None:
+            witnesses = await self._previous_witnesses(id)
+            try:
+                result = await self._execute_symbolic(flow, progress, witnesses)
+            except Exception as e:
+                raise self._symbolic_error(e) from e
+
+            duration = time.perf_counter() - start
+            execution_duration_seconds.observe(duration)
+            report_render_seconds.observe(result.metadata.renderSeconds)
+
+            await self.report_service.store_report(report_hash, result)
+        else:
+            result.metadata.cached = True
+
+        await self._record_symbolic_test(id, flow, result)
+
+        return result
+
+    async def stream_symbolic_evaluation(self, id: str) -> AsyncIterator[tuple[str, Any]]:
+        flow = await self.get_flow(id)
+        self._check_testable(flow)
+
+        return self._stream_symbolic_evaluation(id, flow)
+
+    async def _stream_symbolic_evaluation(self, id: str, flow: Flow) -> AsyncIterator[tuple[str, Any]]:
+        start = time.perf_counter()
+        report_hash = flow_content_hash(flow)
+        streamed = False
+
+        result = await self.report_service.get_report(report_hash)
+        if result is None:
+            witnesses = await self._previous_witnesses(id)
+            try:
+                if settings.SYMBOLIC_POOL_SIZE > 0:
+                    streamed = True
+                    async for event, item in get_symbolic_pool().stream(
+                        [n.model_dump(mode='json') for n in flow.nodes],
+                        flow_version(flow) if settings.SYMBOLIC_QUERY_CACHE_SHARED else None,
+                        witnesses
+                    ):
+                        if event == 'report':
+                            result = SymbolicReport.model_validate(item)
+                        else:
+                            yield event, item
+                else:
+                    result = await self._execute_symbolic(flow, None, witnesses)
+            except Exception as e:
+                # the response has started, the error is the last event
+                yield 'error', {'detail': self._symbolic_error(e).detail}
+                return
 
-        duration = time.perf_counter() - start
-        execution_duration_seconds.observe(duration)
+            assert result is not None
+
+            duration = time.perf_counter() - start
+            execution_duration_seconds.observe(duration)
+            report_render_seconds.observe(result.metadata.renderSeconds)
+
+            await self.report_service.store_report(report_hash, result)
+        else:
+            result.metadata.cached = True
+
+        if not streamed:
+            for event, model in report_events(result):
+                yield event, model.model_dump(mode='json')
+
+        await self._record_symbolic_test(id, flow, result)
+
+        yield 'coverage', result.coverage.model_dump(mode='json')
+
+    async def _previous_witnesses(self, id: str) -> list[dict[str, Any]]:
+        # inputs that reached an END node last time, replayed before the solver
+        if not settings.SYMBOLIC_REPLAY_WITNESSES:
+            return []
+
+        return await self.report_service.get_previous_witnesses(id)
+
+    async def _execute_symbolic(self, flow: Flow,
+                                progress: Optional[Callable[[int, int], Awaitable[None]]] = None,
+                                witnesses: Sequence[dict[str, Any]] = ()) -> SymbolicReport:
+        if settings.SYMBOLIC_POOL_SIZE > 0:
+            return await get_symbolic_pool().run(
+                [n.model_dump(mode='json') for n in flow.nodes],
+                flow_version(flow) if settings.SYMBOLIC_QUERY_CACHE_SHARED else None,
+                progress,
+                witnesses
+            )
+
+        executor = SymbolicExecutor(
+            flow.nodes,
+            get_query_cache(flow) if settings.SYMBOLIC_QUERY_CACHE_SHARED else None,
+            get_path_cache(),
+            witnesses=witnesses
+        )
+        return await run_in_threadpool(executor.execute)
+
+    def _symbolic_error(self, e: Exception) -> RuntimeException:
+        if isinstance(e, SymbolicTimeoutException):
+            execution_timeouts_total.inc()
+
+        execution_errors_total.inc()
+
+        re = RuntimeException(f'Error while testing flow {str(e)}')
+        setattr(re, 'originalErrorType', getattr(e, 'error_type', type(e).__name__))
+        return re
+
+    async def record_not_modified_test(self, id: str, any_report: bool = False) -> bool:
+        """
+        Records a test answered with 304 Not Modified, from the stored report.
+        With `any_report` (If-None-Match: *) the client holds no particular
+        report, so there is nothing to match unless one was stored: then
+        nothing is recorded and False is returned.
+        """
+        flow = await self.get_flow(id)
+        result = await self.report_service.get_report(flow_content_hash(flow))
+
+        if result is None:
+            if any_report:
+                return False
+
+            # dropped since the client got it: only the test itself is known
+            tests_total.labels(flow_id=id).inc()
+            return True
+
+        result.metadata.cached = True
+        await self._record_symbolic_test(id, flow, result)
+        return True
+
+    async def _record_symbolic_test(self, id: str, flow: Flow, result: SymbolicReport) -> None:
+        # the next version of the flow replays the witnesses of this report
+        await self.report_service.set_latest_report(id, flow_content_hash(flow))
+
+        num_end_nodes = sum(1 for n in flow.nodes if n.nodeType == 'END')
 
         tests_total.labels(flow_id=id).inc()
 
@@ -253,5 +571,3 @@ class FlowService:
 
         sei = await self.telemetry_service.compute_symbolic_evolution_index(id)
         evolution_index.labels(flow_id=id).set(sei)
-
-        return result
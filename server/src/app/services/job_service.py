@@ -0,0 +1,133 @@
+from bson import ObjectId
+from typing import Any
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+from datetime import datetime, timedelta, timezone
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from src.app.core.config import get_settings
+from src.app.models.symbolic_model import JobStatus, SymbolicJob, SymbolicReport
+from src.app.core.exceptions import (
+    translate_mongo_error,
+
+    NotFoundException,
+    InvalidObjectIdException,
+)
+
+
+settings = get_settings()
+
+# databases whose symbolic_jobs indexes were already created by this process
+indexed_databases: set[str] = set()
+
+
+class JobService:
+    """
+    Symbolic test jobs stored in Mongo.
+
+    A pending or running job holds the `activeKey` of its flow version,
+    unique in the collection, so concurrent submissions for the same
+    version get the same job. Finished jobs release it and are removed by
+    a TTL index once `expiresAt` passes.
+    """
+
+    def __init__(self, database: AsyncIOMotorDatabase) -> None:
+        self.database = database
+
+    async def _ensure_indexes(self) -> None:
+        if self.database.name in indexed_databases:
+            return
+
+        await self.database.symbolic_jobs.create_index('activeKey', unique=True, sparse=True)
+        await self.database.symbolic_jobs.create_index('expiresAt', expireAfterSeconds=0)
+        indexed_databases.add(self.database.name)
+
+    async def submit_job(self, flow_id: str, content_hash: str) -> tuple[SymbolicJob, bool]:
+        """The active job of the flow version, created if there is none."""
+        key = f'{flow_id}:{content_hash}'
+        now = datetime.now(timezone.utc)
+
+        new_job = SymbolicJob(flowId=flow_id, contentHash=content_hash)
+        job_dict = new_job.model_dump(by_alias=True, exclude={'id'})
+        job_dict['_id'] = ObjectId()
+        job_dict['staleAt'] = now + timedelta(seconds=settings.SYMBOLIC_JOB_STALE_SECONDS)
+
+        try:
+            await self._ensure_indexes()
+
+            # a job whose API process went away would hold the version forever
+            await self.database.symbolic_jobs.update_many(
+                {'activeKey': key, 'staleAt': {'$lt': now}},
+                self._finish(JobStatus.FAILED, {'error': 'job was abandoned'})
+            )
+
+            try:
+                job_from_db = await self._upsert_active(key, job_dict)
+            except DuplicateKeyError:
+                # another submission inserted it first
+                job_from_db = await self._upsert_active(key, job_dict)
+        except Exception as e:
+            raise translate_mongo_error(e)
+
+        return SymbolicJob.model_validate(job_from_db), job_from_db['_id'] == job_dict['_id']
+
+    async def _upsert_active(self, key: str, job_dict: dict[str, Any]) -> dict[str, Any]:
+        return await self.database.symbolic_jobs.find_one_and_update(
+            {'activeKey': key},
+            {'$setOnInsert': job_dict},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+
+    def _finish(self, status: JobStatus, fields: dict[str, Any]) -> dict[str, Any]:
+        now = datetime.now(timezone.utc)
+
+        return {
+            '$set': {
+                **fields,
+                'status': status.value,
+                'finishedAt': now,
+                'expiresAt': now + timedelta(seconds=settings.SYMBOLIC_JOB_TTL_SECONDS),
+            },
+            '$unset': {'activeKey': '', 'staleAt': ''},
+        }
+
+    async def _update(self, job_id: str, update: dict[str, Any]) -> None:
+        try:
+            await self.database.symbolic_jobs.update_one({'_id': ObjectId(job_id)}, update)
+        except Exception as e:
+            raise translate_mongo_error(e)
+
+    async def start_job(self, job_id: str) -> None:
+        await self._update(job_id, {'$set': {
+            'status': JobStatus.RUNNING.value,
+            'startedAt': datetime.now(timezone.utc),
+        }})
+
+    async def set_progress(self, job_id: str, progress: float) -> None:
+        await self._update(job_id, {'$set': {'progress': progress}})
+
+    async def complete_job(self, job_id: str, report: SymbolicReport) -> None:
+        await self._update(job_id, self._finish(JobStatus.DONE, {
+            'progress': 1.0,
+            'result': report.model_dump(mode='json'),
+        }))
+
+    async def fail_job(self, job_id: str, error: str) -> None:
+        await self._update(job_id, self._finish(JobStatus.FAILED, {'error': error}))
+
+    async def get_job(self, flow_id: str, job_id: str) -> SymbolicJob:
+        if not ObjectId.is_valid(job_id):
+            raise InvalidObjectIdException()
+
+        try:
+            job_from_db = await self.database.symbolic_jobs.find_one(
+                {'_id': ObjectId(job_id), 'flowId': flow_id}
+            )
+        except Exception as e:
+            raise translate_mongo_error(e)
+
+        if not job_from_db:
+            raise NotFoundException()
+
+        return SymbolicJob.model_validate(job_from_db)
@@ -0,0 +1,103 @@
+from typing import Any, Optional
+from pydantic import ValidationError
+from datetime import datetime, timezone
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from src.app.models.flow_model import Flow
+from src.app.core.exceptions import translate_mongo_error
+from src.app.evaluators.plan import flow_content_hash
+from src.app.models.symbolic_model import SymbolicReport
+
+
+# bump whenever the executor starts producing different reports, so
+# reports stored by older versions are recomputed instead of served
+REPORT_FORMAT = 1
+
+
+def symbolic_report_etag(flow: Flow) -> str:
+    # weak: witnesses of a recomputed report may differ but are equivalent
+    return f'W/"{REPORT_FORMAT}-{flow_content_hash(flow)}"'
+
+
+class ReportService:
+    """
+    SymbolicReports stored in Mongo under the content hash of the flow, so
+    they are shared by every API worker and survive restarts.
+
+    Flows with the same content share a report, so the report each flow
+    was last tested with is kept apart, in flow_reports: the next version
+    of the flow starts from its witnesses.
+    """
+
+    def __init__(self, database: AsyncIOMotorDatabase) -> None:
+        self.database = database
+
+    async def get_report(self, content_hash: str) -> Optional[SymbolicReport]:
+        try:
+            report_from_db = await self.database.symbolic_reports.find_one(
+                {'_id': content_hash, 'format': REPORT_FORMAT},
+                projection={'report': 1}
+            )
+        except Exception as e:
+            raise translate_mongo_error(e)
+
+        if not report_from_db:
+            return None
+
+        try:
+            return SymbolicReport.model_validate(report_from_db['report'])
+        except ValidationError:
+            return None
+
+    async def get_previous_witnesses(self, flow_id: str) -> list[dict[str, Any]]:
+        """
+        Concrete inputs of the cases in the report the flow was last tested
+        with. Reports of any format are used: inputs do not depend on it.
+        """
+        try:
+            latest = await self.database.flow_reports.find_one({'_id': flow_id})
+            if not latest:
+                return []
+
+            report_from_db = await self.database.symbolic_reports.find_one(
+                {'_id': latest['contentHash']},
+                projection={'report.cases.concrete': 1}
+            )
+        except Exception as e:
+            raise translate_mongo_error(e)
+
+        if not report_from_db:
+            return []
+
+        cases = report_from_db.get('report', {}).get('cases', [])
+        return [case['concrete'] for case in cases if isinstance(case.get('concrete'), dict)]
+
+    async def store_report(self, content_hash: str, report: SymbolicReport) -> None:
+        try:
+            await self.database.symbolic_reports.replace_one(
+                {'_id': content_hash},
+                {
+                    'format': REPORT_FORMAT,
+                    'report': report.model_dump(mode='json'),
+                    'createdAt': datetime.now(timezone.utc),
+                },
+                upsert=True
+            )
+        except Exception as e:
+            raise translate_mongo_error(e)
+
+    async def set_latest_report(self, flow_id: str, content_hash: str) -> None:
+        try:
+            await self.database.flow_reports.replace_one(
+                {'_id': flow_id},
+                {'contentHash': content_hash, 'updatedAt': datetime.now(timezone.utc)},
+                upsert=True
+            )
+        except Exception as e:
+            raise translate_mongo_error(e)
+
+    async def forget_flow(self, flow_id: str) -> None:
+        try:
+            await self.database.flow_reports.delete_one({'_id': flow_id})
+        except Exception as e:
+            raise translate_mongo_error(e)
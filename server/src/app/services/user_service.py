@@ -4,6 +4,7 @@ from datetime import datetime, timezone
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
 from src.app.core.config import get_settings
+from src.app.services.flow_cache import get_flow_cache
 from src.app.core.security import hash_password, verify_password
 from src.app.core.auth import create_access_token, decode_access_token
 from src.app.models.user_model import User, UserRole, AuthUser, RefreshUser
@@ -153,6 +154,8 @@ class UserService:
         except Exception as e:
             raise translate_mongo_error(e)
 
+        get_flow_cache().invalidate_owner(user_id)
+
         if result.deleted_count == 0:
             raise NotFoundException("User not found")
 
@@ -0,0 +1,8 @@
+import json
+from typing import Any, AsyncIterator
+
+
+async def sse_stream(events: AsyncIterator[tuple[str, Any]]) -> AsyncIterator[str]:
+    """Formats (event, data) pairs as Server-Sent Events, data as JSON."""
+    async for event, data in events:
+        yield f'event: {event}\ndata: {json.dumps(data, separators=(",", ":"))}\n\n'
@@ -38,11 +38,8 @@ def concretize_model(model: ModelRef, vars: dict[str, ExprRef]) -> dict[str, obj
     result = {}
     for name, var in vars.items():
         try:
-            if var in model:
-                val = model[var]
-            else:
-                val = model.eval(var, model_completion=True)
-            result[name] = _extract(val)
+            # `var in model` scans every declaration of the model
+            result[name] = _extract(model.eval(var, model_completion=True))
         except Exception:
             result[name] = None
     return result
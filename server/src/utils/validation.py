@@ -1,9 +1,15 @@
-from typing import Any, Union
-from pydantic import create_model
+from typing import Annotated, Any, NotRequired, TypedDict, Union
+from pydantic import Field, TypeAdapter, create_model
 
+from src.utils.cache import LRUCache
+from src.app.models.flow_model import Flow
+from src.app.core.config import get_settings
+from src.app.evaluators.plan import flow_version, get_flow_plan
 from src.app.models.metadata_model import InputType, StartMetadata
 
 
+settings = get_settings()
+
 type_mapping = {
     InputType.BOOL: bool,
     InputType.NUMBER: float,
@@ -27,3 +33,38 @@ def create_dynamic_model(spec: StartMetadata) -> type:
         )
 
     return create_model('DynamicSpec', **fields)
+
+
+def create_payload_validator(spec: StartMetadata) -> TypeAdapter:
+    """
+    Same rules as `create_dynamic_model(spec)(**payload).dict()`, but
+    validating straight into a dict: missing optional inputs default to
+    None and unknown keys are dropped.
+    """
+    fields: dict[str, Any] = {}
+
+    for f_spec in spec.inputs:
+        field_type = _get_pydantic_type(f_spec.type, f_spec.required)
+
+        if f_spec.required:
+            fields[f_spec.displayName] = field_type
+        else:
+            fields[f_spec.displayName] = NotRequired[
+                Annotated[field_type, Field(default=None)]]
+
+    return TypeAdapter(TypedDict('DynamicSpec', fields))
+
+
+payload_validators: LRUCache[tuple, TypeAdapter] = LRUCache(
+    settings.FLOW_PLAN_CACHE_MAX_SIZE)
+
+
+def get_payload_validator(flow: Flow) -> TypeAdapter:
+    key = flow_version(flow)
+
+    validator = payload_validators.get(key)
+    if validator is None:
+        validator = create_payload_validator(get_flow_plan(flow).start.metadata)
+        payload_validators.set(key, validator)
+
+    return validator
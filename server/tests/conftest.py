@@ -1,6 +1,12 @@
+import httpx
 import pytest
+import pytest_asyncio
 from mongomock_motor import AsyncMongoMockClient
 
+from src.main import app
+from src.app.db.connection import get_database
+from src.api.dependencies import get_authorized_user, get_limiter
+
 
 @pytest.fixture
 def db():
@@ -10,3 +16,15 @@ def db():
     yield db
 
     client.close()
+
+
+@pytest_asyncio.fixture
+async def client(db, monkeypatch):
+    """The API on the test database, with every flow open to the caller."""
+    monkeypatch.setattr(get_limiter(), 'enabled', False)
+    monkeypatch.setitem(app.dependency_overrides, get_database, lambda: db)
+    monkeypatch.setitem(app.dependency_overrides, get_authorized_user, lambda: None)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url='http://test') as client:
+        yield client
@@ -0,0 +1,145 @@
+import random
+from typing import Any, Optional
+
+from src.app.models.flow_model import Flow
+from src.app.models.symbolic_model import SymbolicReport
+
+
+OWNER_ID = '69013d2567e845d84dd9a2d1'
+
+
+def node(node_id: str, node_type: str, parent: Optional[str], is_false_case: Optional[bool],
+         metadata: dict[str, Any]) -> dict[str, Any]:
+    return {
+        'nodeId': node_id,
+        'nodeName': node_id,
+        'nodePositionX': 0.0,
+        'nodePositionY': 0.0,
+        'parentNodeId': parent,
+        'isFalseCase': is_false_case,
+        'nodeType': node_type,
+        'metadata': metadata,
+    }
+
+
+def flow_document(nodes: list[dict[str, Any]], name: str = 'flow') -> dict[str, Any]:
+    return {'flowName': name, 'flowDescription': '.', 'ownerId': OWNER_ID, 'nodes': nodes}
+
+
+def make_flow(nodes: list[dict[str, Any]], **fields: Any) -> Flow:
+    return Flow.model_validate({**flow_document(nodes), **fields})
+
+
+def number_inputs(*names: str, required: bool = True) -> list[dict[str, Any]]:
+    return [{'displayName': name, 'type': 'number', 'required': required} for name in names]
+
+
+def chain(expressions: list[str], inputs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """One CONDITIONAL per expression, each true branch ending the flow."""
+    nodes = [node('start', 'START', None, None, {'inputs': inputs})]
+    parent, is_false_case = 'start', None
+
+    for i, expression in enumerate(expressions):
+        nodes.append(node(f'c{i}', 'CONDITIONAL', parent, is_false_case, {'expression': expression}))
+        nodes.append(node(f'e{i}', 'END', f'c{i}', False, {'response': f'r{i}'}))
+        parent, is_false_case = f'c{i}', True
+
+    nodes.append(node('last', 'END', parent, is_false_case, {'response': 'last'}))
+    return nodes
+
+
+def random_expression(rng: random.Random, numbers: list[str], bools: list[str], depth: int = 0,
+                      if_expressions: bool = True) -> str:
+    def term(depth: int) -> str:
+        r = rng.random()
+        if r < 0.4 or depth > 2:
+            return rng.choice(numbers)
+        if r < 0.6:
+            return str(rng.choice([0, 1, 2, 5, 10, -3, 0.5]))
+        return f"({term(depth + 1)} {rng.choice('+-*/')} {term(depth + 1)})"
+
+    r = rng.random()
+    if depth > 2 or r < 0.4:
+        if bools and rng.random() < 0.25:
+            return rng.choice(bools)
+        return f"{term(depth)} {rng.choice(['<', '<=', '>', '>=', '=', '!='])} {term(depth)}"
+
+    operands = [random_expression(rng, numbers, bools, depth + 1, if_expressions) for _ in range(3)]
+    if r < 0.6:
+        return f'{operands[0]} and {operands[1]}'
+    if r < 0.75:
+        return f'{operands[0]} or {operands[1]}'
+    if r < 0.85 or not if_expressions:
+        return f'not ({operands[0]})'
+    return f'(if {operands[0]} then {operands[1]} else {operands[2]})'
+
+
+def random_flow(seed: int, conditions: int = 10, optional: bool = False,
+                missing_branches: bool = False, if_expressions: bool = True) -> list[dict[str, Any]]:
+    """
+    A random tree of CONDITIONAL nodes over number inputs x0..x2 and the
+    bool input b0; with `missing_branches`, some branches have no node.
+    Without `if_expressions` the flow can be explored symbolically.
+    """
+    rng = random.Random(seed)
+    numbers, bools = ['x0', 'x1', 'x2'], ['b0']
+
+    inputs = number_inputs(*numbers)
+    for inp in inputs:
+        inp['required'] = not (optional and rng.random() < 0.3)
+    inputs.append({'displayName': 'b0', 'type': 'bool', 'required': True})
+
+    nodes = [node('start', 'START', None, None, {'inputs': inputs})]
+    slots: list[tuple[str, Optional[bool]]] = [('start', None)]
+    count = 0
+
+    while slots:
+        parent, is_false_case = slots.pop(rng.randrange(len(slots)))
+
+        if missing_branches and parent != 'start' and rng.random() < 0.1:
+            continue
+
+        if count < conditions:
+            node_id = f'c{count}'
+            count += 1
+            nodes.append(node(node_id, 'CONDITIONAL', parent, is_false_case,
+                              {'expression': random_expression(rng, numbers, bools,
+                                                               if_expressions=if_expressions)}))
+            slots.extend([(node_id, False), (node_id, True)])
+        else:
+            nodes.append(node(f'e{len(nodes)}', 'END', parent, is_false_case,
+                              {'response': f'r{len(nodes)}'}))
+
+    return nodes
+
+
+def random_payload(rng: random.Random, nodes: list[dict[str, Any]]) -> dict[str, Any]:
+    payload: dict[str, Any] = {}
+
+    for inp in nodes[0]['metadata']['inputs']:
+        if not inp['required'] and rng.random() < 0.3:
+            continue
+        if inp['type'] == 'number':
+            payload[inp['displayName']] = rng.choice([-3, 0, 0, 0.5, 1, 2, 5, 10, 100])
+        else:
+            payload[inp['displayName']] = rng.random() < 0.5
+
+    return payload
+
+
+def verdicts(report: SymbolicReport) -> dict[str, list]:
+    """
+    What a symbolic report finds, without what depends on the solver's
+    history: ZF texts, unsat cores and witnesses. Z3 may also answer
+    unknown for the witness of a nonlinear path in one run and not another.
+    """
+    return {
+        'cases': [(c.endNodeId, len(c.constraints)) for c in report.cases],
+        'pruned': [(p.nodeId, p.isFalseCase, p.reason) for p in report.pruned],
+        'reductions': [(r.nodeId, len(r.removedParts)) for r in report.reductions],
+        'uncovered': [(u.nodeId, len(u.constraints)) for u in report.uncovered],
+    }
+
+
+def covered(report: SymbolicReport) -> set[str]:
+    return {case.endNodeId for case in report.cases if case.concrete is not None}
@@ -0,0 +1,94 @@
+import json
+
+import pytest
+import pytest_asyncio
+
+from src.app.core.config import get_settings
+from src.app.services import FlowService
+
+from tests.factories import OWNER_ID, chain, make_flow, number_inputs
+
+
+NDJSON = {'content-type': 'application/x-ndjson'}
+
+
+@pytest_asyncio.fixture
+async def url(db):
+    service = FlowService(db)
+    id = str((await service.create_flow('flow', 'description', OWNER_ID)).flowId)
+    await service.update_flow_nodes(id, make_flow(chain(['x > 1'], number_inputs('x'))).nodes)
+
+    return f'/decision_flows/{id}/evaluate:batch'
+
+
+@pytest.fixture
+def limits(monkeypatch):
+    monkeypatch.setattr(get_settings(), 'EVALUATE_BATCH_MAX_SIZE', 2)
+    monkeypatch.setattr(get_settings(), 'EVALUATE_BATCH_MAX_BYTES', 64)
+
+
+async def chunks(*parts: bytes):
+    # streamed without a Content-Length
+    for part in parts:
+        yield part
+
+
+@pytest.mark.asyncio
+async def test_json_array(client, url):
+    response = await client.post(url, json=[{'x': 2}, {'x': 0}, {'y': 1}])
+
+    assert response.status_code == 200
+    results = response.json()['results']
+    assert results[:2] == [{'response': 'r0'}, {'response': 'last'}]
+    assert 'error' in results[2]
+
+
+@pytest.mark.asyncio
+async def test_ndjson_lines_split_across_chunks(client, url):
+    response = await client.post(url, headers=NDJSON,
+                                 content=chunks(b'{"x"', b': 2}\r\n\n{"x": 0', b'}\n'))
+
+    assert response.status_code == 200
+    assert response.json()['results'] == [{'response': 'r0'}, {'response': 'last'}]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('body, headers, detail', [
+    (b'{"x": 2}\nnot json\n', NDJSON, 'line 2 is not valid JSON'),
+    (b'[{"x": 2},', {}, 'body is not valid JSON'),
+    (b'{"x": 2}', {}, 'body must be a JSON array'),
+])
+async def test_malformed_bodies(client, url, body, headers, detail):
+    response = await client.post(url, headers=headers, content=body)
+
+    assert response.status_code == 422
+    assert detail in response.json()['error']
+
+
+@pytest.mark.asyncio
+async def test_ndjson_over_the_limit_stops_at_the_first_extra_record(client, url, limits):
+    # the malformed fourth line is never parsed
+    body = b'{"x": 1}\n{"x": 2}\n{"x": 3}\nnot json\n'
+
+    response = await client.post(url, headers=NDJSON, content=chunks(body))
+
+    assert response.status_code == 413
+    assert 'more than 2 items' in response.json()['error']
+
+
+@pytest.mark.asyncio
+async def test_json_over_the_limit(client, url, limits):
+    response = await client.post(url, json=[{'x': 1}, {'x': 2}, {'x': 3}])
+
+    assert response.status_code == 413
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('content_length', [True, False])
+async def test_body_over_the_byte_limit(client, url, limits, content_length):
+    body = json.dumps([{'x': 1, 'padding': 'x' * 100}]).encode()
+
+    response = await client.post(url, content=body if content_length else chunks(body[:40], body[40:]))
+
+    assert response.status_code == 413
+    assert 'bytes' in response.json()['error']
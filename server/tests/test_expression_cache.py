@@ -0,0 +1,44 @@
+from lark import Tree
+
+from src.app.evaluators.cache.expression_cache import ExpressionCache
+from src.app.evaluators.parser import get_parser
+
+
+def test_expressions_normalizing_alike_share_one_compiled_expression():
+    cache = ExpressionCache(8)
+
+    compiled = cache.get('name = "abc"')
+
+    assert cache.get("  name = 'abc' ") is compiled
+    assert cache.get('name = "abd"') is not compiled
+    assert compiled({'name': 'abc'}) is True
+
+
+def test_put_artifacts_are_returned_on_lookup():
+    cache = ExpressionCache(8)
+    tree = get_parser().parse('x > 1')
+
+    cache.put(" x > 1 ", tree)
+
+    assert cache.get('x > 1').tree is tree
+
+
+def test_put_keeps_the_entry_already_parsed():
+    cache = ExpressionCache(8)
+    compiled = cache.get('x > 1')
+
+    cache.put('x > 1', Tree('stale', []))
+
+    assert cache.get('x > 1') is compiled
+
+
+def test_least_recently_used_expression_is_evicted():
+    cache = ExpressionCache(2)
+    first = cache.get('x > 1')
+    second = cache.get('x > 2')
+    cache.get('x > 1')
+
+    cache.get('x > 3')
+
+    assert cache.get('x > 1') is first
+    assert cache.get('x > 2') is not second
@@ -0,0 +1,101 @@
+import json
+
+import pytest
+
+from src.app.core.exceptions import FlowValidationException
+from src.app.services import FlowService
+from src.app.evaluators.cache import get_expression_cache
+from src.app.evaluators.compiler import load_flow_artifact, precompile_flow
+from src.app.evaluators.parser import dump_tree, get_parser, load_tree
+from src.app.evaluators.transformers import ConcreteInterpreter
+
+from tests.factories import OWNER_ID, chain, make_flow, node, number_inputs
+
+
+INPUTS = number_inputs('x') + [{'displayName': 'name', 'type': 'text', 'required': False}]
+
+VALID = [
+    'x > 1 and not (name = null)',
+    'if contains(name, "a") then x * 2 >= 3 else startsWith(name, "b")',
+    'length(upper(name)) - x / 2 != 0.5',
+    'x = 1 or endsWith(lower(name), "c")',
+]
+
+
+def errors(expressions: list[str], extra: list[dict] = []) -> list[dict]:
+    with pytest.raises(FlowValidationException) as e:
+        precompile_flow(make_flow(chain(expressions, INPUTS) + extra).nodes)
+    return e.value.detail
+
+
+@pytest.mark.parametrize('expression, error', [
+    ('x + "a" > 1', 'Operands for add'),
+    ('x and true', 'must be bool, got number'),
+    ('length(x) > 1', "Argument 1 of 'length' must be text or list"),
+    ('y > 1', "Variable 'y' is not an input"),
+    ('x >', 'Unexpected token'),
+])
+def test_invalid_expressions_are_rejected(expression, error):
+    [found] = errors(['x > 0', expression])
+
+    assert found['nodeId'] == 'c1' and found['expression'] == expression
+    assert error in found['error']
+
+
+def test_every_problem_is_reported():
+    found = errors(['y > 1', 'x > 0', 'name * 2 > 1'])
+
+    assert [error['nodeId'] for error in found] == ['c0', 'c2']
+
+
+@pytest.mark.parametrize('extra, error', [
+    ([node('e0', 'END', 'c0', True, {'response': 'r'})], 'node e0 is duplicated'),
+    ([node('a', 'END', 'b', False, {'response': 'r'}),
+      node('b', 'CONDITIONAL', 'a', False, {'expression': 'x > 2'})], 'cycle detected'),
+])
+def test_broken_node_references_are_rejected(extra, error):
+    found = errors(['x > 1'], extra)
+
+    assert found[0]['nodeId'] is None and error in found[0]['error']
+
+
+def test_blank_expressions_are_left_for_evaluation():
+    artifact = precompile_flow(make_flow(chain(['x > 1', '  '], INPUTS)).nodes)
+
+    assert list(artifact.expressions) == ['c0']
+
+
+@pytest.mark.parametrize('expression', VALID)
+def test_stored_trees_round_trip(expression):
+    artifact = precompile_flow(make_flow(chain([expression], INPUTS)).nodes)
+    # as read back from Mongo
+    stored = json.loads(json.dumps(artifact.expressions['c0']))
+    tree = load_tree(stored)
+
+    assert tree == get_parser().parse(expression)
+    assert dump_tree(tree) == stored
+    env = {'x': 3, 'name': 'abc'}
+    assert ConcreteInterpreter(env).visit(tree) == ConcreteInterpreter(env).visit(
+        get_parser().parse(expression))
+
+
+def test_loaded_artifact_serves_the_expression_cache():
+    flow = make_flow(chain([VALID[0]], INPUTS))
+    flow.compiled = precompile_flow(flow.nodes)
+    cache = get_expression_cache()
+    cache.clear()
+
+    load_flow_artifact(flow)
+
+    assert cache.get(VALID[0]).tree == get_parser().parse(VALID[0])
+
+
+@pytest.mark.asyncio
+async def test_saving_an_invalid_flow_answers_422(client, db):
+    id = str((await FlowService(db).create_flow('flow', 'description', OWNER_ID)).flowId)
+
+    response = await client.put(f'/decision_flows/{id}/nodes', json=chain(['y > 1'], INPUTS))
+
+    assert response.status_code == 422
+    assert response.json()['error'][0]['nodeId'] == 'c0'
+    assert (await FlowService(db).get_flow(id)).nodes == []
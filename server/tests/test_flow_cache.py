@@ -0,0 +1,138 @@
+import pytest
+
+from src.app.core.exceptions import NotFoundException
+from src.app.models.node_model import StartNode
+from src.app.services import FlowService
+from src.app.services.flow_cache import get_flow_cache
+
+from tests.factories import OWNER_ID, node, number_inputs
+
+
+@pytest.fixture(autouse=True)
+def flow_cache():
+    cache = get_flow_cache()
+    ttl = cache.ttl
+    cache.clear()
+
+    yield cache
+
+    cache.ttl = ttl
+    cache.clear()
+
+
+@pytest.fixture
+def reads(db, monkeypatch):
+    """Every find_one on decision_flows, with its arguments."""
+    calls: list[tuple] = []
+    collection = type(db.decision_flows)
+    find_one = collection.find_one
+
+    async def counted(self, *args, **kwargs):
+        if self.name == 'decision_flows':
+            calls.append(args)
+        return await find_one(self, *args, **kwargs)
+
+    monkeypatch.setattr(collection, 'find_one', counted)
+    return calls
+
+
+async def create_flow(db) -> str:
+    flow = await FlowService(db).create_flow('flow', 'description', OWNER_ID)
+    return str(flow.flowId)
+
+
+@pytest.mark.asyncio
+async def test_warm_cache_is_shared_by_requests(db, reads):
+    id = await create_flow(db)
+
+    first = await FlowService(db).get_flow(id)
+    # each request builds its own service
+    second = await FlowService(db).get_flow(id)
+
+    assert second is first
+    assert len(reads) == 1
+
+
+@pytest.mark.asyncio
+async def test_expired_entry_is_revalidated_by_updated_at(db, reads, flow_cache):
+    id = await create_flow(db)
+    # entries expire as soon as they are cached
+    flow_cache.ttl = 0
+    first = await FlowService(db).get_flow(id)
+
+    second = await FlowService(db).get_flow(id)
+
+    assert second is first
+    # the full document once, then only its updatedAt
+    assert len(reads) == 2
+    assert reads[1][1].get('updatedAt') == 1 and 'nodes' not in reads[1][1]
+
+
+@pytest.mark.asyncio
+async def test_expired_entry_is_reloaded_when_the_flow_changed(db, reads, flow_cache):
+    id = await create_flow(db)
+    flow_cache.ttl = 0
+    await FlowService(db).get_flow(id)
+
+    # written by another process: this one's cache is not invalidated
+    flow = await db.decision_flows.find_one({'flowName': 'flow'})
+    await db.decision_flows.update_one(
+        {'_id': flow['_id']}, {'$set': {'flowName': 'renamed', 'updatedAt': 1}})
+    reads.clear()
+
+    assert (await FlowService(db).get_flow(id)).flowName == 'renamed'
+    assert len(reads) == 2
+
+
+@pytest.mark.asyncio
+async def test_update_metadata_invalidates(db, reads):
+    id = await create_flow(db)
+    await FlowService(db).get_flow(id)
+
+    await FlowService(db).update_flow_metadata(id, 'renamed', None)
+
+    assert (await FlowService(db).get_flow(id)).flowName == 'renamed'
+    assert len(reads) == 2
+
+
+@pytest.mark.asyncio
+async def test_update_nodes_invalidates(db, reads):
+    id = await create_flow(db)
+    await FlowService(db).get_flow(id)
+
+    start = StartNode.model_validate(
+        node('start', 'START', None, None, {'inputs': number_inputs('x')}))
+    await FlowService(db).update_flow_nodes(id, [start])
+
+    assert [n.nodeId for n in (await FlowService(db).get_flow(id)).nodes] == ['start']
+    assert len(reads) == 2
+
+
+@pytest.mark.asyncio
+async def test_delete_invalidates(db, reads):
+    id = await create_flow(db)
+    await FlowService(db).get_flow(id)
+
+    await FlowService(db).delete_flow(id)
+
+    with pytest.raises(NotFoundException):
+        await FlowService(db).get_flow(id)
+
+
+@pytest.mark.asyncio
+async def test_read_overtaken_by_an_update_is_not_cached(db, monkeypatch):
+    id = await create_flow(db)
+    collection = type(db.decision_flows)
+    find_one = collection.find_one
+
+    async def overtaken(self, *args, **kwargs):
+        document = await find_one(self, *args, **kwargs)
+        # the update lands after the document was read, before it is cached
+        monkeypatch.setattr(collection, 'find_one', find_one)
+        await FlowService(db).update_flow_metadata(id, 'renamed', None)
+        return document
+
+    monkeypatch.setattr(collection, 'find_one', overtaken)
+
+    assert (await FlowService(db).get_flow(id)).flowName == 'flow'
+    assert (await FlowService(db).get_flow(id)).flowName == 'renamed'
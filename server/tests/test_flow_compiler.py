@@ -0,0 +1,82 @@
+import random
+from typing import Any, Callable
+
+import pytest
+from bson import ObjectId
+
+from src.app.evaluators.plan import FlowPlan
+from src.app.evaluators.executors import ConcreteExecutor
+from src.app.evaluators.compiler import get_compiled_flow, precompile_flow
+
+from tests.factories import chain, make_flow, number_inputs, random_flow, random_payload
+
+
+def outcome(execute: Callable[[dict], Any], payload: dict) -> tuple:
+    try:
+        return 'ok', execute(payload)
+    except Exception as e:
+        return 'error', type(e), str(e)
+
+
+def assert_same(nodes: list[dict], payloads: list[dict], precompiled: bool = False) -> None:
+    flow = make_flow(nodes, _id=ObjectId())
+    if precompiled:
+        flow.compiled = precompile_flow(flow.nodes)
+
+    compiled = get_compiled_flow(flow)
+    interpreter = ConcreteExecutor(FlowPlan(flow.nodes))
+
+    for payload in payloads:
+        assert outcome(compiled.execute, payload) == outcome(interpreter.execute, payload), payload
+
+
+def payloads(seed: int, nodes: list[dict], count: int = 60) -> list[dict]:
+    rng = random.Random(seed)
+    generated = []
+
+    for _ in range(count):
+        payload = random_payload(rng, nodes)
+        if payload and rng.random() < 0.1:
+            payload[rng.choice(list(payload))] = None
+        generated.append(payload)
+
+    return generated
+
+
+@pytest.mark.parametrize('seed', range(60))
+def test_random_flows(seed):
+    nodes = random_flow(seed, conditions=random.Random(seed).randint(1, 15),
+                        optional=seed % 3 == 0, missing_branches=seed % 4 == 0)
+
+    assert_same(nodes, payloads(seed, nodes), precompiled=seed % 2 == 0)
+
+
+def test_division_by_zero():
+    nodes = chain(['x / y > 1', 'if y = 0 then true else x / y < 0'], number_inputs('x', 'y'))
+
+    assert_same(nodes, [{'x': 1, 'y': 0}, {'x': 0, 'y': 0}, {'x': 4, 'y': 2}, {'x': -4, 'y': 2}])
+
+
+def test_none_and_missing_inputs():
+    nodes = chain(['x > 1', 'x = null'], number_inputs('x', required=False))
+
+    assert_same(nodes, [{'x': None}, {}, {'x': 2}, {'x': 'text'}])
+
+
+def test_missing_branch():
+    nodes = [n for n in chain(['x > 1', 'x > 0'], number_inputs('x')) if n['nodeId'] != 'last']
+
+    assert_same(nodes, [{'x': 2}, {'x': 0.5}, {'x': -1}])
+
+
+def test_deep_nesting_is_split_into_functions():
+    nodes = chain([f'x > {i}' for i in range(400)], number_inputs('x'))
+
+    assert_same(nodes, [{'x': -1}, {'x': 0.5}, {'x': 200.5}, {'x': 1000}])
+
+
+def test_long_operator_chain_runs_on_the_interpreter():
+    # nests more parentheses than Python's parser accepts
+    nodes = chain([' + '.join(['x'] * 300) + ' > 1', 'x < 0'], number_inputs('x'))
+
+    assert_same(nodes, [{'x': 1}, {'x': 0}, {'x': -1}, {'x': None}])
@@ -0,0 +1,82 @@
+import pytest
+
+from src.app.evaluators.plan import FlowPlan
+from src.app.core.exceptions import FlowValidationException, InvalidFlowException
+from src.app.services import FlowService
+
+from tests.factories import OWNER_ID, chain, make_flow, node, number_inputs
+
+
+def plan(nodes: list[dict]) -> FlowPlan:
+    return FlowPlan(make_flow(nodes).nodes)
+
+
+def test_edges_are_indexed_by_parent_and_branch():
+    flow = plan(chain(['x > 1', 'x > 0'], number_inputs('x')))
+
+    assert flow.start.nodeId == 'start' and flow.entry.nodeId == 'c0'
+    assert flow.next_node('c0', False).nodeId == 'e0'
+    assert flow.next_node('c0', True).nodeId == 'c1'
+    assert flow.next_node('c1', True).nodeId == 'last'
+    assert flow.next_node('e0', False) is None
+    assert [n.nodeId for n in flow.children('c1')] == ['e1', 'last']
+    assert flow.orphans == () and flow.missing_branches == ()
+    flow.check_complete()
+
+
+def test_first_child_of_a_branch_wins():
+    nodes = chain(['x > 1'], number_inputs('x'))
+    nodes.append(node('again', 'END', 'c0', False, {'response': 'again'}))
+
+    assert plan(nodes).next_node('c0', False).nodeId == 'e0'
+
+
+@pytest.mark.parametrize('nodes, detail', [
+    (chain(['x > 1'], number_inputs('x')) + [node('e0', 'END', 'c0', True, {'response': 'r'})],
+     'node e0 is duplicated'),
+    ([n for n in chain(['x > 1'], number_inputs('x')) if n['nodeId'] != 'start'],
+     'it has 0 START NODEs'),
+    (chain(['x > 1'], number_inputs('x')) + [
+        node('a', 'CONDITIONAL', 'b', False, {'expression': 'x > 2'}),
+        node('b', 'CONDITIONAL', 'a', False, {'expression': 'x > 3'})],
+     'cycle detected'),
+])
+def test_broken_flows_are_rejected(nodes, detail):
+    with pytest.raises(InvalidFlowException, match=detail):
+        plan(nodes)
+
+
+def test_orphans_and_missing_branches_fail_the_completeness_check():
+    nodes = [n for n in chain(['x > 1', 'x > 0'], number_inputs('x')) if n['nodeId'] != 'last']
+    nodes.append(node('orphan', 'END', 'nowhere', False, {'response': 'r'}))
+    flow = plan(nodes)
+
+    assert flow.orphans == ('orphan',)
+    assert flow.missing_branches == (('c1', True),)
+
+    with pytest.raises(FlowValidationException) as e:
+        flow.check_complete()
+    assert [error['nodeId'] for error in e.value.detail] == ['orphan', 'c1']
+
+
+def test_start_without_next_node_fails_the_completeness_check():
+    flow = plan([node('start', 'START', None, None, {'inputs': number_inputs('x')})])
+
+    with pytest.raises(FlowValidationException) as e:
+        flow.check_complete()
+    assert e.value.detail == [{'nodeId': 'start', 'error': 'START has no next node'}]
+
+
+@pytest.mark.asyncio
+async def test_incomplete_flow_is_saved_but_not_evaluated(db):
+    service = FlowService(db)
+    id = str((await service.create_flow('flow', 'description', OWNER_ID)).flowId)
+    nodes = [n for n in chain(['x > 1'], number_inputs('x')) if n['nodeId'] != 'last']
+
+    # drafts from the editor are saved as they are
+    await service.update_flow_nodes(id, make_flow(nodes).nodes)
+
+    with pytest.raises(FlowValidationException):
+        await FlowService(db).evaluate_flow(id, {'x': 2})
+    with pytest.raises(FlowValidationException):
+        await FlowService(db).evaluate_flow_batch(id, [{'x': 2}])
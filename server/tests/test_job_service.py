@@ -0,0 +1,119 @@
+import asyncio
+
+import pytest
+from bson import ObjectId
+from pymongo.errors import DuplicateKeyError
+
+from src.app.core.config import get_settings
+from src.app.core.exceptions import RuntimeException
+from src.app.services import FlowService, job_service
+from src.app.services.flow_service import running_jobs
+from src.app.services.job_service import JobService
+from src.app.models.symbolic_model import JobStatus
+
+from tests.factories import OWNER_ID, chain, make_flow, number_inputs
+
+
+FLOW_ID = str(ObjectId())
+
+
+@pytest.fixture(autouse=True)
+def indexes(monkeypatch):
+    # every test gets a fresh database under the same name
+    monkeypatch.setattr(job_service, 'indexed_databases', set())
+
+
+@pytest.mark.asyncio
+async def test_submissions_of_a_version_share_its_job(db):
+    service = JobService(db)
+
+    first, first_created = await service.submit_job(FLOW_ID, 'hash')
+    second, second_created = await service.submit_job(FLOW_ID, 'hash')
+    other, other_created = await service.submit_job(FLOW_ID, 'other')
+
+    assert first_created and not second_created and other_created
+    assert second.id == first.id and other.id != first.id
+    assert await db.symbolic_jobs.count_documents({}) == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_submissions_share_one_job(db):
+    results = await asyncio.gather(*[JobService(db).submit_job(FLOW_ID, 'hash') for _ in range(5)])
+
+    assert len({job.id for job, _ in results}) == 1
+    assert [created for _, created in results].count(True) == 1
+
+
+@pytest.mark.asyncio
+async def test_submission_losing_the_insert_gets_the_winner(db, monkeypatch):
+    service = JobService(db)
+    upsert = service._upsert_active
+    winner = {}
+
+    async def lost(key, job_dict):
+        # another process inserts between the match and the insert
+        monkeypatch.setattr(service, '_upsert_active', upsert)
+        winner['job'], _ = await JobService(db).submit_job(FLOW_ID, 'hash')
+        raise DuplicateKeyError('activeKey')
+
+    monkeypatch.setattr(service, '_upsert_active', lost)
+    job, created = await service.submit_job(FLOW_ID, 'hash')
+
+    assert not created and job.id == winner['job'].id
+
+
+@pytest.mark.asyncio
+async def test_finished_job_releases_the_version(db):
+    service = JobService(db)
+    first, _ = await service.submit_job(FLOW_ID, 'hash')
+
+    await service.fail_job(str(first.id), 'boom')
+    second, created = await service.submit_job(FLOW_ID, 'hash')
+
+    assert created and second.id != first.id
+    finished = await db.symbolic_jobs.find_one({'_id': ObjectId(first.id)})
+    assert 'activeKey' not in finished and 'expiresAt' in finished
+
+
+@pytest.mark.asyncio
+async def test_stale_job_is_abandoned(db):
+    service = JobService(db)
+    stale, _ = await service.submit_job(FLOW_ID, 'hash')
+    await service.start_job(str(stale.id))
+    # its API process went away without finishing it
+    await db.symbolic_jobs.update_one({'_id': ObjectId(stale.id)}, {'$set': {'staleAt': stale.createdAt}})
+
+    job, created = await service.submit_job(FLOW_ID, 'hash')
+
+    assert created and job.id != stale.id
+    abandoned = await service.get_job(FLOW_ID, str(stale.id))
+    assert abandoned.status == JobStatus.FAILED and abandoned.error == 'job was abandoned'
+
+
+@pytest.mark.asyncio
+async def test_running_job_is_not_abandoned_before_it_is_stale(db):
+    service = JobService(db)
+    running, _ = await service.submit_job(FLOW_ID, 'hash')
+    await service.start_job(str(running.id))
+
+    job, created = await service.submit_job(FLOW_ID, 'hash')
+
+    assert not created and job.id == running.id and job.status == JobStatus.RUNNING
+
+
+@pytest.mark.asyncio
+async def test_job_that_cannot_start_is_failed(db, monkeypatch):
+    monkeypatch.setattr(get_settings(), 'SYMBOLIC_POOL_SIZE', 0)
+    service = FlowService(db)
+    id = str((await service.create_flow('flow', 'description', OWNER_ID)).flowId)
+    await service.update_flow_nodes(id, make_flow(chain(['x > 1'], number_inputs('x'))).nodes)
+
+    async def unavailable(job_id: str) -> None:
+        raise RuntimeException('database unavailable')
+
+    monkeypatch.setattr(service.job_service, 'start_job', unavailable)
+    job = await service.submit_symbolic_job(id)
+    await asyncio.gather(*running_jobs)
+
+    failed = await service.get_symbolic_job(id, str(job.id))
+    assert failed.status == JobStatus.FAILED and failed.error == 'database unavailable'
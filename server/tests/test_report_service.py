@@ -0,0 +1,122 @@
+import pytest
+
+from src.app.core.config import get_settings
+from src.app.core.metrics import tests_total
+from src.app.services import FlowService, report_service
+from src.app.services.report_service import ReportService, symbolic_report_etag
+from src.app.models.symbolic_model import CaseResult, Coverage, SymbolicReport
+
+from tests.factories import OWNER_ID, chain, make_flow, number_inputs
+
+
+def report(concrete: dict) -> SymbolicReport:
+    case = CaseResult(endNodeId='e0', endMetadata={'response': 'r0'},
+                      constraints=['x > 1'], concrete=concrete)
+    return SymbolicReport(cases=[case], pruned=[], reductions=[], uncovered=[],
+                          coverage=Coverage(endCount=1, totalEndNodes=2))
+
+
+@pytest.fixture(autouse=True)
+def in_process(monkeypatch):
+    # symbolic tests run in the test process instead of the worker pool
+    monkeypatch.setattr(get_settings(), 'SYMBOLIC_POOL_SIZE', 0)
+
+
+@pytest.mark.asyncio
+async def test_stored_report_is_served(db):
+    service = ReportService(db)
+    await service.store_report('hash', report({'x': 2}))
+
+    assert await service.get_report('hash') == report({'x': 2})
+    assert await service.get_report('other') is None
+
+
+@pytest.mark.asyncio
+async def test_format_bump_recomputes_reports(db, monkeypatch):
+    service = ReportService(db)
+    await service.store_report('hash', report({'x': 2}))
+    flow = make_flow(chain(['x > 1'], number_inputs('x')))
+    etag = symbolic_report_etag(flow)
+
+    monkeypatch.setattr(report_service, 'REPORT_FORMAT', report_service.REPORT_FORMAT + 1)
+
+    assert await service.get_report('hash') is None
+    assert symbolic_report_etag(flow) != etag
+
+
+@pytest.mark.asyncio
+async def test_unreadable_report_is_recomputed(db):
+    await db.symbolic_reports.insert_one(
+        {'_id': 'hash', 'format': report_service.REPORT_FORMAT, 'report': {'cases': 1}})
+
+    assert await ReportService(db).get_report('hash') is None
+
+
+@pytest.mark.asyncio
+async def test_witnesses_follow_the_report_each_flow_was_tested_with(db):
+    service = ReportService(db)
+    await service.store_report('first', report({'x': 2}))
+    await service.store_report('second', report({'x': 5}))
+
+    await service.set_latest_report('a', 'first')
+    await service.set_latest_report('b', 'first')
+    await service.set_latest_report('a', 'second')
+
+    assert await service.get_previous_witnesses('a') == [{'x': 5}]
+    assert await service.get_previous_witnesses('b') == [{'x': 2}]
+    assert await service.get_previous_witnesses('c') == []
+
+    await service.forget_flow('a')
+    assert await service.get_previous_witnesses('a') == []
+
+
+async def create_tested_flow(db, expressions: list[str]) -> str:
+    service = FlowService(db)
+    flow = await service.create_flow('flow', 'description', OWNER_ID)
+    id = str(flow.flowId)
+
+    await service.update_flow_nodes(id, make_flow(chain(expressions, number_inputs('x'))).nodes)
+    await FlowService(db).symbolic_evaluate_flow(id)
+    return id
+
+
+@pytest.mark.asyncio
+async def test_flows_with_the_same_content_keep_their_witnesses(db):
+    first = await create_tested_flow(db, ['x > 1'])
+    second = await create_tested_flow(db, ['x > 1'])
+
+    assert await db.symbolic_reports.count_documents({}) == 1
+    witnesses = await ReportService(db).get_previous_witnesses(first)
+    assert witnesses and await ReportService(db).get_previous_witnesses(second) == witnesses
+
+
+@pytest.mark.asyncio
+async def test_not_modified_test_is_recorded(db):
+    id = await create_tested_flow(db, ['x > 1'])
+    tests = tests_total.labels(flow_id=id)._value.get()
+    events = await db.symbolic_events.count_documents({'flowId': id})
+
+    await FlowService(db).record_not_modified_test(id)
+
+    assert tests_total.labels(flow_id=id)._value.get() == tests + 1
+    assert await db.symbolic_events.count_documents({'flowId': id}) == events + 1
+
+
+@pytest.mark.asyncio
+async def test_if_none_match_star_needs_a_stored_report(client, db):
+    service = FlowService(db)
+    id = str((await service.create_flow('flow', 'description', OWNER_ID)).flowId)
+    await service.update_flow_nodes(id, make_flow(chain(['x > 1'], number_inputs('x'))).nodes)
+    url = f'/decision_flows/{id}/test'
+
+    first = await client.get(url, headers={'If-None-Match': '*'})
+    assert first.status_code == 200 and first.json()['cases']
+
+    again = await client.get(url, headers={'If-None-Match': '*'})
+    assert again.status_code == 304 and again.headers['ETag'] == first.headers['ETag']
+
+    matching = await client.get(url, headers={'If-None-Match': f'"x", {first.headers["ETag"]}'})
+    assert matching.status_code == 304
+
+    other = await client.get(url, headers={'If-None-Match': '"x"'})
+    assert other.status_code == 200
@@ -0,0 +1,126 @@
+import random
+from fractions import Fraction
+
+import pytest
+from lark import Tree
+from z3 import And, Bool, BoolVal, Not, Or, Real, RealVal, Solver, Z3Exception, sat, unsat
+
+from src.app.evaluators.executors import SymbolicExecutor
+from src.app.evaluators.executors.symbolic_intervals import (
+    Bound, Domain, Interval, IntervalAnalysis
+)
+
+from tests.factories import chain, make_flow, number_inputs
+
+
+X, Y = Real('x'), Real('y')
+B = Bool('b')
+
+
+def decide(*constraints) -> object:
+    return IntervalAnalysis().decide(Domain(), constraints)
+
+
+@pytest.mark.parametrize('interval, empty', [
+    (Interval(), False),
+    (Interval(lower=Bound(Fraction(1), True)), False),
+    (Interval(Bound(Fraction(1), True), Bound(Fraction(1), True)), False),
+    (Interval(Bound(Fraction(1), False), Bound(Fraction(1), True)), True),
+    (Interval(Bound(Fraction(1), True), Bound(Fraction(1), False)), True),
+    (Interval(Bound(Fraction(2), True), Bound(Fraction(1), True)), True),
+    (Interval(Bound(Fraction(1), True), Bound(Fraction(1), True), frozenset({Fraction(1)})), True),
+    (Interval(Bound(Fraction(0), True), Bound(Fraction(1), True), frozenset({Fraction(1)})), False),
+])
+def test_interval_is_empty(interval, empty):
+    assert interval.is_empty() == empty
+
+
+def test_bounds_meet_on_the_strictest():
+    assert decide(X > 1, X < 3, X >= 3) == unsat
+    assert decide(X >= 1, X <= 1) == sat
+    assert decide(X > 1, X <= 1) == unsat
+    assert decide(2 * X + 1 < 5, X > 2) == unsat
+    assert decide(X / 2 >= 1, X < 2) == unsat
+    assert decide(X > 1, Y < 0) == sat
+
+
+def test_excluded_points():
+    assert decide(X != 1, X >= 1, X <= 1) == unsat
+    assert decide(X != 1, X >= 1) == sat
+    assert decide(Not(X == 1), X == 1) == unsat
+    assert decide(X != 1, X != 2, X > 0, X < 3) == sat
+
+
+def test_bool_atoms():
+    assert decide(B, Not(B)) == unsat
+    assert decide(B == BoolVal(True), B != BoolVal(False)) == sat
+    assert decide(BoolVal(False) == B, B) == unsat
+    assert decide(Not(Or(B, X > 1)), X <= 1) == sat
+    assert decide(BoolVal(False)) == unsat
+
+
+def test_what_intervals_cannot_represent_is_left_to_the_solver():
+    assert decide(X > Y) is None
+    assert decide(X * X > 1) is None
+    assert decide(X / 0 > 1) is None
+    assert decide(Or(X > 1, B)) is None
+    # an unrepresentable constraint does not hide an empty domain
+    assert decide(X > Y, X > 1, X < 0) == unsat
+
+
+def test_non_formulas_are_left_to_the_solver():
+    tree = Tree('if_expr', [X > 1, X > 2, X < 0])
+
+    assert IntervalAnalysis().atoms(tree) is None
+    assert decide(tree) is None
+    assert decide(tree, X > 1, X < 0) == unsat
+
+
+def test_flow_with_an_if_expression_fails_in_the_solver():
+    nodes = make_flow(chain(['if x > 1 then x > 2 else x < 0'], number_inputs('x'))).nodes
+
+    with pytest.raises(Z3Exception):
+        SymbolicExecutor(nodes).execute()
+
+
+def random_term(rng: random.Random):
+    constant = RealVal(rng.choice([-2, -1, 0, 1, Fraction(1, 2), 3]))
+    return rng.choice([
+        X, Y, constant, X + constant, constant * X, X / constant, X - Y, X * Y, -Y,
+    ])
+
+
+def random_constraint(rng: random.Random, depth: int = 0):
+    kind = rng.randrange(6 if depth < 2 else 3)
+
+    if kind == 0:
+        return rng.choice([B, Not(B), B == BoolVal(rng.random() < 0.5)])
+
+    if kind in (1, 2):
+        left, right = random_term(rng), random_term(rng)
+        return rng.choice([left < right, left <= right, left > right,
+                           left >= right, left == right, left != right])
+
+    children = [random_constraint(rng, depth + 1) for _ in range(rng.randint(1, 3))]
+    return {3: lambda: And(*children), 4: lambda: Or(*children),
+            5: lambda: Not(children[0])}[kind]()
+
+
+def test_decisions_agree_with_the_solver():
+    rng = random.Random(0)
+    decided = 0
+
+    for _ in range(2000):
+        constraints = [random_constraint(rng) for _ in range(rng.randint(1, 4))]
+
+        result = decide(*constraints)
+        if result is None:
+            continue
+
+        solver = Solver()
+        solver.add(*constraints)
+        assert solver.check() == result, constraints
+        decided += 1
+
+    # the domain decides a good share of them on its own
+    assert decided > 500
@@ -0,0 +1,64 @@
+import random
+
+import pytest
+
+from src.app.evaluators.cache.path_cache import PathCache
+from src.app.evaluators.executors import SymbolicExecutor
+from src.app.models.symbolic_model import SymbolicReport
+
+from tests.factories import make_flow, random_expression, random_flow
+
+
+def edited(nodes: list[dict], seed: int) -> list[dict]:
+    """The flow with the expression of one random CONDITIONAL below the first replaced."""
+    rng = random.Random(seed)
+    nodes = [dict(n) for n in nodes]
+    conditionals = [i for i, n in enumerate(nodes)
+                    if n['nodeType'] == 'CONDITIONAL' and n['parentNodeId'] != 'start']
+    i = rng.choice(conditionals)
+
+    expression = nodes[i]['metadata']['expression']
+    while expression == nodes[i]['metadata']['expression']:
+        expression = random_expression(rng, ['x0', 'x1', 'x2'], ['b0'], if_expressions=False)
+    nodes[i] = {**nodes[i], 'metadata': {'expression': expression}}
+
+    return nodes
+
+
+def findings(report: SymbolicReport) -> dict:
+    # witness values depend on the solver's history, only their presence is compared
+    found = report.model_dump(exclude={'metadata'})
+    for case in found['cases']:
+        case['concrete'] = case['concrete'] is not None
+    return found
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_warm_run_after_an_edit_matches_a_cold_run(seed):
+    before = make_flow(random_flow(seed, conditions=12, if_expressions=False)).nodes
+    after = make_flow(edited(random_flow(seed, conditions=12, if_expressions=False), seed)).nodes
+    path_cache = PathCache(1000)
+    SymbolicExecutor(before, path_cache=path_cache).execute()
+
+    warm = SymbolicExecutor(after, path_cache=path_cache).execute()
+    cold = SymbolicExecutor(after).execute()
+
+    assert findings(warm) == findings(cold)
+    # every node explored cold is either replayed or solved again
+    assert cold.metadata.reusedNodes == 0
+    assert warm.metadata.reusedNodes + warm.metadata.resolvedNodes == cold.metadata.resolvedNodes
+    assert warm.metadata.resolvedNodes < cold.metadata.resolvedNodes
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_unchanged_flow_is_replayed_whole(seed):
+    nodes = make_flow(random_flow(seed, conditions=12, if_expressions=False)).nodes
+    path_cache = PathCache(1000)
+    cold = SymbolicExecutor(nodes, path_cache=path_cache).execute()
+
+    warm = SymbolicExecutor(nodes, path_cache=path_cache).execute()
+
+    assert findings(warm) == findings(cold)
+    assert warm.metadata.resolvedNodes == 0
+    assert warm.metadata.reusedNodes == cold.metadata.resolvedNodes
+    assert warm.metadata.solverQueries == 0
@@ -0,0 +1,81 @@
+import pytest
+
+from src.app.core.config import get_settings
+from src.app.evaluators.cache.path_cache import PathCache
+from src.app.evaluators.executors import SymbolicExecutor, SymbolicPool
+from src.app.evaluators.executors.symbolic_split import merge_parts, plan_split
+from src.app.models.node_model import AnyNode
+from src.app.models.symbolic_model import SymbolicReport
+
+from tests.factories import covered, make_flow, random_flow, verdicts
+
+
+def split_run(nodes: list[AnyNode], parts: int,
+              path_cache: PathCache | None = None) -> SymbolicReport | None:
+    """A split run with every part explored in this process, one after the other."""
+    cut = plan_split([n.model_dump(mode='json') for n in nodes], parts)
+    assert cut
+
+    top = SymbolicExecutor(nodes, path_cache=path_cache).execute_partial(cut=frozenset(cut))
+    subtrees = {root: SymbolicExecutor(nodes, path_cache=path_cache).execute_partial(root=root)
+                for root in cut}
+
+    return merge_parts(top, subtrees, sum(1 for n in nodes if n.nodeType == 'END'))
+
+
+@pytest.mark.parametrize('seed', range(12))
+def test_split_run_matches_a_sequential_run(seed):
+    nodes = make_flow(random_flow(seed, conditions=40, if_expressions=False)).nodes
+
+    merged = split_run(nodes, 8)
+    sequential = SymbolicExecutor(nodes).execute()
+
+    assert merged is not None
+    assert verdicts(merged) == verdicts(sequential)
+    assert merged.coverage.endCount == len(covered(merged))
+    assert merged.coverage.totalEndNodes == sequential.coverage.totalEndNodes
+    assert merged.metadata.resolvedNodes >= sequential.metadata.resolvedNodes
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_parts_sharing_a_path_cache_resolve_the_prefix_once(seed):
+    nodes = make_flow(random_flow(seed, conditions=40, if_expressions=False)).nodes
+
+    merged = split_run(nodes, 8, PathCache(1000))
+    sequential = SymbolicExecutor(nodes).execute()
+
+    assert merged is not None and verdicts(merged) == verdicts(sequential)
+    assert merged.metadata.resolvedNodes == sequential.metadata.resolvedNodes
+    assert merged.metadata.reusedNodes > 0
+
+
+def test_part_whose_root_is_not_reached_fails_the_merge():
+    nodes = make_flow(random_flow(0, conditions=40, if_expressions=False)).nodes
+    cut = plan_split([n.model_dump(mode='json') for n in nodes], 8)
+    top = SymbolicExecutor(nodes).execute_partial(cut=frozenset(cut))
+    reached = [node_id for node_id, _ in top['splits']]
+    subtrees = {root: SymbolicExecutor(nodes).execute_partial(root=root) for root in reached}
+
+    assert merge_parts(top, subtrees, 0) is not None
+    assert merge_parts(top, {**subtrees, reached[0]: None}, 0) is None
+
+
+@pytest.mark.asyncio
+async def test_pool_merges_the_parts_of_a_split_run(monkeypatch):
+    monkeypatch.setattr(get_settings(), 'SYMBOLIC_SPLIT_MIN_NODES', 0)
+    nodes = make_flow(random_flow(0, conditions=40, if_expressions=False)).nodes
+    pool = SymbolicPool(2, 50, 60)
+    progress = []
+
+    async def record(done: int, total: int) -> None:
+        progress.append((done, total))
+
+    try:
+        report = await pool.run([n.model_dump(mode='json') for n in nodes], progress=record)
+    finally:
+        for worker in pool._idle:
+            worker.stop()
+
+    assert verdicts(report) == verdicts(SymbolicExecutor(nodes).execute())
+    # one job for the top of the flow and one per cut subtree
+    assert progress[-1] == (len(progress), len(progress)) and len(progress) > 2
@@ -0,0 +1,78 @@
+import pytest
+
+from src.app.core.config import get_settings
+from src.app.evaluators.executors import SymbolicExecutor
+from src.app.services import FlowService
+from src.app.models.symbolic_model import SymbolicReport
+
+from tests.factories import OWNER_ID, chain, covered, make_flow, number_inputs, random_flow, verdicts
+
+
+@pytest.fixture(autouse=True)
+def in_process(monkeypatch):
+    # symbolic tests run in the test process instead of the worker pool
+    monkeypatch.setattr(get_settings(), 'SYMBOLIC_POOL_SIZE', 0)
+    monkeypatch.setattr(get_settings(), 'SYMBOLIC_REPLAY_WITNESSES', True)
+
+
+def inputs_of(report: SymbolicReport) -> list[dict]:
+    return [case.concrete for case in report.cases if case.concrete is not None]
+
+
+@pytest.mark.parametrize('seed', range(12))
+def test_replay_finds_what_the_solver_finds(seed):
+    nodes = make_flow(random_flow(seed, conditions=15, if_expressions=False)).nodes
+    cold = SymbolicExecutor(nodes).execute()
+
+    replayed = SymbolicExecutor(nodes, witnesses=inputs_of(cold)).execute()
+
+    assert verdicts(replayed) == verdicts(cold)
+    assert covered(replayed) >= covered(cold)
+    assert replayed.metadata.witnessHits > 0
+    # every hit stands for a query the solver did not answer
+    assert replayed.metadata.solverQueries == cold.metadata.solverQueries
+
+
+@pytest.mark.parametrize('seed', range(12))
+def test_witnesses_of_another_flow_only_take_the_branches_they_satisfy(seed):
+    before = make_flow(random_flow(seed, conditions=15, if_expressions=False)).nodes
+    after = make_flow(random_flow(seed + 100, conditions=15, if_expressions=False)).nodes
+
+    replayed = SymbolicExecutor(after, witnesses=inputs_of(SymbolicExecutor(before).execute())).execute()
+
+    assert verdicts(replayed) == verdicts(SymbolicExecutor(after).execute())
+
+
+def test_witnesses_that_do_not_fit_the_inputs_are_dropped():
+    nodes = make_flow(chain(['x > 1'], number_inputs('x'))).nodes
+
+    for witnesses in ([{'y': 2}], [{'x': 2, 'y': 2}], [{'x': 'two'}], [{'x': float('inf')}]):
+        report = SymbolicExecutor(nodes, witnesses=witnesses).execute()
+        assert report.metadata.witnessHits == 0
+
+    assert SymbolicExecutor(nodes, witnesses=[{'x': 2}]).execute().metadata.witnessHits > 0
+
+
+async def evaluate_edited(service: FlowService, id: str, expressions: list[str],
+                          *inputs: str) -> SymbolicReport:
+    nodes = make_flow(chain(expressions, number_inputs(*inputs))).nodes
+    await service.update_flow_nodes(id, nodes)
+    return await service.symbolic_evaluate_flow(id)
+
+
+@pytest.mark.asyncio
+async def test_edited_flow_replays_the_witnesses_that_still_apply(db):
+    service = FlowService(db)
+    id = str((await service.create_flow('flow', 'description', OWNER_ID)).flowId)
+    first = await evaluate_edited(service, id, ['x > 1'], 'x')
+    assert first.metadata.witnessHits == 0
+
+    edited = await evaluate_edited(service, id, ['x < 0', 'x > 5'], 'x')
+    cold = SymbolicExecutor(make_flow(chain(['x < 0', 'x > 5'], number_inputs('x'))).nodes).execute()
+
+    assert verdicts(edited) == verdicts(cold) and covered(edited) == covered(cold)
+    # no previous input is below 0 or above 5, but they take both false branches
+    assert 0 < edited.metadata.witnessHits < edited.metadata.solverQueries
+
+    renamed = await evaluate_edited(service, id, ['y < 0', 'y > 5'], 'y')
+    assert renamed.metadata.witnessHits == 0
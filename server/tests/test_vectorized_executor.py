@@ -0,0 +1,57 @@
+import random
+
+import pytest
+
+from src.app.evaluators.plan import FlowPlan
+from src.app.evaluators.executors import ConcreteExecutor
+from src.app.evaluators.executors.vectorized_executor import VectorizedExecutor
+
+from tests.factories import chain, make_flow, number_inputs, random_flow
+
+
+def run(expression: str, payloads: list[dict]) -> list:
+    plan = FlowPlan(make_flow(chain([expression], number_inputs('x', 'y'))).nodes)
+    executor = VectorizedExecutor(plan)
+    ends = executor.execute(executor.build_columns(payloads), len(payloads))
+    return [executor.response(end) if end is not None else None for end in ends]
+
+
+PAYLOADS = [{'x': 4, 'y': 2}, {'x': 4, 'y': 0}, {'x': 1, 'y': 2}]
+
+
+def test_only_rows_dividing_by_zero_are_undecided():
+    assert run('x / y > 1', PAYLOADS) == ['r0', None, 'last']
+
+
+@pytest.mark.parametrize('expression', [
+    'if y = 0 then false else x / y > 1',
+    'y != 0 and x / y > 1',
+    'y = 0 or x / y > 1',
+])
+def test_divisions_the_row_wise_engine_skips_are_decided(expression):
+    expected = [ConcreteExecutor(FlowPlan(make_flow(
+        chain([expression], number_inputs('x', 'y'))).nodes)).execute(p) for p in PAYLOADS]
+
+    assert run(expression, PAYLOADS) == expected
+
+
+@pytest.mark.parametrize('seed', range(40))
+def test_matches_concrete_executor(seed):
+    plan = FlowPlan(make_flow(random_flow(seed)).nodes)
+    executor = VectorizedExecutor(plan)
+    concrete = ConcreteExecutor(plan)
+
+    rng = random.Random(seed)
+    payloads = [{'x0': rng.choice([0, 1, -3]), 'x1': rng.choice([0, 0.5, 5]),
+                 'x2': rng.choice([0, 7]), 'b0': rng.random() < 0.5} for _ in range(100)]
+    ends = executor.execute(executor.build_columns(payloads), len(payloads))
+
+    for payload, end in zip(payloads, ends):
+        try:
+            expected = concrete.execute(payload)
+        except Exception:
+            # undecided rows are run row-wise, which reports the error
+            assert end is None
+            continue
+
+        assert end is not None and executor.response(end) == expected